@@ -0,0 +1,261 @@
+"""
+Пакетная генерация библиографических списков для множества входных файлов.
+"""
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+import click
+from pydantic import BaseModel
+
+from logger import get_logger
+from pipeline import GenerateOptions, generate
+from settings import CACHE_DIR
+
+logger = get_logger(__name__)
+
+# расширения входных файлов, обрабатываемых при передаче директории
+INPUT_SUFFIXES = (".xlsx", ".csv", ".jsonl")
+
+
+class BatchResult(BaseModel):
+    """
+    Результат обработки одного входного файла.
+    """
+
+    path_input: str
+    path_output: str
+    success: bool
+    entries: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def collect_tasks(path_input: Path | str, path_output: Path | str) -> list[tuple[str, str]]:
+    """
+    Получение списка входных и выходных файлов для пакетной обработки.
+
+    В качестве входных данных принимается директория (обрабатываются все файлы `*.xlsx`, `*.csv` и `*.jsonl`)
+    или файл-манифест, каждая строка которого содержит путь к входному файлу
+    и, через `;`, необязательный путь к выходному файлу:
+
+    .. code-block::
+
+        # комментарий
+        theses/ivanov.xlsx
+        theses/petrov.xlsx;output/petrov-bibliography.docx
+
+    Относительные пути в манифесте отсчитываются от директории манифеста.
+    Если выходной файл не указан, он создается в директории `path_output` с именем входного файла;
+    для входных файлов с одинаковыми именами и разными расширениями (например, `a.xlsx` и `a.csv`)
+    расширение входного файла сохраняется в имени выходного файла (`a.xlsx.docx` и `a.csv.docx`).
+
+    :param path_input: Директория с входными файлами или файл-манифест.
+    :param path_output: Директория для выходных файлов.
+    :return: Список пар (путь к входному файлу, путь к выходному файлу).
+    :raises ValueError: Если несколько входных файлов записываются в один выходной файл.
+    """
+
+    source, target = Path(path_input), Path(path_output)
+
+    pairs: list[tuple[Path, Optional[Path]]] = []
+    if source.is_dir():
+        pairs = [
+            (path, None)
+            for path in sorted(source.iterdir())
+            if path.suffix.lower() in INPUT_SUFFIXES and not path.name.startswith("~$")
+        ]
+    else:
+        for line in source.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            item_input, _, item_output = line.partition(";")
+            pairs.append(
+                (
+                    source.parent / item_input.strip(),
+                    source.parent / item_output.strip() if item_output.strip() else None,
+                )
+            )
+
+    stems = Counter(item_input.stem for item_input, item_output in pairs if item_output is None)
+    tasks = [
+        (
+            str(item_input),
+            str(item_output or target / f"{item_input.name if stems[item_input.stem] > 1 else item_input.stem}.docx"),
+        )
+        for item_input, item_output in pairs
+    ]
+
+    collisions = sorted(path for path, count in Counter(item_output for _, item_output in tasks).items() if count > 1)
+    if collisions:
+        raise ValueError(f"Несколько входных файлов записываются в один выходной файл: {', '.join(collisions)}.")
+
+    return tasks
+
+
+def process_file(path_input: str, path_output: str, options: GenerateOptions) -> BatchResult:
+    """
+    Обработка одного входного файла (выполняется в процессе пула).
+
+    Ошибки обработки не прерывают пакет и возвращаются в результате.
+
+    :param path_input: Путь к входному файлу.
+    :param path_output: Путь к выходному файлу.
+    :param options: Параметры генерации.
+    :return: Результат обработки.
+    """
+
+    started = time.perf_counter()
+    try:
+        Path(path_output).parent.mkdir(parents=True, exist_ok=True)
+        entries = generate(path_input, path_output, options)
+    except Exception as ex:  # pylint: disable=broad-except
+        logger.error("При обработке файла %s возникла ошибка: %s", path_input, ex)
+
+        return BatchResult(
+            path_input=path_input,
+            path_output=path_output,
+            success=False,
+            seconds=time.perf_counter() - started,
+            error=str(ex),
+        )
+
+    return BatchResult(
+        path_input=path_input,
+        path_output=path_output,
+        success=True,
+        entries=entries,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def run_batch(
+    tasks: list[tuple[str, str]], workers: int = 1, options: Optional[GenerateOptions] = None
+) -> list[BatchResult]:
+    """
+    Пакетная обработка входных файлов в пуле процессов.
+
+    Процессы пула обрабатывают файлы один за другим, поэтому импорт модулей и инициализация
+    выполняются один раз на процесс, а не на каждый файл.
+
+    :param tasks: Список пар (путь к входному файлу, путь к выходному файлу).
+    :param workers: Количество процессов (1 – обработка в текущем процессе).
+    :param options: Параметры генерации (`None` – параметры по умолчанию);
+        файлы пакета распределяются по процессам, поэтому каждый файл читается одним процессом.
+    :return: Результаты обработки в порядке входных файлов.
+    """
+
+    options = (options or GenerateOptions()).copy(update={"workers": 1})
+
+    if workers <= 1:
+        return [process_file(path_input, path_output, options) for path_input, path_output in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(process_file, path_input, path_output, options) for path_input, path_output in tasks]
+
+        return [future.result() for future in futures]
+
+
+def summarize(results: list[BatchResult], seconds: float) -> str:
+    """
+    Формирование итоговой сводки пакетной обработки.
+
+    :param results: Результаты обработки файлов.
+    :param seconds: Общее время обработки в секундах.
+    :return: Текст сводки.
+    """
+
+    succeeded = [result for result in results if result.success]
+    entries = sum(result.entries for result in succeeded)
+    files_rate = len(results) / seconds if seconds else 0.0
+    entries_rate = entries / seconds if seconds else 0.0
+
+    return (
+        f"Обработано файлов: {len(results)} (успешно: {len(succeeded)}, с ошибками: {len(results) - len(succeeded)}), "
+        f"источников: {entries}, время: {seconds:.2f} с, "
+        f"скорость: {files_rate:.2f} файлов/с, {entries_rate:.0f} источников/с."
+    )
+
+
+@click.command()
+@click.option(
+    "--path_input",
+    "-pi",
+    "path_input",
+    type=click.Path(exists=True),
+    required=True,
+    help="Директория с входными файлами или файл-манифест",
+)
+@click.option(
+    "--path_output",
+    "-po",
+    "path_output",
+    type=click.Path(file_okay=False),
+    required=True,
+    help="Директория для выходных файлов",
+)
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Количество процессов для обработки файлов",
+)
+@click.option("--streaming", "-s", "streaming", is_flag=True, default=False, help="Потоковое чтение входных файлов")
+@click.option("--trusted", "-t", "trusted", is_flag=True, default=False, help="Доверенный режим создания моделей")
+@click.option("--compact", "compact", is_flag=True, default=False, help="Компактное хранение оформленных источников")
+@click.option(
+    "--cache-dir",
+    "cache_dir",
+    type=str,
+    default=CACHE_DIR or None,
+    show_default=True,
+    help="Директория постоянного кэша оформленных источников (по умолчанию – CACHE_DIR или без кэша); "
+    "кэш ускоряет только стили, оформление в которых дороже получения строки из кэша",
+)
+@click.option("--no-cache", "no_cache", is_flag=True, default=False, help="Форматирование без постоянного кэша")
+def process_batch(path_input: str, path_output: str, workers: int = 1, **options: Any) -> None:
+    """
+    Пакетная генерация файлов Word с оформленными библиографическими списками.
+
+    :param str path_input: Директория с входными файлами или файл-манифест
+    :param str path_output: Директория для выходных файлов
+    :param int workers: Количество процессов для обработки файлов
+    :param options: Параметры генерации (см. `pipeline.GenerateOptions`): потоковое чтение входных файлов,
+        доверенный режим, компактное хранение, директория постоянного кэша и форматирование без кэша
+    """
+
+    if options.pop("no_cache"):
+        options["cache_dir"] = None
+
+    try:
+        tasks = collect_tasks(path_input, path_output)
+    except ValueError as ex:
+        click.echo(str(ex), err=True)
+        raise SystemExit(1) from ex
+
+    logger.info("Пакетная обработка %s файлов в %s процессах ...", len(tasks), workers)
+
+    started = time.perf_counter()
+    results = run_batch(tasks, workers, GenerateOptions(**options))
+    seconds = time.perf_counter() - started
+
+    for result in results:
+        click.echo(
+            f"{'OK' if result.success else 'ERROR'}\t{result.path_input}\t{result.path_output}\t"
+            f"{result.entries}\t{result.seconds:.2f} с" + (f"\t{result.error}" if result.error else "")
+        )
+    click.echo(summarize(results, seconds))
+
+    if not all(result.success for result in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    process_batch()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,14 @@
+"""
+Тесты производительности (бенчмарки).
+
+Запуск отдельного бенчмарка выполняется из директории `src`:
+
+.. code-block::
+
+    python -m benchmarks.bench_decoders --rows 100000
+"""
+
+import logging
+
+# выключение логирования для бенчмарков
+logging.disable()
@@ -0,0 +1,75 @@
+"""
+Сравнение стоимости сортировки оформленных источников: сравнение строк и предвычисленные ключи сортировки.
+"""
+import random
+
+import click
+
+from benchmarks.utils import measure, report
+from formatters.collation import collation_key, normalize
+
+# фамилии для синтетических источников
+SURNAMES = ["Иванов", "ёлкин", "Ежов", "Петров", "Smith", "adams", "Öberg", "Сидоров", "Jones", "Ярцев"]
+
+
+def legacy_sort(items: list[str]) -> list[str]:
+    """
+    Сортировка с вычислением нормализованного текста при каждом сравнении.
+
+    :param items: Оформленные источники.
+    :return: Отсортированные источники.
+    """
+
+    # functools.cmp_to_key вызывает функцию сравнения O(n log n) раз
+    from functools import cmp_to_key  # pylint: disable=import-outside-toplevel
+
+    def compare(left: str, right: str) -> int:
+        left_key, right_key = collation_key(left), collation_key(right)
+
+        return (left_key > right_key) - (left_key < right_key)
+
+    return sorted(items, key=cmp_to_key(compare))
+
+
+@click.command()
+@click.option("--rows", "rows", type=int, default=1_000_000, show_default=True, help="Количество источников")
+@click.option("--repeat", "repeat", type=int, default=3, show_default=True, help="Количество повторов")
+def main(rows: int, repeat: int) -> None:
+    """
+    Запуск бенчмарка сортировки.
+
+    :param int rows: Количество источников
+    :param int repeat: Количество повторов
+    """
+
+    generator = random.Random(0)
+    items = [
+        f"{generator.choice(SURNAMES)} И.М. Наука как искусство {generator.randrange(rows)}. – СПб., 2020."
+        for _ in range(rows)
+    ]
+
+    # результаты обеих реализаций должны совпадать
+    sample = items[:10_000]
+    assert legacy_sort(sample) == sorted(sample, key=collation_key)
+
+    report(
+        "Сортировка оформленных источников",
+        {
+            "str (без правил)": measure(lambda: sorted(items), repeat),
+            "key per compare": measure(lambda: legacy_sort(items), 1),
+            "precomputed key": measure(lambda: sorted(items, key=collation_key), repeat),
+        },
+        rows,
+    )
+    report(
+        "Вычисление ключей сортировки",
+        {
+            "normalize": measure(lambda: [normalize(item) for item in items], repeat),
+            "collation_key": measure(lambda: [collation_key(item) for item in items], repeat),
+        },
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,98 @@
+"""
+Сравнение стоимости форматирования источников: по объектам стиля, по столбцам значений и в пуле процессов.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import click
+
+from benchmarks.utils import measure, report
+from formatters.collation import collation_key
+from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
+from formatters.styles.base import FormatOptions
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+@click.command()
+@click.option("--rows", "rows", type=int, default=100_000, show_default=True, help="Количество источников")
+@click.option("--repeat", "repeat", type=int, default=3, show_default=True, help="Количество повторов")
+@click.option("--workers", "workers", type=int, default=4, show_default=True, help="Количество процессов")
+def main(rows: int, repeat: int, workers: int) -> None:
+    """
+    Запуск бенчмарка форматирования по столбцам.
+
+    :param int rows: Количество источников
+    :param int repeat: Количество повторов
+    :param int workers: Количество процессов
+    """
+
+    samples = [
+        BookModel(
+            authors="Иванов И.М., Петров С.Н.",
+            title="Наука как искусство",
+            edition="3-е",
+            city="СПб.",
+            publishing_house="Просвещение",
+            year=2020,
+            pages=999,
+        ),
+        InternetResourceModel(
+            article="Наука как искусство",
+            website="Ведомости",
+            link="https://www.vedomosti.ru",
+            access_date="01.01.2021",
+        ),
+        ArticlesCollectionModel(
+            authors="Иванов И.М., Петров С.Н.",
+            article_title="Наука как искусство",
+            collection_title="Сборник научных трудов",
+            city="СПб.",
+            publishing_house="АСТ",
+            year=2020,
+            pages="25-30",
+        ),
+    ]
+    models = [samples[index % len(samples)].copy(update={"year": 1900 + index % 120}) for index in range(rows)]
+
+    # результаты обеих реализаций должны совпадать
+    expected = [
+        str(item)
+        for item in GOSTCitationFormatter(
+            models, options=FormatOptions(columns_threshold=0, parallel_threshold=0)
+        ).formatted_items
+    ]
+    assert GOSTCitationFormatter.format_models(models) == expected
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        assert [text for _, text in GOSTCitationFormatter.format_parallel(models, executor)] == expected
+
+    report(
+        "Форматирование источников",
+        {
+            "objects": measure(
+                lambda: GOSTCitationFormatter(
+                    models, compact=True, options=FormatOptions(columns_threshold=0, parallel_threshold=0)
+                ),
+                repeat,
+            ),
+            # строки и ключи сортировки, как и при форматировании по объектам
+            "columns": measure(
+                lambda: [(collation_key(text), text) for text in GOSTCitationFormatter.format_models(models)], repeat
+            ),
+            "columns (compact)": measure(
+                lambda: GOSTCitationFormatter(
+                    models, compact=True, options=FormatOptions(columns_threshold=1, parallel_threshold=0)
+                ),
+                repeat,
+            ),
+            f"parallel ({workers})": measure(
+                lambda: GOSTCitationFormatter(
+                    models, compact=True, options=FormatOptions(parallel_threshold=1, workers=workers)
+                ),
+                repeat,
+            ),
+        },
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
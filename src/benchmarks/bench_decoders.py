@@ -0,0 +1,87 @@
+"""
+Сравнение декодирования строк листа: построчный разбор карты атрибутов и скомпилированный декодер.
+"""
+from datetime import date, datetime
+from typing import Any, Sequence
+
+import click
+
+from benchmarks.utils import measure, report
+from readers.base import BaseReader
+from readers.reader import ArticlesCollectionReader, BookReader, InternetResourceReader
+
+# примеры строк листов для каждого читателя
+SAMPLE_ROWS: dict[type[BaseReader], tuple] = {
+    BookReader: ("Иванов И.М., Петров С.Н.", "Наука как искусство", "3-е", "СПб.", "Просвещение", 2020, 999),
+    InternetResourceReader: ("Наука как искусство", "Ведомости", "https://www.vedomosti.ru", datetime(2021, 1, 1)),
+    ArticlesCollectionReader: (
+        "Иванов И.М., Петров С.Н.",
+        "Наука как искусство",
+        "Сборник научных трудов",
+        "СПб.",
+        "АСТ",
+        2020,
+        "25-30",
+    ),
+}
+
+
+def legacy_decode(reader: BaseReader, row: Sequence[Any]) -> dict:
+    """
+    Декодирование строки с разбором карты атрибутов для каждой ячейки (исходная реализация).
+
+    :param reader: Читатель.
+    :param row: Строка листа.
+    :return: Словарь атрибутов модели.
+    """
+
+    attrs: dict = {}
+    for attr, params in reader.attributes.items():
+        index, data_type = list(params.items())[0]
+        attrs[attr] = row[index] if index < len(row) else None
+
+        if not attrs[attr]:
+            continue
+
+        if data_type is int:
+            attrs[attr] = int(str(attrs.get(attr)))
+
+        if data_type is str:
+            attrs[attr] = str(attrs.get(attr)).strip()
+
+        if data_type is date:
+            value = attrs.get(attr)
+            if isinstance(value, date):
+                attrs[attr] = value.strftime("%d.%m.%Y")
+
+    return attrs
+
+
+@click.command()
+@click.option("--rows", "rows", type=int, default=100_000, show_default=True, help="Количество строк на лист")
+@click.option("--repeat", "repeat", type=int, default=3, show_default=True, help="Количество повторов")
+def main(rows: int, repeat: int) -> None:
+    """
+    Запуск бенчмарка декодеров строк.
+
+    :param int rows: Количество строк на лист
+    :param int repeat: Количество повторов
+    """
+
+    for reader_class, sample in SAMPLE_ROWS.items():
+        reader = reader_class(None)
+        data = [sample] * rows
+        decoder = reader.decoder
+
+        # результаты обеих реализаций должны совпадать
+        assert legacy_decode(reader, sample) == decoder(sample)
+
+        timings = {
+            "legacy": measure(lambda: [legacy_decode(reader, row) for row in data], repeat),  # pylint: disable=W0640
+            "compiled": measure(lambda: [decoder(row) for row in data], repeat),  # pylint: disable=W0640
+        }
+        report(reader_class.__name__, timings, rows)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
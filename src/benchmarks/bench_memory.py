@@ -0,0 +1,89 @@
+"""
+Сравнение пикового потребления памяти при форматировании: объекты стиля и компактные записи.
+"""
+import tracemalloc
+from typing import Callable, Iterator
+
+import click
+from pydantic import BaseModel
+
+from formatters.models import ArticlesCollectionModel, BookModel, InternetResourceModel
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+def generate_models(count: int) -> Iterator[BaseModel]:
+    """
+    Генерация моделей источников (по кругу для каждого типа).
+
+    :param count: Количество моделей.
+    :return: Генератор моделей.
+    """
+
+    for index in range(count):
+        kind = index % 3
+        if kind == 0:
+            yield BookModel.construct(
+                authors="Иванов И.М., Петров С.Н.",
+                title=f"Наука как искусство {index}",
+                edition="3-е",
+                city="СПб.",
+                publishing_house="Просвещение",
+                year=2020,
+                pages=999,
+            )
+        elif kind == 1:
+            yield InternetResourceModel.construct(
+                article=f"Наука как искусство {index}",
+                website="Ведомости",
+                link="https://www.vedomosti.ru",
+                access_date="01.01.2021",
+            )
+        else:
+            yield ArticlesCollectionModel.construct(
+                authors="Иванов И.М., Петров С.Н.",
+                article_title=f"Наука как искусство {index}",
+                collection_title="Сборник научных трудов",
+                city="СПб.",
+                publishing_house="АСТ",
+                year=2020,
+                pages="25-30",
+            )
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """
+    Измерение пикового объема выделенной памяти при выполнении функции.
+
+    :param func: Измеряемая функция без аргументов.
+    :return: Пиковый объем памяти в байтах.
+    """
+
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@click.command()
+@click.option("--rows", "rows", type=int, default=100_000, show_default=True, help="Количество источников")
+def main(rows: int) -> None:
+    """
+    Запуск бенчмарка потребления памяти.
+
+    :param int rows: Количество источников
+    """
+
+    click.echo(f"Пиковое потребление памяти при форматировании ({rows} источников):")
+    for name, compact in (("objects", False), ("compact", True)):
+
+        def format_models(compact: bool = compact) -> None:
+            GOSTCitationFormatter(generate_models(rows), compact=compact).format()
+
+        peak = peak_memory(format_models)
+        click.echo(f"  {name:<24} {peak / 2 ** 20:10.1f} МиБ")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,219 @@
+"""
+Бенчмарки этапов генерации и генерации целиком на синтетических рабочих книгах.
+
+Для каждого количества строк создается рабочая книга по шаблону (см. `benchmarks.workbook`),
+после чего измеряются этапы: чтение (`SourcesReader.read`), форматирование, сортировка,
+генерация выходного файла (`Renderer.render` и `StreamingRenderer.render`) и генерация целиком (`pipeline.generate`).
+Результаты можно сохранить в файл JSON и сравнить с результатами другого коммита:
+
+.. code-block::
+
+    python -m benchmarks.bench_pipeline --rows 1000 --rows 100000 --output before.json
+    python -m benchmarks.bench_pipeline --rows 1000 --rows 100000 --output after.json --compare before.json
+"""
+import json
+import platform
+import subprocess
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import click
+from pydantic import BaseModel
+
+from benchmarks.utils import measure_all, summarize
+from benchmarks.workbook import generate_workbook
+from formatters.enums import CitationEnum
+from formatters.registry import get_formatter
+from pipeline import GenerateOptions, generate
+from readers.reader import SourcesReader
+from renderer import Renderer, StreamingRenderer
+
+# этапы в порядке выполнения
+STAGES = ("read", "format", "sort", "render", "render_streaming", "end_to_end")
+
+
+class BenchmarkConfig(BaseModel):
+    """
+    Параметры запуска бенчмарков этапов генерации.
+    """
+
+    # количество строк каждого листа синтетических рабочих книг
+    rows: tuple[int, ...] = (1000, 10000)
+    # количество повторов каждого этапа
+    repeat: int = 3
+    # стиль цитирования
+    citation: str = CitationEnum.GOST.name
+    # директория для синтетических рабочих книг (`None` – временная директория)
+    directory: Optional[str] = None
+    # путь для сохранения результатов в файл JSON
+    output: Optional[str] = None
+    # путь к файлу JSON с результатами для сравнения
+    compare_path: Optional[str] = None
+
+
+def get_commit() -> Optional[str]:
+    """
+    Получение хэша текущего коммита репозитория.
+
+    :return: Хэш коммита (`None`, если git недоступен).
+    """
+
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    return result.stdout.strip() or None
+
+
+def run_stages(path: Path, citation: str, repeat: int, directory: Path) -> list[dict[str, Any]]:
+    """
+    Измерение этапов генерации для одной рабочей книги.
+
+    Каждый этап получает на вход результат предыдущего этапа, подготовленный заранее,
+    поэтому измеряется только сам этап.
+
+    :param path: Путь к рабочей книге.
+    :param citation: Стиль цитирования.
+    :param repeat: Количество повторов каждого этапа.
+    :param directory: Директория для выходных файлов.
+    :return: Статистика этапов.
+    """
+
+    formatter = get_formatter(citation)
+    models = SourcesReader(str(path)).read()
+    formatted = formatter(models, compact=True)
+    rows = tuple(str(item) for item in formatted.format())
+    output = directory / "output.docx"
+
+    stages: dict[str, Callable[[], Any]] = {
+        "read": lambda: SourcesReader(str(path)).read(),
+        "format": lambda: formatter(models, compact=True),
+        "sort": formatted.format,
+        "render": lambda: Renderer(rows).render(output),
+        "render_streaming": lambda: StreamingRenderer(rows).render(output),
+        "end_to_end": lambda: generate(str(path), output, GenerateOptions(citation=citation, compact=True)),
+    }
+
+    results: list[dict[str, Any]] = []
+    for stage in STAGES:
+        stats = summarize(measure_all(stages[stage], repeat), len(models))
+        results.append({"stage": stage, "items": len(models), **stats})
+        click.echo(
+            f"  {stage:<12} {stats['min']:10.4f} с (среднее {stats['mean']:.4f} ± {stats['stddev']:.4f})"
+            f" {stats['rate']:14.0f} эл./с"
+        )
+
+    return results
+
+
+def compare(results: list[dict[str, Any]], path: str) -> None:
+    """
+    Вывод сравнения с сохраненными результатами (например, предыдущего коммита).
+
+    :param results: Текущие результаты.
+    :param path: Путь к файлу JSON с сохраненными результатами.
+    """
+
+    previous = json.loads(Path(path).read_text(encoding="utf-8"))
+    baseline = {(item["rows"], item["stage"]): item["min"] for item in previous["results"]}
+
+    click.echo(f"Сравнение с {path} (коммит {previous.get('commit') or '–'}):")
+    for item in results:
+        seconds = baseline.get((item["rows"], item["stage"]))
+        if seconds is not None:
+            click.echo(f"  {item['rows']:>9} строк {item['stage']:<12} x{seconds / item['min']:.2f}")
+
+
+@click.command()
+@click.option(
+    "--rows",
+    "rows",
+    type=click.IntRange(min=1),
+    multiple=True,
+    default=(1000, 10000),
+    show_default=True,
+    help="Количество строк каждого листа (можно указать несколько раз)",
+)
+@click.option("--repeat", "repeat", type=int, default=3, show_default=True, help="Количество повторов")
+@click.option(
+    "--citation",
+    "-c",
+    "citation",
+    type=click.Choice([item.name for item in CitationEnum], case_sensitive=False),
+    default=CitationEnum.GOST.name,
+    show_default=True,
+    help="Стиль цитирования",
+)
+@click.option(
+    "--directory",
+    "directory",
+    type=str,
+    default=None,
+    help="Директория для синтетических рабочих книг (созданные ранее книги используются повторно)",
+)
+@click.option("--output", "output", type=str, default=None, help="Путь для сохранения результатов в файл JSON")
+@click.option(
+    "--compare", "compare_path", type=str, default=None, help="Путь к файлу JSON с результатами для сравнения"
+)
+def main(**options: Any) -> None:
+    """
+    Запуск бенчмарков этапов генерации.
+
+    :param options: Параметры запуска (см. `BenchmarkConfig`): количество строк каждого листа, количество повторов,
+        стиль цитирования, директория для синтетических рабочих книг, путь для сохранения результатов
+        и путь к результатам для сравнения
+    """
+
+    config = BenchmarkConfig(**options)
+    results = run(config)
+
+    if config.compare_path:
+        compare(results, config.compare_path)
+
+    if config.output:
+        data = {
+            "commit": get_commit(),
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "citation": config.citation,
+            "repeat": config.repeat,
+            "results": results,
+        }
+        Path(config.output).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        click.echo(f"Результаты сохранены в {config.output}.")
+
+
+def run(config: BenchmarkConfig) -> list[dict[str, Any]]:
+    """
+    Измерение этапов генерации для синтетических рабочих книг с заданным количеством строк.
+
+    :param config: Параметры запуска.
+    :return: Статистика этапов по количествам строк.
+    """
+
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        workbooks = Path(config.directory or temp_dir)
+        workbooks.mkdir(parents=True, exist_ok=True)
+        for count in config.rows:
+            path = workbooks / f"synthetic-{count}.xlsx"
+            if not path.exists():
+                click.echo(f"Создание рабочей книги {path} ...")
+                generate_workbook(path, count)
+
+            click.echo(f"Этапы генерации ({count} строк на лист, стиль {config.citation}):")
+            results.extend(
+                {"rows": count, **item} for item in run_stages(path, config.citation, config.repeat, Path(temp_dir))
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
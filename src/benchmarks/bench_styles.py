@@ -0,0 +1,70 @@
+"""
+Сравнение стоимости форматирования одних и тех же источников в стилях ГОСТ, MLA и APA.
+"""
+import click
+
+from benchmarks.utils import measure, report
+from formatters.enums import CitationEnum
+from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
+from formatters.registry import get_formatter
+from formatters.styles.base import FormatOptions
+
+
+@click.command()
+@click.option("--rows", "rows", type=int, default=100_000, show_default=True, help="Количество источников")
+@click.option("--repeat", "repeat", type=int, default=3, show_default=True, help="Количество повторов")
+def main(rows: int, repeat: int) -> None:
+    """
+    Запуск бенчмарка стилей цитирования.
+
+    :param int rows: Количество источников
+    :param int repeat: Количество повторов
+    """
+
+    samples = [
+        BookModel(
+            authors="Иванов И.М., Петров С.Н.",
+            title="Наука как искусство",
+            edition="3-е",
+            city="СПб.",
+            publishing_house="Просвещение",
+            year=2020,
+            pages=999,
+        ),
+        InternetResourceModel(
+            article="Наука как искусство",
+            website="Ведомости",
+            link="https://www.vedomosti.ru",
+            access_date="01.01.2021",
+        ),
+        ArticlesCollectionModel(
+            authors="Иванов И.М., Петров С.Н.",
+            article_title="Наука как искусство",
+            collection_title="Сборник научных трудов",
+            city="СПб.",
+            publishing_house="АСТ",
+            year=2020,
+            pages="25-30",
+        ),
+    ]
+    models = [samples[index % len(samples)].copy(update={"year": 1900 + index % 120}) for index in range(rows)]
+
+    for columns_threshold, title in ((0, "по объектам"), (1, "по столбцам")):
+        options = FormatOptions(columns_threshold=columns_threshold, parallel_threshold=0)
+        report(
+            f"Форматирование и сортировка источников {title}",
+            {
+                citation.name: measure(
+                    lambda formatter=get_formatter(citation), options=options: formatter(  # type: ignore
+                        models, compact=True, options=options
+                    ).format(),
+                    repeat,
+                )
+                for citation in CitationEnum
+            },
+            rows,
+        )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,74 @@
+"""
+Сравнение стоимости форматирования источника: создание шаблона на каждый источник и скомпилированный шаблон.
+"""
+from string import Template
+
+import click
+
+from benchmarks.utils import measure, report
+from formatters.models import BookModel
+from formatters.styles.base import CompiledTemplate
+from formatters.styles.gost import GOSTBook
+
+# шаблон форматирования книги
+TEMPLATE = "$authors $title. – $edition$city: $publishing_house, $year. – $pages с."
+
+
+class LegacyGOSTBook(GOSTBook):
+    """
+    Форматирование книги с созданием шаблона при каждом обращении (исходная реализация).
+    """
+
+    @property  # type: ignore
+    def template(self) -> Template:
+        return Template(TEMPLATE)
+
+
+@click.command()
+@click.option("--rows", "rows", type=int, default=100_000, show_default=True, help="Количество источников")
+@click.option("--repeat", "repeat", type=int, default=3, show_default=True, help="Количество повторов")
+def main(rows: int, repeat: int) -> None:
+    """
+    Запуск бенчмарка шаблонов форматирования.
+
+    :param int rows: Количество источников
+    :param int repeat: Количество повторов
+    """
+
+    model = BookModel(
+        authors="Иванов И.М., Петров С.Н.",
+        title="Наука как искусство",
+        edition="3-е",
+        city="СПб.",
+        publishing_house="Просвещение",
+        year=2020,
+        pages=999,
+    )
+    values = model.dict()
+    models = [model] * rows
+
+    # результаты обеих реализаций должны совпадать
+    assert LegacyGOSTBook(model).formatted == GOSTBook(model).formatted
+
+    template, compiled = Template(TEMPLATE), CompiledTemplate(TEMPLATE)
+    report(
+        "Подстановка значений в шаблон",
+        {
+            "Template per entry": measure(lambda: [Template(TEMPLATE).substitute(values) for _ in models], repeat),
+            "Template cached": measure(lambda: [template.substitute(values) for _ in models], repeat),
+            "CompiledTemplate": measure(lambda: [compiled.substitute(values) for _ in models], repeat),
+        },
+        rows,
+    )
+    report(
+        "Форматирование книги",
+        {
+            "legacy": measure(lambda: [LegacyGOSTBook(item) for item in models], repeat),
+            "compiled": measure(lambda: [GOSTBook(item) for item in models], repeat),
+        },
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
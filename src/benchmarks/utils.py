@@ -0,0 +1,78 @@
+"""
+Вспомогательные функции для бенчмарков.
+"""
+import statistics
+import time
+from typing import Any, Callable
+
+import click
+
+
+def measure_all(func: Callable[[], Any], repeat: int = 3) -> list[float]:
+    """
+    Измерение времени выполнения функции в нескольких запусках.
+
+    :param func: Измеряемая функция без аргументов.
+    :param repeat: Количество запусков.
+    :return: Время выполнения каждого запуска в секундах.
+    """
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+
+    return timings
+
+
+def measure(func: Callable[[], Any], repeat: int = 3) -> float:
+    """
+    Измерение времени выполнения функции (лучший результат из нескольких запусков).
+
+    :param func: Измеряемая функция без аргументов.
+    :param repeat: Количество запусков.
+    :return: Время выполнения в секундах.
+    """
+
+    return min(measure_all(func, repeat))
+
+
+def summarize(timings: list[float], items: int) -> dict[str, float]:
+    """
+    Получение статистики времени выполнения (как в отчетах pytest-benchmark).
+
+    :param timings: Время выполнения каждого запуска в секундах.
+    :param items: Количество обработанных элементов.
+    :return: Статистика: минимум, максимум, среднее, стандартное отклонение, количество запусков и скорость.
+    """
+
+    best = min(timings)
+
+    return {
+        "min": best,
+        "max": max(timings),
+        "mean": statistics.mean(timings),
+        "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "rounds": len(timings),
+        "rate": items / best if best else float("inf"),
+    }
+
+
+def report(title: str, timings: dict[str, float], items: int) -> None:
+    """
+    Вывод результатов бенчмарка в консоль.
+
+    Первый результат считается базовым, для остальных выводится ускорение относительно него.
+
+    :param title: Заголовок бенчмарка.
+    :param timings: Время выполнения по вариантам реализации (в секундах).
+    :param items: Количество обработанных элементов.
+    """
+
+    click.echo(f"{title} ({items} элементов):")
+    baseline = next(iter(timings.values()), 0.0)
+    for name, seconds in timings.items():
+        rate = items / seconds if seconds else float("inf")
+        speedup = baseline / seconds if seconds else float("inf")
+        click.echo(f"  {name:<24} {seconds:10.4f} с {rate:14.0f} эл./с  x{speedup:.2f}")
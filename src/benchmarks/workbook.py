@@ -0,0 +1,183 @@
+"""
+Генерация синтетических входных файлов для бенчмарков.
+
+Рабочая книга создается по шаблону (`media/template.xlsx`): сохраняются все листы и строки заголовков,
+а листы поддерживаемых типов источников заполняются заданным количеством строк.
+Строки строятся по примерам из шаблона, названия и годы изменяются, чтобы источники не повторялись.
+
+Запуск из директории `src`:
+
+.. code-block::
+
+    python -m benchmarks.workbook --rows 100000 --path ../media/synthetic.xlsx
+"""
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+import click
+import openpyxl
+
+from dedup import TITLE_FIELDS
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+# количество строк: одно значение для всех листов или значения по наименованиям листов
+RowCounts = Union[int, dict[str, int]]
+
+
+def iter_rows(samples: list[tuple], count: int, title_column: Optional[int] = None) -> Iterator[tuple]:
+    """
+    Генерация строк листа по примерам из шаблона.
+
+    Название источника дополняется номером строки, целые числа из диапазона годов и даты смещаются,
+    остальные значения повторяются по кругу.
+
+    :param samples: Строки-примеры листа шаблона.
+    :param count: Количество строк.
+    :param title_column: Индекс столбца с названием источника.
+    :return: Генератор строк.
+    """
+
+    for index in range(count):
+        row = list(samples[index % len(samples)])
+        for column, value in enumerate(row):
+            if column == title_column and isinstance(value, str):
+                row[column] = f"{value} {index + 1}"
+            elif isinstance(value, int) and 1800 < value <= 2100:
+                row[column] = 1900 + index % 125
+            elif isinstance(value, datetime):
+                row[column] = value + timedelta(days=index % 365)
+        yield tuple(row)
+
+
+def get_title_columns() -> dict[str, int]:
+    """
+    Получение индексов столбцов с названиями источников.
+
+    :return: Индексы столбцов по наименованиям листов зарегистрированных читателей.
+    """
+
+    readers = [reader() for reader in SourcesReader.readers]  # type: ignore
+
+    return {
+        reader.sheet: next(iter(reader.attributes[TITLE_FIELDS[reader.model.__name__]]))
+        for reader in readers
+        if reader.model.__name__ in TITLE_FIELDS
+    }
+
+
+def fill_sheet(worksheet: Any, sheet: Any, count: Optional[int], title_column: Optional[int] = None) -> Optional[int]:
+    """
+    Заполнение листа создаваемой рабочей книги по листу шаблона.
+
+    :param worksheet: Лист шаблона.
+    :param sheet: Лист создаваемой рабочей книги.
+    :param count: Количество строк (`None` – копирование строк шаблона без изменений).
+    :param title_column: Индекс столбца с названием источника.
+    :return: Количество записанных строк (`None`, если лист скопирован из шаблона).
+    """
+
+    header, *samples = worksheet.iter_rows(values_only=True)
+    samples = [row for row in samples if row and row[0]]
+    sheet.append(header)
+
+    if count is None or not samples:
+        # листы без читателей копируются из шаблона без изменений
+        for row in samples:
+            sheet.append(row)
+        return None
+
+    for row in iter_rows(samples, count, title_column):
+        sheet.append(row)
+
+    return count
+
+
+def generate_workbook(
+    path: Path | str, rows: RowCounts = 1000, template: str = TEMPLATE_FILE_PATH, sheets: Optional[list[str]] = None
+) -> dict[str, int]:
+    """
+    Создание синтетической рабочей книги по шаблону.
+
+    Книга записывается в режиме `write_only`, поэтому потребление памяти не зависит от количества строк.
+
+    :param path: Путь к создаваемому файлу.
+    :param rows: Количество строк: для каждого заполняемого листа или по наименованиям листов.
+    :param template: Путь к шаблону рабочей книги.
+    :param sheets: Заполняемые листы (по умолчанию – листы зарегистрированных читателей `SourcesReader`).
+    :return: Количество записанных строк по наименованиям листов.
+    """
+
+    title_columns = get_title_columns()
+    if sheets is None:
+        sheets = [reader().sheet for reader in SourcesReader.readers]  # type: ignore
+    counts = rows if isinstance(rows, dict) else {sheet: rows for sheet in sheets}
+
+    source = openpyxl.load_workbook(template, read_only=True)
+    target = openpyxl.Workbook(write_only=True)
+    written: dict[str, int] = {}
+    try:
+        for worksheet in source.worksheets:
+            sheet = target.create_sheet(worksheet.title)
+            count = fill_sheet(worksheet, sheet, counts.get(worksheet.title), title_columns.get(worksheet.title))
+            if count is not None:
+                written[worksheet.title] = count
+    finally:
+        source.close()
+
+    target.save(path)
+
+    return written
+
+
+def parse_rows(value: str) -> RowCounts:
+    """
+    Разбор количества строк из параметра командной строки.
+
+    .. code-block::
+
+        parse_rows("1000")  # 1000
+        parse_rows("Книга=1000000, Интернет-ресурс=1000")  # {"Книга": 1000000, "Интернет-ресурс": 1000}
+
+    :param value: Количество строк или пары `лист=количество` через запятую.
+    :return: Количество строк.
+    """
+
+    if "=" not in value:
+        return int(value)
+
+    counts = {}
+    for item in value.split(","):
+        sheet, _, count = item.partition("=")
+        counts[sheet.strip()] = int(count)
+
+    return counts
+
+
+@click.command()
+@click.option(
+    "--rows",
+    "rows",
+    type=str,
+    default="1000",
+    show_default=True,
+    help="Количество строк каждого листа или пары лист=количество через запятую",
+)
+@click.option("--path", "path", type=str, required=True, help="Путь к создаваемому файлу")
+@click.option("--template", "template", type=str, default=TEMPLATE_FILE_PATH, show_default=True, help="Путь к шаблону")
+def main(rows: str, path: str, template: str) -> None:
+    """
+    Создание синтетической рабочей книги.
+
+    :param str rows: Количество строк
+    :param str path: Путь к создаваемому файлу
+    :param str template: Путь к шаблону
+    """
+
+    written = generate_workbook(path, parse_rows(rows), template)
+    click.echo(f"Рабочая книга {path} создана: {written}.")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,228 @@
+"""
+Удаление повторяющихся источников перед форматированием.
+
+Источники сравниваются по нормализованным значениям полей: без учета регистра, лишних пробелов
+и различия букв «ё» и «е». Точные повторы находятся по хэш-индексу нормализованных значений.
+В режиме поиска почти совпадающих источников названия дополнительно сравниваются
+по MinHash-сигнатурам символьных шинглов с поиском кандидатов через LSH (locality-sensitive hashing):
+остальные поля источника при этом должны совпадать.
+"""
+import hashlib
+import random
+from typing import Iterable, Iterator, Optional
+
+from pydantic import BaseModel
+
+from formatters.collation import normalize
+from formatters.models import ArticlesCollectionModel, BookModel, InternetResourceModel
+from logger import get_logger
+from settings import DEDUP_THRESHOLD
+
+logger = get_logger(__name__)
+
+# поля названий источников, сравниваемые в режиме поиска почти совпадающих источников
+TITLE_FIELDS = {
+    BookModel.__name__: "title",
+    InternetResourceModel.__name__: "article",
+    ArticlesCollectionModel.__name__: "article_title",
+}
+
+# простое число Мерсенна для хэш-функций MinHash
+MERSENNE_PRIME = (1 << 61) - 1
+
+
+def normalize_value(value: object) -> str:
+    """
+    Нормализация значения поля для сравнения.
+
+    :param value: Значение поля модели.
+    :return: Нормализованное значение.
+    """
+
+    if isinstance(value, str):
+        return " ".join(normalize(value).split())
+
+    return str(value)
+
+
+def digest(*values: str) -> bytes:
+    """
+    Получение компактного хэша значений для индекса.
+
+    :param values: Нормализованные значения.
+    :return: Хэш значений.
+    """
+
+    return hashlib.blake2b("\x1f".join(values).encode("utf-8"), digest_size=16).digest()
+
+
+def shingles(text: str, size: int = 3) -> set[str]:
+    """
+    Разбиение текста на символьные шинглы (подстроки фиксированной длины).
+
+    :param text: Нормализованный текст.
+    :param size: Длина шингла.
+    :return: Множество шинглов.
+    """
+
+    if len(text) <= size:
+        return {text}
+
+    return {text[index : index + size] for index in range(len(text) - size + 1)}  # noqa: E203
+
+
+class Duplicate(BaseModel):
+    """
+    Сведения об удаленном повторе источника.
+    """
+
+    # порядковый номер сохраненного источника во входных данных
+    kept: int
+    # порядковый номер удаленного источника во входных данных
+    dropped: int
+    # повтор найден по близости названий (а не по точному совпадению)
+    near: bool = False
+
+
+class Deduplicator:
+    """
+    Удаление повторяющихся источников.
+    """
+
+    # количество хэш-функций MinHash
+    permutations = 64
+    # количество полос LSH (`permutations` должно делиться на `bands`)
+    bands = 16
+    # начальное значение генератора параметров хэш-функций
+    seed = 0
+
+    def __init__(self, near: bool = False, threshold: float = DEDUP_THRESHOLD) -> None:
+        """
+        Конструктор.
+
+        :param near: Поиск почти совпадающих источников по названиям.
+        :param threshold: Минимальная оценка сходства Жаккара названий почти совпадающих источников.
+        """
+
+        if self.permutations % self.bands:
+            raise ValueError("Количество хэш-функций должно делиться на количество полос.")
+
+        self.near = near
+        self.threshold = threshold
+        self.rows = self.permutations // self.bands
+
+        generator = random.Random(self.seed)
+        self.parameters = [
+            (generator.randrange(1, MERSENNE_PRIME), generator.randrange(0, MERSENNE_PRIME))
+            for _ in range(self.permutations)
+        ]
+
+        # индекс точных повторов: хэш нормализованных полей -> номер сохраненного источника
+        self.index: dict[bytes, int] = {}
+        # корзины LSH: (хэш остальных полей, полоса, значения сигнатуры) -> номера сохраненных источников
+        self.buckets: dict[tuple[bytes, int, tuple[int, ...]], list[int]] = {}
+        # MinHash-сигнатуры названий сохраненных источников
+        self.signatures: dict[int, tuple[int, ...]] = {}
+        self.duplicates: list[Duplicate] = []
+
+    def signature(self, text: str) -> tuple[int, ...]:
+        """
+        Вычисление MinHash-сигнатуры текста.
+
+        :param text: Нормализованный текст.
+        :return: Сигнатура текста.
+        """
+
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+            for shingle in shingles(text)
+        ]
+
+        return tuple(min((a * value + b) % MERSENNE_PRIME for value in hashes) for a, b in self.parameters)
+
+    def find_near(self, number: int, rest: bytes, title: str) -> Optional[int]:
+        """
+        Поиск почти совпадающего источника среди сохраненных и регистрация нового источника в корзинах LSH.
+
+        :param number: Порядковый номер источника.
+        :param rest: Хэш нормализованных полей источника, кроме названия.
+        :param title: Нормализованное название источника.
+        :return: Номер почти совпадающего сохраненного источника или `None`.
+        """
+
+        signature = self.signature(title)
+        keys = [
+            (rest, band, signature[band * self.rows : (band + 1) * self.rows])  # noqa: E203
+            for band in range(self.bands)
+        ]
+
+        candidates = {candidate for key in keys for candidate in self.buckets.get(key, ())}
+        for candidate in sorted(candidates):
+            other = self.signatures[candidate]
+            similarity = sum(left == right for left, right in zip(signature, other)) / len(signature)
+            if similarity >= self.threshold:
+                return candidate
+
+        self.signatures[number] = signature
+        for key in keys:
+            self.buckets.setdefault(key, []).append(number)
+
+        return None
+
+    def process(self, models: Iterable[BaseModel]) -> Iterator[BaseModel]:
+        """
+        Удаление повторов из потока моделей.
+
+        Сохраняется первое вхождение каждого источника, порядок источников не меняется.
+        Сведения об удаленных повторах накапливаются в `duplicates`.
+
+        :param models: Прочитанные модели.
+        :return: Генератор моделей без повторов.
+        """
+
+        total = 0
+        for number, model in enumerate(models):
+            total += 1
+            name = type(model).__name__
+            values = {field: normalize_value(getattr(model, field)) for field in model.__fields__}
+
+            key = digest(name, *values.values())
+            kept = self.index.get(key)
+            if kept is not None:
+                self.register(Duplicate(kept=kept, dropped=number), model)
+                continue
+
+            title_field = TITLE_FIELDS.get(name)
+            if self.near and title_field is not None:
+                title = values.pop(title_field)
+                kept = self.find_near(number, digest(name, *values.values()), title)
+                if kept is not None:
+                    self.register(Duplicate(kept=kept, dropped=number, near=True), model)
+                    continue
+
+            self.index[key] = number
+            yield model
+
+        logger.info(
+            "Удаление повторов: обработано %s источников, удалено повторов – %s (почти совпадающих – %s).",
+            total,
+            len(self.duplicates),
+            sum(duplicate.near for duplicate in self.duplicates),
+        )
+
+    def register(self, duplicate: Duplicate, model: BaseModel) -> None:
+        """
+        Регистрация удаленного повтора (общее количество повторов выводится в журнал после обработки).
+
+        :param duplicate: Сведения о повторе.
+        :param model: Модель удаленного источника.
+        """
+
+        self.duplicates.append(duplicate)
+        logger.debug(
+            "Источник №%s (%s) %s источником №%s и исключен из списка.",
+            duplicate.dropped + 1,
+            type(model).__name__,
+            "почти совпадает с" if duplicate.near else "совпадает с",
+            duplicate.kept + 1,
+        )
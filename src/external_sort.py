@@ -0,0 +1,99 @@
+"""
+Внешняя сортировка оформленных источников для списков, не помещающихся в память.
+
+Оформленные источники накапливаются фрагментами фиксированного размера, каждый фрагмент
+сортируется и сбрасывается во временный файл, после чего фрагменты объединяются k-путевым слиянием.
+Одновременно в памяти находится не более одного фрагмента и по одной строке каждого временного файла.
+"""
+import heapq
+import json
+import tempfile
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from formatters.collation import collation_key
+from formatters.styles.base import CitationEntry
+from logger import get_logger
+from settings import SORT_RUN_SIZE, SORT_TEMP_DIR
+
+logger = get_logger(__name__)
+
+
+class ExternalSorter:
+    """
+    Внешняя сортировка оформленных источников.
+    """
+
+    def __init__(self, run_size: int = SORT_RUN_SIZE, directory: Optional[str] = SORT_TEMP_DIR or None) -> None:
+        """
+        Конструктор.
+
+        :param run_size: Количество источников в одном отсортированном фрагменте.
+        :param directory: Директория временных файлов (`None` – системная временная директория).
+        """
+
+        self.run_size = max(run_size, 1)
+        self.directory = directory
+        # количество источников, выданных последней сортировкой
+        self.count = 0
+
+    def sort(self, entries: Iterable[CitationEntry]) -> Iterator[str]:
+        """
+        Сортировка оформленных источников.
+
+        Если все источники поместились в один фрагмент, временные файлы не создаются.
+        Временные файлы удаляются по завершении (или прерывании) обхода генератора.
+
+        :param entries: Оформленные источники в произвольном порядке.
+        :return: Генератор оформленных строк в порядке сортировки.
+        """
+
+        self.count = 0
+        with tempfile.TemporaryDirectory(prefix="citations-", dir=self.directory) as directory:
+            runs: list[Path] = []
+            run: list[CitationEntry] = []
+            for entry in entries:
+                run.append(entry)
+                if len(run) >= self.run_size:
+                    runs.append(self.spill(run, Path(directory) / f"run-{len(runs)}.jsonl"))
+                    run = []
+
+            if not runs:
+                run.sort(key=lambda item: item.sort_key)
+                for item in run:
+                    self.count += 1
+                    yield item.formatted
+                return
+
+            if run:
+                runs.append(self.spill(run, Path(directory) / f"run-{len(runs)}.jsonl"))
+            del run
+
+            logger.info("Слияние %s отсортированных фрагментов ...", len(runs))
+            with ExitStack() as stack:
+                streams = [stack.enter_context(path.open(encoding="utf-8")) for path in runs]
+                for formatted in heapq.merge(*(map(json.loads, stream) for stream in streams), key=collation_key):
+                    self.count += 1
+                    yield formatted
+
+    @staticmethod
+    def spill(run: list[CitationEntry], path: Path) -> Path:
+        """
+        Сортировка фрагмента и запись во временный файл.
+
+        Каждая строка файла – оформленный источник в формате JSON
+        (переносы строк внутри источника экранируются).
+
+        :param run: Фрагмент оформленных источников.
+        :param path: Путь к временному файлу.
+        :return: Путь к временному файлу.
+        """
+
+        run.sort(key=lambda item: item.sort_key)
+        with path.open("w", encoding="utf-8") as stream:
+            stream.writelines(f"{json.dumps(item.formatted, ensure_ascii=False)}\n" for item in run)
+
+        logger.debug("Фрагмент из %s источников записан в %s.", len(run), path)
+
+        return path
@@ -2,7 +2,9 @@
 Базовые функции форматирования списка источников
 """
 
-from formatters.styles.base import BaseCitationStyle
+from typing import Sequence
+
+from formatters.styles.base import CitationEntry
 from logger import get_logger
 
 
@@ -14,7 +16,7 @@ class BaseCitationFormatter:
     Базовый класс для итогового форматирования списка источников.
     """
 
-    def __init__(self, formatted_items: list[BaseCitationStyle]) -> None:
+    def __init__(self, formatted_items: Sequence[CitationEntry]) -> None:
         """
         Конструктор.
 
@@ -23,7 +25,7 @@ class BaseCitationFormatter:
 
         self.formatted_items = formatted_items
 
-    def format(self) -> list[BaseCitationStyle]:
+    def format(self) -> list[CitationEntry]:
         """
         Форматирование списка источников.
 
@@ -32,4 +34,4 @@ class BaseCitationFormatter:
 
         logger.info("Общее форматирование ...")
 
-        return sorted(self.formatted_items, key=lambda item: item.formatted)
+        return sorted(self.formatted_items, key=lambda item: item.sort_key)
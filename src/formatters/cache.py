@@ -0,0 +1,201 @@
+"""
+Постоянный кэш оформленных источников.
+
+Оформленная строка сохраняется по ключу, состоящему из класса стиля цитирования, отпечатка его шаблона
+и отпечатка модели (хэша значений её полей), поэтому повторяющиеся источники
+не форматируются повторно ни в следующих запусках, ни у других пользователей с общим кэшем,
+а после изменения шаблона стиля источники форматируются заново.
+
+Получение строки из кэша требует вычисления отпечатка модели и запроса к SQLite, что дороже заполнения
+шаблонов встроенных стилей по столбцам: кэш выключен по умолчанию и ускоряет форматирование только для стилей,
+оформление источника в которых дороже получения строки из кэша.
+"""
+import hashlib
+import sqlite3
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+from pydantic import BaseModel
+
+from formatters.models import fingerprint
+from logger import get_logger
+from settings import CACHE_FLUSH_SIZE, CACHE_MAX_ENTRIES
+
+logger = get_logger(__name__)
+
+
+def template_fingerprint(style: type) -> str:
+    """
+    Получение отпечатка шаблона стиля цитирования.
+
+    :param style: Класс стиля цитирования.
+    :return: Отпечаток строки шаблона (шестнадцатеричная строка; пустая строка, если шаблон не задан атрибутом класса).
+    """
+
+    source = getattr(getattr(style, "template", None), "template", None)
+
+    return "" if not isinstance(source, str) else text_fingerprint(source)
+
+
+@lru_cache(maxsize=256)
+def text_fingerprint(text: str) -> str:
+    """
+    Получение отпечатка строки (вычисляется один раз для каждой строки).
+
+    :param text: Строка.
+    :return: Отпечаток строки (шестнадцатеричная строка).
+    """
+
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class CitationCache:
+    """
+    Кэш оформленных источников в файле SQLite с вытеснением давно не использованных записей (LRU).
+
+    Записи запрашиваются пакетами (`get_many()`), а обновления времени использования и новые записи
+    накапливаются в памяти и записываются в файл одной транзакцией при накоплении `flush_size` изменений,
+    при вызове `flush()` или `close()`. Время использования обновляется с точностью `access_resolution`,
+    поэтому повторные запуски с теми же источниками не перезаписывают индекс по времени использования.
+    """
+
+    # наименование файла кэша в директории кэша
+    filename = "citations.sqlite3"
+    # количество ключей в одном запросе (не больше ограничения SQLite на количество параметров)
+    batch_size = 500
+    # точность времени использования записей в секундах: недавно использованные записи не обновляются
+    access_resolution = 3600.0
+
+    def __init__(
+        self, directory: Path | str, max_entries: int = CACHE_MAX_ENTRIES, flush_size: int = CACHE_FLUSH_SIZE
+    ) -> None:
+        """
+        Конструктор.
+
+        :param directory: Директория кэша.
+        :param max_entries: Максимальное количество записей в кэше.
+        :param flush_size: Количество накопленных изменений, при котором они записываются в файл.
+        """
+
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self.path = Path(directory) / self.filename
+        self.max_entries = max_entries
+        self.flush_size = max(flush_size, 1)
+        self.hits = 0
+        self.misses = 0
+
+        self.pending: dict[str, str] = {}
+        self.accessed: set[str] = set()
+
+        self.connection = sqlite3.connect(self.path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS citations "
+            "(key TEXT PRIMARY KEY, formatted TEXT NOT NULL, accessed REAL NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS citations_accessed ON citations (accessed)")
+        self.connection.commit()
+
+    @staticmethod
+    def key(style: type, model: BaseModel) -> str:
+        """
+        Получение ключа кэша.
+
+        Ключ включает отпечаток шаблона стиля: строки, оформленные по прежнему шаблону, не используются.
+
+        :param style: Класс стиля цитирования.
+        :param model: Модель источника.
+        :return: Ключ кэша.
+        """
+
+        return f"{style.__module__}.{style.__qualname__}:{template_fingerprint(style)}:{fingerprint(model)}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Получение оформленной строки из кэша.
+
+        :param key: Ключ кэша.
+        :return: Оформленная строка или `None`, если запись отсутствует.
+        """
+
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """
+        Получение оформленных строк из кэша по нескольким ключам (запросами по `batch_size` ключей).
+
+        :param keys: Ключи кэша.
+        :return: Оформленные строки по ключам (отсутствующие в кэше ключи не включаются).
+        """
+
+        keys = list(dict.fromkeys(keys))
+        found = {key: self.pending[key] for key in keys if key in self.pending}
+        missing = [key for key in keys if key not in found]
+        outdated = time.time() - self.access_resolution
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start : start + self.batch_size]  # noqa: E203
+            for key, formatted, accessed in self.connection.execute(
+                f"SELECT key, formatted, accessed FROM citations WHERE key IN ({', '.join('?' * len(batch))})", batch
+            ):
+                found[key] = formatted
+                if accessed <= outdated:
+                    self.accessed.add(key)
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        self.flush_if_full()
+
+        return found
+
+    def set(self, key: str, formatted: str) -> None:
+        """
+        Добавление оформленной строки в кэш.
+
+        :param key: Ключ кэша.
+        :param formatted: Оформленная строка.
+        """
+
+        self.pending[key] = formatted
+        self.flush_if_full()
+
+    def flush_if_full(self) -> None:
+        """
+        Запись накопленных изменений в файл кэша, если их количество достигло `flush_size`.
+        """
+
+        if len(self.pending) + len(self.accessed) >= self.flush_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Запись накопленных изменений в файл кэша и вытеснение давно не использованных записей.
+        """
+
+        accessed = time.time()
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE citations SET accessed = ? WHERE key = ?", ((accessed, key) for key in self.accessed)
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO citations (key, formatted, accessed) VALUES (?, ?, ?)",
+                ((key, formatted, accessed) for key, formatted in self.pending.items()),
+            )
+            self.connection.execute(
+                "DELETE FROM citations WHERE key IN "
+                "(SELECT key FROM citations ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+        self.pending.clear()
+        self.accessed.clear()
+
+    def close(self) -> None:
+        """
+        Запись накопленных изменений и закрытие файла кэша.
+        """
+
+        self.flush()
+        self.connection.close()
+        logger.info("Кэш оформленных источников: попаданий – %s, промахов – %s.", self.hits, self.misses)
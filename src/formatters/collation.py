@@ -0,0 +1,73 @@
+"""
+Сортировка оформленных источников по правилам ГОСТ.
+
+Источники на кириллице располагаются перед источниками на латинице,
+внутри каждой группы – в алфавитном порядке без учета регистра, буквы «ё» и «е» не различаются,
+знаки препинания в начале (например, кавычки вокруг названия) не учитываются.
+Ключ сортировки вычисляется один раз для источника и сравнивается как обычный кортеж.
+"""
+import re
+
+# ключ сортировки: (группа письменности, нормализованный текст, исходный текст)
+SortKey = tuple[int, str, str]
+
+# группы письменности в порядке сортировки
+CYRILLIC, LATIN, OTHER = 0, 1, 2
+
+# первая буква текста (без учета цифр, пробелов и знаков препинания)
+FIRST_LETTER = re.compile(r"[^\W\d_]")
+# знаки препинания и пробелы в начале текста
+LEADING_PUNCTUATION = re.compile(r"^[\W_]+")
+
+
+def get_script(text: str) -> int:
+    """
+    Определение группы письменности текста по первой букве.
+
+    :param text: Текст.
+    :return: Группа письменности (`CYRILLIC`, `LATIN` или `OTHER`).
+    """
+
+    # как правило, текст начинается с буквы, и поиск по регулярному выражению не нужен
+    letter = text[:1]
+    if not letter.isalpha():
+        match = FIRST_LETTER.search(text)
+        if match is None:
+            return OTHER
+        letter = match.group()
+
+    if "Ѐ" <= letter <= "ӿ":
+        return CYRILLIC
+    if letter.isascii() or "À" <= letter <= "ɏ":
+        return LATIN
+
+    return OTHER
+
+
+def normalize(text: str) -> str:
+    """
+    Нормализация текста для сравнения: приведение к нижнему регистру и замена «ё» на «е».
+
+    :param text: Текст.
+    :return: Нормализованный текст.
+    """
+
+    return text.casefold().replace("ё", "е")
+
+
+def collation_key(text: str) -> SortKey:
+    """
+    Получение ключа сортировки текста.
+
+    Исходный текст в конце ключа обеспечивает однозначный порядок строк,
+    различающихся только регистром или буквами «ё» и «е».
+
+    :param text: Текст.
+    :return: Ключ сортировки.
+    """
+
+    normalized = normalize(text)
+    if normalized and not normalized[0].isalnum():
+        normalized = LEADING_PUNCTUATION.sub("", normalized)
+
+    return get_script(text), normalized, text
@@ -0,0 +1,15 @@
+"""
+Перечисления для форматирования списка источников.
+"""
+from enum import Enum, unique
+
+
+@unique
+class CitationEnum(Enum):
+    """
+    Поддерживаемые типы цитирования.
+    """
+
+    GOST = "gost"  # ГОСТ Р 7.0.5-2008
+    MLA = "mla"  # Modern Language Association
+    APA = "apa"  # American Psychological Association
@@ -2,11 +2,28 @@
 Описание схем объектов (DTO).
 """
 
+import hashlib
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
 
+def fingerprint(model: BaseModel) -> str:
+    """
+    Получение отпечатка модели: хэша типа модели и значений её полей.
+
+    Модели с одинаковым содержимым имеют одинаковый отпечаток независимо от процесса и запуска.
+
+    :param model: Модель объекта.
+    :return: Отпечаток модели (шестнадцатеричная строка).
+    """
+
+    # значения полей (строки, числа и даты) имеют одинаковое представление во всех процессах
+    content = f"{type(model).__name__}:{tuple(model.__dict__.values())!r}"
+
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
 class BookModel(BaseModel):
     """
     Модель книги:
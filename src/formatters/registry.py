@@ -0,0 +1,48 @@
+"""
+Реестр стилей цитирования.
+
+Модуль стиля загружается при первом обращении, поэтому добавление стилей
+не увеличивает время запуска приложения и обработки в других стилях.
+"""
+from importlib import import_module
+from typing import Type
+
+from formatters.enums import CitationEnum
+from formatters.styles.base import BaseStyleFormatter
+
+# классы итогового форматирования по стилям цитирования (модуль и наименование класса)
+FORMATTERS: dict[CitationEnum, tuple[str, str]] = {
+    CitationEnum.GOST: ("formatters.styles.gost", "GOSTCitationFormatter"),
+    CitationEnum.MLA: ("formatters.styles.mla", "MLACitationFormatter"),
+    CitationEnum.APA: ("formatters.styles.apa", "APACitationFormatter"),
+}
+
+
+def get_citation(citation: CitationEnum | str) -> CitationEnum:
+    """
+    Получение стиля цитирования по элементу перечисления, его наименованию или значению.
+
+    :param citation: Стиль цитирования (например, `CitationEnum.MLA`, `"MLA"` или `"mla"`).
+    :return: Элемент перечисления стилей цитирования.
+    """
+
+    if isinstance(citation, CitationEnum):
+        return citation
+
+    try:
+        return CitationEnum[citation.upper()]
+    except KeyError:
+        raise ValueError(f'Неизвестный стиль цитирования "{citation}".') from None
+
+
+def get_formatter(citation: CitationEnum | str) -> Type[BaseStyleFormatter]:
+    """
+    Получение класса итогового форматирования списка источников для стиля цитирования.
+
+    :param citation: Стиль цитирования.
+    :return: Класс итогового форматирования.
+    """
+
+    module, name = FORMATTERS[get_citation(citation)]
+
+    return getattr(import_module(module), name)
@@ -0,0 +1,108 @@
+"""
+Стиль цитирования APA (American Psychological Association), 7-е издание.
+"""
+from typing import Any, Mapping, Optional
+
+from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
+from formatters.styles.base import BaseCitationStyle, BaseStyleFormatter, CompiledTemplate
+from logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class APABook(BaseCitationStyle):
+    """
+    Форматирование для книг.
+    """
+
+    data: BookModel
+
+    template = CompiledTemplate("$authors ($year). $title$edition. $publishing_house.")
+
+    def substitute(self) -> str:
+
+        logger.debug('Форматирование книги "%s" ...', self.data.title)
+
+        return self.template.substitute(
+            authors=self.data.authors,
+            year=self.data.year,
+            title=self.data.title,
+            edition=self.format_edition(self.data.edition),
+            publishing_house=self.data.publishing_house,
+        )
+
+    @staticmethod
+    def format_edition(edition: Optional[str]) -> str:
+        """
+        Форматирование информации об издании.
+
+        :param edition: Издание.
+        :return: Информация об издании.
+        """
+
+        return f" ({edition} ed.)" if edition else ""
+
+    @classmethod
+    def format_columns(cls, columns: Mapping[str, list[Any]]) -> list[str]:
+        return cls.template.substitute_columns(
+            {**columns, "edition": [cls.format_edition(edition) for edition in columns["edition"]]}
+        )
+
+
+class APAInternetResource(BaseCitationStyle):
+    """
+    Форматирование для интернет-ресурсов.
+    """
+
+    data: InternetResourceModel
+
+    template = CompiledTemplate("$article. (n.d.). $website. Retrieved $access_date, from $link")
+
+    def substitute(self) -> str:
+
+        logger.debug('Форматирование интернет-ресурса "%s" ...', self.data.article)
+
+        return self.template.substitute(
+            article=self.data.article,
+            website=self.data.website,
+            access_date=self.data.access_date,
+            link=self.data.link,
+        )
+
+
+class APACollectionArticle(BaseCitationStyle):
+    """
+    Форматирование для статьи из сборника.
+    """
+
+    data: ArticlesCollectionModel
+
+    template = CompiledTemplate(
+        "$authors ($year). $article_title. In $collection_title (pp. $pages). $publishing_house."
+    )
+
+    def substitute(self) -> str:
+
+        logger.debug('Форматирование сборника статей "%s" ...', self.data.article_title)
+
+        return self.template.substitute(
+            authors=self.data.authors,
+            year=self.data.year,
+            article_title=self.data.article_title,
+            collection_title=self.data.collection_title,
+            pages=self.data.pages,
+            publishing_house=self.data.publishing_house,
+        )
+
+
+class APACitationFormatter(BaseStyleFormatter):
+    """
+    Итоговое форматирование списка источников по стилю APA.
+    """
+
+    formatters_map = {
+        BookModel.__name__: APABook,
+        InternetResourceModel.__name__: APAInternetResource,
+        ArticlesCollectionModel.__name__: APACollectionArticle,
+    }
@@ -2,20 +2,210 @@
 Базовые методы для форматирования списка источников.
 """
 
+import ast
+import os
 from abc import ABC, abstractmethod
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import cached_property
+from itertools import islice
+from operator import attrgetter
 from string import Template
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence, Sized, Type, Union
 
 from pydantic import BaseModel
 
+from formatters.cache import CitationCache, template_fingerprint, text_fingerprint
+from formatters.collation import SortKey, collation_key
+from logger import ProgressLogger, get_logger
+from settings import FORMAT_CHUNK_SIZE, FORMAT_COLUMNS_THRESHOLD, FORMAT_PARALLEL_THRESHOLD, FORMAT_WORKERS
+
+logger = get_logger(__name__)
+
+
+class CompiledTemplate(Template):
+    """
+    Шаблон, скомпилированный в строку формата.
+
+    Разбор шаблона выполняется один раз при создании объекта,
+    а подстановка значений сводится к вызову `str.format_map()`.
+    Синтаксис шаблона и результат подстановки совпадают с `string.Template`.
+    Для форматирования столбцов значений шаблон дополнительно компилируется в функцию с f-строкой.
+    """
+
+    def __init__(self, template: str) -> None:
+        """
+        Конструктор.
+
+        :param template: Строка шаблона.
+        """
+
+        super().__init__(template)
+        self.parts = self.parse()
+        # наименования подстановок в порядке первого появления в шаблоне
+        self.names = tuple(dict.fromkeys(name for _, name in self.parts if name is not None))
+        self.format_string = self.compile()
+        self.function = self.compile_function()
+
+    def parse(self) -> list[tuple[str, Optional[str]]]:
+        """
+        Разбор шаблона на текст и подстановки.
+
+        :return: Список частей шаблона в виде (текст, наименование подстановки или `None`).
+        """
+
+        parts: list[tuple[str, Optional[str]]] = []
+        position = 0
+        for match in self.pattern.finditer(self.template):
+            literal = self.template[position : match.start()]  # noqa: E203
+
+            name = match.group("named") or match.group("braced")
+            if name is not None:
+                parts.append((literal, name))
+            elif match.group("escaped") is not None:
+                parts.append((literal + self.delimiter, None))
+            else:
+                raise ValueError(f"Invalid placeholder in string: position {match.start('invalid')}")
+
+            position = match.end()
+
+        parts.append((self.template[position:], None))
+
+        return parts
+
+    def compile(self) -> str:
+        """
+        Преобразование шаблона в строку формата для `str.format_map()`.
+
+        :return: Строка формата.
+        """
+
+        # экранирование фигурных скобок в тексте шаблона
+        return "".join(
+            literal.replace("{", "{{").replace("}", "}}") + ("" if name is None else f"{{{name}}}")
+            for literal, name in self.parts
+        )
+
+    def compile_function(self) -> Callable[..., str]:
+        """
+        Преобразование шаблона в функцию, которая принимает значения подстановок позиционно (в порядке `names`)
+        и возвращает заполненный шаблон.
+
+        Функция строится из синтаксического дерева f-строки: текст шаблона передается константами,
+        а наименования подстановок соответствуют шаблону идентификаторов `string.Template`,
+        поэтому исходный код из шаблона не формируется.
+
+        :return: Функция заполнения шаблона.
+        """
+
+        values: list[ast.expr] = []
+        for literal, name in self.parts:
+            if literal:
+                values.append(ast.Constant(value=literal))
+            if name is not None:
+                values.append(ast.FormattedValue(value=ast.Name(id=name, ctx=ast.Load()), conversion=-1))
+
+        arguments = ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg(arg=name) for name in self.names],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[],
+        )
+        expression = ast.fix_missing_locations(
+            ast.Expression(body=ast.Lambda(args=arguments, body=ast.JoinedStr(values=values)))
+        )
+
+        return eval(compile(expression, "<template>", "eval"))  # pylint: disable=eval-used
+
+    def substitute_columns(self, columns: Mapping[str, Iterable[Any]]) -> list[str]:
+        """
+        Заполнение шаблона значениями столбцов (по одной строке на каждый набор значений).
+
+        :param columns: Значения подстановок по наименованиям.
+        :return: Заполненные шаблоны.
+        """
+
+        if not self.names:
+            # шаблон без подстановок: по одной строке на каждое значение любого столбца
+            return [self.function() for _ in next(iter(columns.values()), ())]
+
+        return list(map(self.function, *(columns[name] for name in self.names)))
+
+    def substitute(  # pylint: disable=arguments-differ
+        self, mapping: Optional[Mapping[str, Any]] = None, /, **kws: Any
+    ) -> str:
+        """
+        Заполнение шаблона значениями.
+
+        :param mapping: Словарь значений.
+        :param kws: Значения в виде именованных аргументов.
+        :return: Заполненный шаблон.
+        """
+
+        if mapping is None:
+            mapping = kws
+        elif kws:
+            mapping = ChainMap(kws, dict(mapping))
+
+        return self.format_string.format_map(mapping)
+
+
+class FormattedEntry:
+    """
+    Компактная запись оформленного источника.
+
+    Хранит только ключ сортировки и итоговую строку, без ссылки на исходную модель,
+    поэтому подходит для обработки очень больших списков источников.
+    """
+
+    __slots__ = ("sort_key", "formatted")
+
+    def __init__(self, sort_key: SortKey, formatted: str) -> None:
+        """
+        Конструктор.
+
+        :param sort_key: Ключ сортировки.
+        :param formatted: Оформленная строка.
+        """
+
+        self.sort_key = sort_key
+        self.formatted = formatted
+
+    @classmethod
+    def from_formatted(cls, formatted: str) -> "FormattedEntry":
+        """
+        Создание компактной записи по оформленной строке (например, сохраненной ранее).
+
+        :param formatted: Оформленная строка.
+        :return: Компактная запись.
+        """
+
+        return cls(collation_key(formatted), formatted)
+
+    def __str__(self) -> str:
+        return self.formatted
+
+    def __repr__(self) -> str:
+        return self.formatted
+
 
 class BaseCitationStyle(ABC):
     """
     Абстрактный базовый класс стиля цитирования.
     """
 
-    def __init__(self, data: BaseModel) -> None:
+    def __init__(self, data: BaseModel, formatted: Optional[str] = None) -> None:
+        """
+        Конструктор.
+
+        :param data: Модель источника.
+        :param formatted: Оформленная ранее строка (например, из кэша); если не задана, шаблон заполняется заново.
+        """
+
         self.data = data
-        self.formatted = self.substitute()
+        self.formatted = self.substitute() if formatted is None else formatted
 
     @property
     @abstractmethod
@@ -23,6 +213,9 @@ class BaseCitationStyle(ABC):
         """
         Получение шаблона для форматирования строки.
 
+        Шаблон рекомендуется объявлять атрибутом класса (`CompiledTemplate`),
+        чтобы он компилировался один раз, а не при форматировании каждого источника.
+
         :return:
         """
 
@@ -34,8 +227,399 @@ class BaseCitationStyle(ABC):
         :return:
         """
 
+    @classmethod
+    def format_columns(cls, columns: Mapping[str, list[Any]]) -> list[str]:
+        """
+        Форматирование источников по столбцам значений атрибутов моделей (без создания объектов стиля).
+
+        Результат совпадает с форматированием каждого источника отдельно (`substitute()`).
+        Стили, которые преобразуют значения перед подстановкой, переопределяют метод.
+
+        :param columns: Значения атрибутов моделей по наименованиям.
+        :return: Оформленные строки в порядке значений столбцов.
+        """
+
+        template = getattr(cls, "template")
+        if not isinstance(template, CompiledTemplate):
+            raise TypeError(f"Стиль {cls.__name__} не поддерживает форматирование по столбцам.")
+
+        return template.substitute_columns(columns)
+
+    @cached_property
+    def sort_key(self) -> SortKey:
+        """
+        Получение ключа сортировки (вычисляется один раз).
+
+        :return:
+        """
+
+        return collation_key(self.formatted)
+
+    def compact(self) -> FormattedEntry:
+        """
+        Получение компактной записи без ссылки на исходную модель.
+
+        :return:
+        """
+
+        return FormattedEntry(self.sort_key, self.formatted)
+
     def __str__(self) -> str:
         return self.formatted
 
     def __repr__(self) -> str:
         return self.formatted
+
+
+# оформленный источник: полный объект стиля или компактная запись
+CitationEntry = Union[BaseCitationStyle, FormattedEntry]
+
+
+class FormatOptions(BaseModel):
+    """
+    Параметры итогового форматирования списка источников.
+    """
+
+    # количество источников, начиная с которого форматирование выполняется по столбцам (0 – всегда по объектам)
+    columns_threshold: int = FORMAT_COLUMNS_THRESHOLD
+    # количество источников, начиная с которого форматирование выполняется по столбцам в пуле процессов (0 – без пула)
+    parallel_threshold: int = FORMAT_PARALLEL_THRESHOLD
+    # количество процессов для параллельного форматирования (0 – по количеству процессоров, не больше их количества)
+    workers: int = FORMAT_WORKERS
+    # количество источников в одном задании пула процессов
+    chunk_size: int = FORMAT_CHUNK_SIZE
+
+
+class BaseStyleFormatter:
+    """
+    Базовый класс для итогового форматирования списка источников в стиле цитирования.
+
+    Стиль цитирования задает соответствие типов моделей и классов форматирования (`formatters_map`).
+    """
+
+    # классы форматирования по наименованиям типов моделей
+    formatters_map: dict[str, Type[BaseCitationStyle]] = {}
+    # количество источников, форматируемых по столбцам за один раз (модели других частей не хранятся)
+    batch_size = 1000
+
+    def __init__(
+        self,
+        models: Iterable[BaseModel],
+        compact: bool = False,
+        cache: Optional[CitationCache] = None,
+        options: Optional[FormatOptions] = None,
+    ) -> None:
+        """
+        Конструктор.
+
+        Если кэш задан, оформленные строки сначала запрашиваются из кэша,
+        а по столбцам (в том числе в пуле процессов) форматируются только отсутствующие в кэше источники.
+
+        :param models: Список объектов для форматирования
+        :param compact: Хранение компактных записей (ключ сортировки и строка) вместо объектов стиля
+            с исходными моделями; модели освобождаются сразу после форматирования
+        :param cache: Постоянный кэш оформленных источников
+        :param options: Параметры форматирования (`None` – параметры по умолчанию)
+        """
+
+        options = options or FormatOptions()
+        if options.columns_threshold <= 0 and options.parallel_threshold <= 0:
+            self.formatted_items = list(self.iter_items(models, compact, cache))
+            return
+
+        self.formatted_items = list(self.iter_batches(models, options, compact, cache))
+
+    @classmethod
+    def templates_fingerprint(cls) -> str:
+        """
+        Получение отпечатка шаблонов всех классов форматирования стиля цитирования.
+
+        :return: Отпечаток шаблонов (шестнадцатеричная строка).
+        """
+
+        return text_fingerprint(
+            ";".join(f"{name}:{template_fingerprint(style)}" for name, style in sorted(cls.formatters_map.items()))
+        )
+
+    @classmethod
+    def iter_batches(
+        cls,
+        models: Iterable[BaseModel],
+        options: FormatOptions,
+        compact: bool = False,
+        cache: Optional[CitationCache] = None,
+    ) -> Iterator[CitationEntry]:
+        """
+        Форматирование источников частями по `batch_size` моделей (см. `format_pairs()` и `format_cached()`).
+
+        При компактном хранении в памяти находятся только модели текущей части. Способ форматирования
+        выбирается по количеству источников: длине списка или, для генератора, количеству прочитанных моделей.
+        Для форматирования в пуле процессов пул создается один раз, а части увеличиваются до `chunk_size`
+        источников на процесс.
+
+        :param models: Объекты для форматирования
+        :param options: Параметры форматирования
+        :param compact: Компактные записи вместо объектов стиля
+        :param cache: Постоянный кэш оформленных источников
+        :return: Генератор оформленных источников в порядке моделей.
+        """
+
+        total = len(models) if isinstance(models, Sized) else None
+        # количество процессов не больше количества процессоров: на одном процессоре пул только замедляет форматирование
+        workers = min(options.workers or os.cpu_count() or 1, os.cpu_count() or 1)
+        count = 0
+        iterator = iter(models)
+        with ExitStack() as stack:
+            executor: Optional[ProcessPoolExecutor] = None
+            while batch := list(islice(iterator, cls.batch_size if executor is None else workers * options.chunk_size)):
+                count += len(batch)
+                if executor is None and 0 < options.parallel_threshold <= (total or count) and workers > 1:
+                    logger.info("Параллельное форматирование по столбцам в %s процессах ...", workers)
+                    executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+
+                pairs = (
+                    cls.format_pairs(batch, options, total or count, executor)
+                    if cache is None
+                    else cls.format_cached(batch, cache, options, executor)
+                )
+                yield from cls.collect(batch, pairs, compact)
+
+    @classmethod
+    def collect(
+        cls, models: Sequence[BaseModel], pairs: Sequence[tuple[SortKey, str]], compact: bool = False
+    ) -> list[CitationEntry]:
+        """
+        Получение оформленных источников по строкам, оформленным по столбцам.
+
+        :param models: Отформатированные объекты
+        :param pairs: Ключи сортировки и оформленные строки в порядке моделей
+        :param compact: Компактные записи вместо объектов стиля
+        :return: Оформленные источники в порядке моделей.
+        """
+
+        if compact:
+            return [FormattedEntry(key, text) for key, text in pairs]
+
+        items: list[CitationEntry] = []
+        for model, (key, text) in zip(models, pairs):
+            item = cls.formatters_map[type(model).__name__](model, text)
+            # ключ сортировки уже вычислен и повторно не вычисляется
+            item.sort_key = key
+            items.append(item)
+
+        return items
+
+    @classmethod
+    def format_models(cls, models: Sequence[BaseModel]) -> list[str]:
+        """
+        Форматирование источников по столбцам (см. `BaseCitationStyle.format_columns()`).
+
+        Модели группируются по типам, значения атрибутов каждой группы собираются в столбцы
+        и форматируются стилем группы за один проход.
+
+        :param models: Объекты для форматирования
+        :return: Оформленные строки в порядке моделей.
+        """
+
+        logger.info("Форматирование %s источников по столбцам ...", len(models))
+
+        groups: dict[Type[BaseModel], list[int]] = {}
+        for index, model in enumerate(models):
+            groups.setdefault(type(model), []).append(index)
+
+        formatted = [""] * len(models)
+        for model_type, indices in groups.items():
+            group = [models[index] for index in indices]
+            columns = {field: list(map(attrgetter(field), group)) for field in model_type.__fields__}
+            style = cls.formatters_map[model_type.__name__]
+            for index, text in zip(indices, style.format_columns(columns)):
+                formatted[index] = text
+
+        return formatted
+
+    @classmethod
+    def format_pairs(
+        cls,
+        models: Sequence[BaseModel],
+        options: FormatOptions,
+        count: Optional[int] = None,
+        executor: Optional[ProcessPoolExecutor] = None,
+    ) -> list[tuple[SortKey, str]]:
+        """
+        Форматирование источников по столбцам в пуле процессов (если пул задан),
+        по столбцам (начиная с `columns_threshold` источников) или по объектам.
+
+        :param models: Объекты для форматирования
+        :param options: Параметры форматирования
+        :param count: Количество источников для выбора способа форматирования (по умолчанию – количество моделей)
+        :param executor: Пул процессов для форматирования по столбцам
+        :return: Ключи сортировки и оформленные строки в порядке моделей.
+        """
+
+        count = len(models) if count is None else count
+        if executor is not None:
+            return cls.format_parallel(models, executor, options.chunk_size)
+
+        if 0 < options.columns_threshold <= count:
+            texts = cls.format_models(models)
+        else:
+            texts = [cls.formatters_map[type(model).__name__](model).formatted for model in models]
+
+        return [(collation_key(text), text) for text in texts]
+
+    @classmethod
+    def format_cached(
+        cls,
+        models: Sequence[BaseModel],
+        cache: CitationCache,
+        options: FormatOptions,
+        executor: Optional[ProcessPoolExecutor] = None,
+    ) -> list[tuple[SortKey, str]]:
+        """
+        Форматирование источников с постоянным кэшем.
+
+        Оформленные строки запрашиваются из кэша пакетами, а отсутствующие в кэше источники
+        форматируются вместе (см. `format_pairs()`) и добавляются в кэш.
+
+        :param models: Объекты для форматирования
+        :param cache: Постоянный кэш оформленных источников
+        :param options: Параметры форматирования
+        :param executor: Пул процессов для форматирования по столбцам
+        :return: Ключи сортировки и оформленные строки в порядке моделей.
+        """
+
+        keys = [cache.key(cls.formatters_map[type(model).__name__], model) for model in models]
+        found = cache.get_many(keys)
+
+        pairs: list[tuple[SortKey, str]] = [
+            ((0, "", ""), "") if text is None else (collation_key(text), text) for text in map(found.get, keys)
+        ]
+        misses = [index for index, key in enumerate(keys) if key not in found]
+        if misses:
+            logger.info("Источников в кэше: %s, форматирование остальных: %s ...", len(keys) - len(misses), len(misses))
+        for index, pair in zip(
+            misses, cls.format_pairs([models[index] for index in misses], options, executor=executor)
+        ):
+            pairs[index] = pair
+            cache.set(keys[index], pair[1])
+
+        return pairs
+
+    @classmethod
+    def format_parallel(
+        cls, models: Sequence[BaseModel], executor: ProcessPoolExecutor, chunk_size: int = FORMAT_CHUNK_SIZE
+    ) -> list[tuple[SortKey, str]]:
+        """
+        Форматирование источников по столбцам в пуле процессов.
+
+        Модели группируются по типам, группы делятся на части по `chunk_size` источников.
+        В дочерние процессы передаются только кортежи значений полей моделей (без объектов pydantic),
+        а возвращаются ключи сортировки и оформленные строки.
+
+        :param models: Объекты для форматирования
+        :param executor: Пул процессов (один на все части списка источников)
+        :param chunk_size: Количество источников в одной части
+        :return: Ключи сортировки и оформленные строки в порядке моделей.
+        """
+
+        pairs: list[tuple[SortKey, str]] = [((0, "", ""), "")] * len(models)
+        futures = [
+            (indices, executor.submit(format_chunk, cls, model_name, fields, rows))
+            for indices, model_name, fields, rows in cls.iter_chunks(models, chunk_size)
+        ]
+        for indices, future in futures:
+            for index, pair in zip(indices, future.result()):
+                pairs[index] = pair
+
+        return pairs
+
+    @staticmethod
+    def iter_chunks(
+        models: Sequence[BaseModel], chunk_size: int
+    ) -> Iterator[tuple[list[int], str, tuple[str, ...], list[tuple]]]:
+        """
+        Разбиение источников на части одного типа для форматирования в дочерних процессах.
+
+        :param models: Объекты для форматирования
+        :param chunk_size: Количество источников в одной части
+        :return: Генератор частей в виде (индексы моделей, наименование типа моделей, наименования полей,
+            кортежи значений полей).
+        """
+
+        groups: dict[Type[BaseModel], list[int]] = {}
+        for index, model in enumerate(models):
+            groups.setdefault(type(model), []).append(index)
+
+        chunk_size = max(chunk_size, 1)
+        for model_type, indices in groups.items():
+            fields = tuple(model_type.__fields__)
+            getter = attrgetter(*fields)
+            for start in range(0, len(indices), chunk_size):
+                chunk = indices[start : start + chunk_size]  # noqa: E203
+                yield chunk, model_type.__name__, fields, [getter(models[index]) for index in chunk]
+
+    @classmethod
+    def iter_items(
+        cls,
+        models: Iterable[BaseModel],
+        compact: bool = False,
+        cache: Optional[CitationCache] = None,
+    ) -> Iterator[CitationEntry]:
+        """
+        Потоковое форматирование источников (без сортировки).
+
+        :param models: Объекты для форматирования
+        :param compact: Компактные записи вместо объектов стиля
+        :param cache: Постоянный кэш оформленных источников
+        :return: Генератор оформленных источников в порядке моделей.
+        """
+
+        progress = ProgressLogger(logger, "Форматирование источников")
+        if cache is None:
+            for model in models:
+                item = cls.formatters_map[type(model).__name__](model)
+                yield item.compact() if compact else item
+                progress.advance()
+        else:
+            iterator = iter(models)
+            # ключи запрашиваются из кэша пакетами
+            while batch := list(islice(iterator, cache.batch_size)):
+                styles = [cls.formatters_map[type(model).__name__] for model in batch]
+                keys = [cache.key(style, model) for style, model in zip(styles, batch)]
+                found = cache.get_many(keys)
+                for style, model, key in zip(styles, batch, keys):
+                    formatted = found.get(key)
+                    item = style(model, formatted)
+                    if formatted is None:
+                        cache.set(key, item.formatted)
+                    yield item.compact() if compact else item
+                    progress.advance()
+
+        progress.finish()
+
+    def format(self) -> list[CitationEntry]:
+        """
+        Форматирование списка источников.
+
+        :return:
+        """
+
+        return sorted(self.formatted_items, key=lambda item: item.sort_key)
+
+
+def format_chunk(
+    formatter: Type[BaseStyleFormatter], model_name: str, fields: tuple[str, ...], rows: list[tuple]
+) -> list[tuple[SortKey, str]]:
+    """
+    Форматирование части источников одного типа по столбцам в дочернем процессе.
+
+    :param formatter: Класс итогового форматирования стиля цитирования.
+    :param model_name: Наименование типа моделей.
+    :param fields: Наименования полей модели.
+    :param rows: Кортежи значений полей моделей.
+    :return: Ключи сортировки и оформленные строки в порядке строк.
+    """
+
+    columns = {field: list(values) for field, values in zip(fields, zip(*rows))}
+
+    return [(collation_key(text), text) for text in formatter.formatters_map[model_name].format_columns(columns)]
@@ -1,12 +1,10 @@
 """
 Стиль цитирования по ГОСТ Р 7.0.5-2008.
 """
-from string import Template
-
-from pydantic import BaseModel
+from typing import Any, Mapping, Optional
 
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
-from formatters.styles.base import BaseCitationStyle
+from formatters.styles.base import BaseCitationStyle, BaseStyleFormatter, CompiledTemplate
 from logger import get_logger
 
 
@@ -20,15 +18,11 @@ class GOSTBook(BaseCitationStyle):
 
     data: BookModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors $title. – $edition$city: $publishing_house, $year. – $pages с."
-        )
+    template = CompiledTemplate("$authors $title. – $edition$city: $publishing_house, $year. – $pages с.")
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование книги "%s" ...', self.data.title)
+        logger.debug('Форматирование книги "%s" ...', self.data.title)
 
         return self.template.substitute(
             authors=self.data.authors,
@@ -47,7 +41,24 @@ class GOSTBook(BaseCitationStyle):
         :return: Информация об издательстве.
         """
 
-        return f"{self.data.edition} изд. – " if self.data.edition else ""
+        return self.format_edition(self.data.edition)
+
+    @staticmethod
+    def format_edition(edition: Optional[str]) -> str:
+        """
+        Форматирование информации об издательстве.
+
+        :param edition: Издание.
+        :return: Информация об издательстве.
+        """
+
+        return f"{edition} изд. – " if edition else ""
+
+    @classmethod
+    def format_columns(cls, columns: Mapping[str, list[Any]]) -> list[str]:
+        return cls.template.substitute_columns(
+            {**columns, "edition": [cls.format_edition(edition) for edition in columns["edition"]]}
+        )
 
 
 class GOSTInternetResource(BaseCitationStyle):
@@ -57,15 +68,11 @@ class GOSTInternetResource(BaseCitationStyle):
 
     data: InternetResourceModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$article // $website URL: $link (дата обращения: $access_date)."
-        )
+    template = CompiledTemplate("$article // $website URL: $link (дата обращения: $access_date).")
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование интернет-ресурса "%s" ...', self.data.article)
+        logger.debug('Форматирование интернет-ресурса "%s" ...', self.data.article)
 
         return self.template.substitute(
             article=self.data.article,
@@ -82,15 +89,13 @@ class GOSTCollectionArticle(BaseCitationStyle):
 
     data: ArticlesCollectionModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors $article_title // $collection_title. – $city: $publishing_house, $year. – С. $pages."
-        )
+    template = CompiledTemplate(
+        "$authors $article_title // $collection_title. – $city: $publishing_house, $year. – С. $pages."
+    )
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование сборника статей "%s" ...', self.data.article_title)
+        logger.debug('Форматирование сборника статей "%s" ...', self.data.article_title)
 
         return self.template.substitute(
             authors=self.data.authors,
@@ -103,9 +108,9 @@ class GOSTCollectionArticle(BaseCitationStyle):
         )
 
 
-class GOSTCitationFormatter:
+class GOSTCitationFormatter(BaseStyleFormatter):
     """
-    Базовый класс для итогового форматирования списка источников.
+    Итоговое форматирование списка источников по ГОСТ Р 7.0.5-2008.
     """
 
     formatters_map = {
@@ -113,25 +118,3 @@ class GOSTCitationFormatter:
         InternetResourceModel.__name__: GOSTInternetResource,
         ArticlesCollectionModel.__name__: GOSTCollectionArticle,
     }
-
-    def __init__(self, models: list[BaseModel]) -> None:
-        """
-        Конструктор.
-
-        :param models: Список объектов для форматирования
-        """
-
-        formatted_items = []
-        for model in models:
-            formatted_items.append(self.formatters_map.get(type(model).__name__)(model))  # type: ignore
-
-        self.formatted_items = formatted_items
-
-    def format(self) -> list[BaseCitationStyle]:
-        """
-        Форматирование списка источников.
-
-        :return:
-        """
-
-        return sorted(self.formatted_items, key=lambda item: item.formatted)
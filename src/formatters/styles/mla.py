@@ -0,0 +1,106 @@
+"""
+Стиль цитирования MLA (Modern Language Association), 9-е издание.
+"""
+from typing import Any, Mapping, Optional
+
+from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
+from formatters.styles.base import BaseCitationStyle, BaseStyleFormatter, CompiledTemplate
+from logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class MLABook(BaseCitationStyle):
+    """
+    Форматирование для книг.
+    """
+
+    data: BookModel
+
+    template = CompiledTemplate("$authors $title. $edition$publishing_house, $year.")
+
+    def substitute(self) -> str:
+
+        logger.debug('Форматирование книги "%s" ...', self.data.title)
+
+        return self.template.substitute(
+            authors=self.data.authors,
+            title=self.data.title,
+            edition=self.format_edition(self.data.edition),
+            publishing_house=self.data.publishing_house,
+            year=self.data.year,
+        )
+
+    @staticmethod
+    def format_edition(edition: Optional[str]) -> str:
+        """
+        Форматирование информации об издании.
+
+        :param edition: Издание.
+        :return: Информация об издании.
+        """
+
+        return f"{edition} ed., " if edition else ""
+
+    @classmethod
+    def format_columns(cls, columns: Mapping[str, list[Any]]) -> list[str]:
+        return cls.template.substitute_columns(
+            {**columns, "edition": [cls.format_edition(edition) for edition in columns["edition"]]}
+        )
+
+
+class MLAInternetResource(BaseCitationStyle):
+    """
+    Форматирование для интернет-ресурсов.
+    """
+
+    data: InternetResourceModel
+
+    template = CompiledTemplate('"$article." $website, $link. Accessed $access_date.')
+
+    def substitute(self) -> str:
+
+        logger.debug('Форматирование интернет-ресурса "%s" ...', self.data.article)
+
+        return self.template.substitute(
+            article=self.data.article,
+            website=self.data.website,
+            link=self.data.link,
+            access_date=self.data.access_date,
+        )
+
+
+class MLACollectionArticle(BaseCitationStyle):
+    """
+    Форматирование для статьи из сборника.
+    """
+
+    data: ArticlesCollectionModel
+
+    template = CompiledTemplate('$authors "$article_title." $collection_title, $publishing_house, $year, pp. $pages.')
+
+    def substitute(self) -> str:
+
+        logger.debug('Форматирование сборника статей "%s" ...', self.data.article_title)
+
+        return self.template.substitute(
+            authors=self.data.authors,
+            article_title=self.data.article_title,
+            collection_title=self.data.collection_title,
+            publishing_house=self.data.publishing_house,
+            year=self.data.year,
+            pages=self.data.pages,
+        )
+
+
+class MLACitationFormatter(BaseStyleFormatter):
+    """
+    Итоговое форматирование списка источников по стилю MLA.
+    """
+
+    formatters_map = {
+        BookModel.__name__: MLABook,
+        InternetResourceModel.__name__: MLAInternetResource,
+        ArticlesCollectionModel.__name__: MLACollectionArticle,
+    }
@@ -0,0 +1,217 @@
+"""
+Инкрементальная генерация: повторное форматирование только измененных источников.
+
+Для каждого источника вычисляется отпечаток (хэш прочитанных атрибутов модели).
+Отпечатки и оформленные строки в порядке сортировки сохраняются в файл-манифест
+рядом с выходным файлом вместе с хэшем выходного файла и отпечатком шаблонов стиля цитирования.
+При повторном запуске оформленные строки неизмененных источников берутся из манифеста,
+а новые источники форматируются и вставляются в отсортированный список. После изменения шаблонов стиля
+все источники форматируются заново.
+"""
+import hashlib
+import heapq
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Optional, Type
+
+from pydantic import BaseModel
+
+from formatters.cache import CitationCache
+from formatters.models import fingerprint
+from formatters.registry import get_formatter
+from formatters.styles.base import BaseStyleFormatter, CitationEntry, FormattedEntry
+from formatters.styles.gost import GOSTCitationFormatter
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# оформленный источник в манифесте: (отпечаток модели, оформленная строка)
+ManifestEntry = tuple[str, str]
+
+
+def hash_file(path: Path | str) -> Optional[str]:
+    """
+    Получение хэша содержимого файла.
+
+    :param path: Путь к файлу.
+    :return: Хэш (шестнадцатеричная строка; `None`, если файл не существует).
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(2**20), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+
+    return digest.hexdigest()
+
+
+class Manifest:
+    """
+    Файл-манифест результата генерации.
+    """
+
+    # версия формата манифеста (при изменении формата или отпечатков моделей старые манифесты не используются)
+    version = 5
+
+    def __init__(self, path_output: Path | str, citation: str) -> None:
+        """
+        Конструктор.
+
+        :param path_output: Путь к выходному файлу.
+        :param citation: Стиль цитирования.
+        """
+
+        self.path_output = Path(path_output)
+        self.path = Path(f"{path_output}.manifest.json")
+        self.citation = citation
+        # отпечаток шаблонов стиля цитирования, по которым оформлены строки манифеста
+        self.templates = get_formatter(citation).templates_fingerprint()
+        # хэш выходного файла, созданного при сохранении манифеста
+        self.output_hash: Optional[str] = None
+
+    def load(self) -> list[ManifestEntry]:
+        """
+        Чтение оформленных источников предыдущего запуска.
+
+        Манифест другого стиля цитирования, другой версии, с другими шаблонами стиля
+        или поврежденный манифест не используется.
+
+        :return: Оформленные источники в порядке сортировки.
+        """
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+
+        if (
+            data.get("version") != self.version
+            or data.get("citation") != self.citation
+            or data.get("templates") != self.templates
+        ):
+            return []
+
+        self.output_hash = data.get("output")
+
+        return [(entry[0], entry[1]) for entry in data.get("entries", [])]
+
+    def is_output_current(self) -> bool:
+        """
+        Проверка, что выходной файл не изменился после сохранения манифеста.
+
+        Выходной файл мог быть удален или перезаписан другим запуском (например, обычной генерацией
+        в тот же файл), тогда по неизмененному манифесту файл создается заново.
+
+        :return: Признак соответствия выходного файла манифесту.
+        """
+
+        return self.output_hash is not None and self.output_hash == hash_file(self.path_output)
+
+    def save(self, entries: list[ManifestEntry]) -> None:
+        """
+        Сохранение оформленных источников (после создания выходного файла).
+
+        :param entries: Оформленные источники в порядке сортировки.
+        """
+
+        self.output_hash = hash_file(self.path_output)
+        data = {
+            "version": self.version,
+            "citation": self.citation,
+            "templates": self.templates,
+            "output": self.output_hash,
+            "entries": entries,
+        }
+        self.path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def update_entries(
+    models: Iterable[BaseModel],
+    previous: list[ManifestEntry],
+    cache: Optional[CitationCache] = None,
+    formatter: Type[BaseStyleFormatter] = GOSTCitationFormatter,
+) -> tuple[list[ManifestEntry], bool]:
+    """
+    Обновление оформленных источников предыдущего запуска.
+
+    Источники, отпечатки которых есть в предыдущем результате, не форматируются повторно;
+    удаленные источники исключаются, новые и измененные – форматируются и вставляются
+    в отсортированный список слиянием.
+
+    :param models: Прочитанные модели.
+    :param previous: Оформленные источники предыдущего запуска в порядке сортировки.
+    :param cache: Постоянный кэш оформленных источников.
+    :param formatter: Класс итогового форматирования стиля цитирования.
+    :return: Оформленные источники в порядке сортировки и признак наличия изменений.
+    """
+
+    models = list(models)
+    kept, changed_models, changed_fingerprints = split_changed(models, previous)
+
+    logger.info(
+        "Инкрементальная генерация: без изменений – %s, новых или измененных – %s, удаленных – %s.",
+        len(kept),
+        len(changed_models),
+        len(previous) - len(kept),
+    )
+
+    if not changed_models:
+        return kept, len(kept) != len(previous)
+
+    formatted_items = formatter(changed_models, compact=True, cache=cache).formatted_items
+
+    return merge_entries(kept, list(zip(changed_fingerprints, formatted_items))), True
+
+
+def split_changed(
+    models: list[BaseModel], previous: list[ManifestEntry]
+) -> tuple[list[ManifestEntry], list[BaseModel], list[str]]:
+    """
+    Разделение источников на неизмененные (по отпечаткам предыдущего результата) и новые или измененные.
+
+    :param models: Прочитанные модели.
+    :param previous: Оформленные источники предыдущего запуска в порядке сортировки.
+    :return: Неизмененные источники в порядке предыдущего результата, новые или измененные модели
+        и их отпечатки.
+    """
+
+    fingerprints = [fingerprint(model) for model in models]
+
+    # неизмененные источники (с учетом повторяющихся) сохраняют порядок предыдущего результата
+    remaining = Counter(fingerprints)
+    kept: list[ManifestEntry] = []
+    for entry in previous:
+        if remaining[entry[0]] > 0:
+            remaining[entry[0]] -= 1
+            kept.append(entry)
+
+    changed_models, changed_fingerprints = [], []
+    for model, model_fingerprint in zip(models, fingerprints):
+        if remaining[model_fingerprint] > 0:
+            remaining[model_fingerprint] -= 1
+            changed_models.append(model)
+            changed_fingerprints.append(model_fingerprint)
+
+    return kept, changed_models, changed_fingerprints
+
+
+def merge_entries(kept: list[ManifestEntry], added: list[tuple[str, CitationEntry]]) -> list[ManifestEntry]:
+    """
+    Слияние неизмененных источников с оформленными новыми или измененными источниками.
+
+    :param kept: Неизмененные источники в порядке сортировки.
+    :param added: Отпечатки и оформленные записи новых или измененных источников.
+    :return: Оформленные источники в порядке сортировки.
+    """
+
+    added = sorted(added, key=lambda item: item[1].sort_key)
+    kept_items = [
+        (entry_fingerprint, FormattedEntry.from_formatted(formatted)) for entry_fingerprint, formatted in kept
+    ]
+    merged = heapq.merge(kept_items, added, key=lambda item: item[1].sort_key)
+
+    return [(entry_fingerprint, item.formatted) for entry_fingerprint, item in merged]
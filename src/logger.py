@@ -1,35 +1,295 @@
 """
 Функции для логирования.
+
+Обработчики логов (запись в файл и вывод в консоль) создаются один раз на процесс
+и используются всеми логгерами модулей, поэтому повторный вызов `get_logger()`
+не приводит к дублированию записей и открытию новых файлов.
 """
+import atexit
 import logging
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import util
+from typing import Optional
 
-from settings import LOGGING_FORMAT, LOGGING_LEVEL, LOGGING_PATH
+from settings import (
+    LOGGING_FILE,
+    LOGGING_FORMAT,
+    LOGGING_LEVEL,
+    LOGGING_LEVELS,
+    LOGGING_PATH,
+    LOGGING_PROGRESS_STEP,
+    LOGGING_QUEUE,
+)
 
+# реестр настроенных логгеров по наименованиям модулей
+_loggers: dict[str, logging.Logger] = {}
+# общие обработчики, подключаемые к логгерам модулей
+_handlers: list[logging.Handler] = []
+# конечные обработчики (файл и консоль), общие для всех логгеров
+_targets: list[logging.Handler] = []
+# фоновый обработчик очереди логов (не более одного на процесс)
+_listeners: list[QueueListener] = []
 
-def get_logger(
-    module_name: str,
-    logging_level: str = LOGGING_LEVEL,
-    logging_format: str = LOGGING_FORMAT,
-) -> logging.Logger:
+
+def parse_levels(levels: str) -> dict[str, str]:
     """
-    Настройка логгера.
+    Разбор настройки уровней логирования модулей.
+
+    .. code-block::
+
+        parse_levels("readers=DEBUG, formatters.styles=WARNING")
+        # {"readers": "DEBUG", "formatters.styles": "WARNING"}
+
+    :param levels: Уровни логирования в формате `модуль=УРОВЕНЬ` через запятую.
+    :return: Уровни логирования по наименованиям модулей (или пакетов).
+    """
+
+    result = {}
+    for item in levels.split(","):
+        module_name, _, level = item.partition("=")
+        if module_name.strip() and level.strip():
+            result[module_name.strip()] = level.strip().upper()
+
+    return result
+
+
+def get_level(module_name: str, levels: str = LOGGING_LEVELS, default: str = LOGGING_LEVEL) -> str:
+    """
+    Получение уровня логирования модуля.
+
+    Используется уровень, заданный для самого модуля или ближайшего родительского пакета,
+    иначе – общий уровень логирования.
 
     :param module_name: Наименование модуля
-    :param logging_level: Уровень логирования
+    :param levels: Уровни логирования модулей в формате `модуль=УРОВЕНЬ` через запятую
+    :param default: Общий уровень логирования
+    :return: Уровень логирования
+    """
+
+    module_levels = parse_levels(levels)
+    parts = module_name.split(".")
+    for index in range(len(parts), 0, -1):
+        level = module_levels.get(".".join(parts[:index]))
+        if level:
+            return level
+
+    return default
+
+
+def setup_handlers(
+    logging_format: str = LOGGING_FORMAT,
+    logging_queue: bool = LOGGING_QUEUE,
+) -> list[logging.Handler]:
+    """
+    Создание общих обработчиков логов (один раз на процесс).
+
     :param logging_format: Формат логов
-    :return:
+    :param logging_queue: Неблокирующая запись логов: записи помещаются в очередь,
+        а запись в файл и вывод в консоль выполняются в фоновом потоке
+    :return: Обработчики для подключения к логгерам модулей
     """
 
-    # запись логов в файлы
-    logger = logging.getLogger(module_name)
-    logger.setLevel(logging_level)
-    file_handler = logging.FileHandler(f"{LOGGING_PATH}/{module_name}.log")
+    if _handlers:
+        return _handlers
+
+    # запись логов в файл
+    file_handler = logging.FileHandler(f"{LOGGING_PATH}/{LOGGING_FILE}")
     file_handler.setFormatter(logging.Formatter(logging_format))
-    logger.addHandler(file_handler)
 
     # вывод логов в консоль
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(logging.Formatter(logging_format))
-    logger.addHandler(stream_handler)
+
+    _targets.extend((file_handler, stream_handler))
+
+    if logging_queue:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        start_listener(log_queue)
+        handler = QueueHandler(log_queue)
+        _handlers.append(handler)
+        util.register_after_fork(handler, finalize_listener)
+    else:
+        _handlers.extend(_targets)
+
+    return _handlers
+
+
+def get_logger(module_name: str, logging_level: Optional[str] = None) -> logging.Logger:
+    """
+    Настройка логгера.
+
+    Повторный вызов для того же модуля возвращает уже настроенный логгер.
+
+    :param module_name: Наименование модуля
+    :param logging_level: Уровень логирования (по умолчанию – из настройки `LOGGING_LEVELS` или `LOGGING_LEVEL`)
+    :return:
+    """
+
+    logger = _loggers.get(module_name)
+    if logger is None:
+        logger = logging.getLogger(module_name)
+        for handler in setup_handlers():
+            if handler not in logger.handlers:
+                logger.addHandler(handler)
+        _loggers[module_name] = logger
+
+    logger.setLevel(logging_level or get_level(module_name))
 
     return logger
+
+
+def start_listener(log_queue: queue.SimpleQueue) -> None:
+    """
+    Запуск фонового обработчика очереди логов.
+
+    :param log_queue: Очередь записей логов
+    """
+
+    listener = QueueListener(log_queue, *_targets, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+
+
+def stop_listener() -> None:
+    """
+    Остановка фонового обработчика очереди логов с записью всех накопленных записей.
+    """
+
+    while _listeners:
+        _listeners.pop().stop()
+
+
+def acquire_targets() -> None:
+    """
+    Захват блокировок конечных обработчиков перед созданием дочернего процесса через `fork`.
+
+    Пока блокировки захвачены, никакой поток не выполняет запись в файл, поэтому дочерний процесс
+    не наследует частично записанный буфер файла (иначе запись в дочернем процессе завершалась бы ошибкой,
+    а записи родительского процесса из буфера записывались бы повторно).
+    """
+
+    for target in _targets:
+        target.acquire()
+
+
+def release_targets() -> None:
+    """
+    Освобождение блокировок конечных обработчиков в родительском процессе после создания дочернего процесса.
+    """
+
+    for target in reversed(_targets):
+        target.release()
+
+
+def restart_listener() -> None:
+    """
+    Перезапуск фонового обработчика очереди логов в дочернем процессе.
+
+    Потоки не наследуются при создании процесса через `fork`, поэтому в дочернем процессе запускается
+    новый обработчик. Обработчик получает новую очередь: унаследованная копия очереди родительского процесса
+    может содержать еще не записанные им записи, которые иначе были бы записаны повторно.
+    """
+
+    # блокировки, захваченные перед созданием процесса, в дочернем процессе создаются заново
+    for target in _targets:
+        target.createLock()
+
+    if not _listeners:
+        return
+
+    # обработчик родительского процесса в дочернем процессе не работает
+    _listeners.clear()
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    for handler in _handlers:
+        if isinstance(handler, QueueHandler):
+            handler.queue = log_queue
+    start_listener(log_queue)
+
+
+def finalize_listener(_: QueueHandler) -> None:
+    """
+    Остановка фонового обработчика очереди логов при завершении дочернего процесса `multiprocessing`.
+
+    Процессы `multiprocessing`, созданные через `fork`, завершаются без вызова функций `atexit`,
+    поэтому без финализатора последние записи дочернего процесса терялись бы в очереди.
+    Финализатор регистрируется после создания процесса: реестр финализаторов при запуске процесса очищается.
+
+    :param _: Обработчик, передающий записи в очередь
+    """
+
+    util.Finalize(None, stop_listener, exitpriority=0)
+
+
+atexit.register(stop_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=acquire_targets, after_in_parent=release_targets, after_in_child=restart_listener)
+
+
+class ProgressLogger:
+    """
+    Пакетный вывод прогресса обработки записей.
+
+    Вместо записи в лог для каждого элемента выводится одна запись на каждые `step` элементов
+    с количеством обработанных элементов и скоростью обработки.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        message: str,
+        step: int = LOGGING_PROGRESS_STEP,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param logger: Логгер для вывода прогресса.
+        :param message: Описание выполняемой операции.
+        :param step: Количество элементов между записями о прогрессе.
+        """
+
+        self.logger = logger
+        self.message = message
+        self.step = max(step, 1)
+        self.count = 0
+        self.started = time.perf_counter()
+        self.next_report = self.step
+
+    def advance(self, count: int = 1) -> None:
+        """
+        Учет обработанных элементов.
+
+        :param count: Количество обработанных элементов.
+        """
+
+        self.count += count
+        if self.count >= self.next_report:
+            self.report()
+            self.next_report = (self.count // self.step + 1) * self.step
+
+    def finish(self) -> None:
+        """
+        Вывод итоговой записи о прогрессе.
+        """
+
+        self.report(final=True)
+
+    def report(self, final: bool = False) -> None:
+        """
+        Вывод записи о прогрессе.
+
+        :param final: Признак итоговой записи.
+        """
+
+        elapsed = time.perf_counter() - self.started
+        rate: Optional[float] = self.count / elapsed if elapsed else None
+        self.logger.info(
+            "%s: %s %s записей (%s записей/с)",
+            self.message,
+            "завершено," if final else "обработано",
+            self.count,
+            f"{rate:.0f}" if rate is not None else "–",
+        )
@@ -1,30 +1,27 @@
 """
 Запуск приложения.
 """
-from enum import Enum, unique
+from contextlib import nullcontext
+from typing import Any, Optional
 
 import click
 
-from formatters.styles.gost import GOSTCitationFormatter
+# перечисление стилей цитирования доступно также из модуля запуска
+from formatters.enums import CitationEnum
 from logger import get_logger
-from readers.reader import SourcesReader
-from renderer import Renderer
-from settings import INPUT_FILE_PATH, OUTPUT_FILE_PATH
+from profiler import Profiler
+from settings import (
+    CACHE_DIR,
+    FORMAT_WORKERS,
+    INPUT_FILE_PATH,
+    OUTPUT_FILE_PATH,
+    PIPELINE_QUEUE_SIZE,
+    READER_WORKERS,
+)
 
 logger = get_logger(__name__)
 
 
-@unique
-class CitationEnum(Enum):
-    """
-    Поддерживаемые типы цитирования.
-    """
-
-    GOST = "gost"  # ГОСТ Р 7.0.5-2008
-    MLA = "mla"  # Modern Language Association
-    APA = "apa"  # American Psychological Association
-
-
 @click.command()
 @click.option(
     "--citation",
@@ -53,10 +50,149 @@ class CitationEnum(Enum):
     show_default=True,
     help="Путь к выходному файлу",
 )
+@click.option(
+    "--streaming",
+    "-s",
+    "streaming",
+    is_flag=True,
+    default=False,
+    help="Потоковая обработка: чтение входного файла и запись выходного файла без загрузки документов в память",
+)
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=1),
+    default=READER_WORKERS,
+    show_default=True,
+    help="Количество процессов для параллельного чтения листов входного файла",
+)
+@click.option(
+    "--trusted",
+    "-t",
+    "trusted",
+    is_flag=True,
+    default=False,
+    help="Доверенный режим: создание моделей без полной валидации для строк, прошедших быструю проверку",
+)
+@click.option(
+    "--compact",
+    "compact",
+    is_flag=True,
+    default=False,
+    help="Компактное хранение оформленных источников (без исходных моделей) для больших списков",
+)
+@click.option(
+    "--incremental",
+    "-i",
+    "incremental",
+    is_flag=True,
+    default=False,
+    help="Инкрементальная генерация: повторное форматирование только измененных источников",
+)
+@click.option(
+    "--cache-dir",
+    "cache_dir",
+    type=str,
+    default=CACHE_DIR or None,
+    show_default=True,
+    help="Директория постоянного кэша оформленных источников (по умолчанию – CACHE_DIR или без кэша); "
+    "кэш ускоряет только стили, оформление в которых дороже получения строки из кэша",
+)
+@click.option(
+    "--no-cache",
+    "no_cache",
+    is_flag=True,
+    default=False,
+    help="Форматирование без постоянного кэша оформленных источников (даже если задана переменная CACHE_DIR)",
+)
+@click.option(
+    "--dedup",
+    "-d",
+    "dedup",
+    is_flag=True,
+    default=False,
+    help="Удаление повторяющихся источников (без учета регистра, пробелов и различия «ё» и «е»)",
+)
+@click.option(
+    "--near-duplicates",
+    "near_duplicates",
+    is_flag=True,
+    default=False,
+    help="Удаление также почти совпадающих источников по сходству названий (включает --dedup)",
+)
+@click.option(
+    "--dump-intermediate",
+    "dump_intermediate",
+    type=str,
+    default=None,
+    help="Путь для сохранения прочитанных источников в промежуточный колоночный файл "
+    "(без потоковой и конвейерной обработки)",
+)
+@click.option(
+    "--from-intermediate",
+    "from_intermediate",
+    type=str,
+    default=None,
+    help="Путь к промежуточному колоночному файлу, из которого источники читаются вместо входного файла",
+)
+@click.option(
+    "--pipelined",
+    "pipelined",
+    is_flag=True,
+    default=False,
+    help="Конвейерная обработка: чтение, форматирование и запись выходного файла выполняются одновременно "
+    "(без постоянного кэша и инкрементальной генерации)",
+)
+@click.option(
+    "--format-workers",
+    "format_workers",
+    type=click.IntRange(min=0),
+    default=FORMAT_WORKERS,
+    show_default=True,
+    help="Количество процессов форматирования при конвейерной обработке (0 – по количеству процессоров)",
+)
+@click.option(
+    "--queue-size",
+    "queue_size",
+    type=click.IntRange(min=1),
+    default=PIPELINE_QUEUE_SIZE,
+    show_default=True,
+    help="Количество пакетов источников в очереди между чтением и форматированием при конвейерной обработке",
+)
+@click.option(
+    "--profile",
+    "profile",
+    is_flag=True,
+    default=False,
+    help="Профилирование этапов: вывод таблицы времени, памяти и скорости обработки по этапам",
+)
+@click.option(
+    "--profile-output",
+    "profile_output",
+    type=str,
+    default=None,
+    help="Путь для сохранения показателей этапов в файл JSON (включает --profile)",
+)
+@click.option(
+    "--profile-cprofile",
+    "profile_cprofile",
+    type=str,
+    default=None,
+    help="Директория для сохранения профилей cProfile по этапам (включает --profile)",
+)
+@click.option(
+    "--profile-memory",
+    "profile_memory",
+    is_flag=True,
+    default=False,
+    help="Отслеживание пикового объема выделенной памяти по этапам с помощью tracemalloc (включает --profile)",
+)
 def process_input(
     citation: str = CitationEnum.GOST.name,
     path_input: str = INPUT_FILE_PATH,
     path_output: str = OUTPUT_FILE_PATH,
+    **options: Any,
 ) -> None:
     """
     Генерация файла Word с оформленным библиографическим списком.
@@ -64,29 +200,71 @@ def process_input(
     :param str citation: Стиль цитирования
     :param str path_input: Путь к входному файлу
     :param str path_output: Путь к выходному файлу
+    :param options: Параметры генерации (см. `pipeline.GenerateOptions`), форматирование без постоянного кэша
+        (`no_cache`) и параметры профилирования этапов (`profile`, `profile_output`, `profile_cprofile`,
+        `profile_memory`)
     """
 
+    profiler, profile_output = create_profiler(options)
+    if options.pop("no_cache"):
+        options["cache_dir"] = None
+
+    # модули чтения, форматирования и генерации файла загружаются только при запуске обработки
+    # pylint: disable=import-outside-toplevel
+    from pydantic import ValidationError
+
+    from pipeline import GenerateOptions, generate
+
+    try:
+        generate_options = GenerateOptions(citation=citation, **options)
+    except ValidationError as error:
+        raise click.UsageError(" ".join(item["msg"] for item in error.errors())) from error
+
     logger.info(
         """Обработка команды с параметрами:
         - Стиль цитирования: %s.
         - Путь к входному файлу: %s.
-        - Путь к выходному файлу: %s.""",
+        - Путь к выходному файлу: %s.
+        - Параметры генерации: %s.
+        - Профилирование этапов: %s.""",
         citation,
         path_input,
         path_output,
+        generate_options,
+        profiler is not None,
     )
 
-    models = SourcesReader(path_input).read()
-    formatted_models = tuple(
-        str(item) for item in GOSTCitationFormatter(models).format()
-    )
+    with profiler or nullcontext():
+        generate(path_input, path_output, generate_options)
 
-    logger.info("Генерация выходного файла ...")
-    Renderer(formatted_models).render(path_output)
+    if profiler is not None:
+        click.echo(profiler.format_table())
+        if profile_output:
+            profiler.dump(profile_output)
 
     logger.info("Команда успешно завершена.")
 
 
+def create_profiler(options: dict[str, Any]) -> tuple[Optional[Profiler], Optional[str]]:
+    """
+    Создание профилировщика этапов по параметрам команды.
+
+    Параметры профилирования извлекаются из переданного словаря параметров команды.
+
+    :param options: Параметры команды.
+    :return: Профилировщик (`None`, если профилирование не включено) и путь для сохранения показателей этапов.
+    """
+
+    profile_output = options.pop("profile_output")
+    profile_cprofile = options.pop("profile_cprofile")
+    profile_memory = options.pop("profile_memory")
+    # сохранение профилей и отслеживание памяти включают профилирование этапов
+    if not (options.pop("profile") or profile_output or profile_cprofile or profile_memory):
+        return None, None
+
+    return Profiler(cprofile_dir=profile_cprofile, trace_memory=profile_memory), profile_output
+
+
 if __name__ == "__main__":
     try:
         # запуск обработки входного файла
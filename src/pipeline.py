@@ -0,0 +1,272 @@
+"""
+Генерация библиографического списка: чтение входного файла, форматирование и создание выходного файла.
+"""
+from pathlib import Path
+from typing import Any, Iterable, Optional, Type
+
+from pydantic import BaseModel, root_validator
+
+from dedup import Deduplicator
+from external_sort import ExternalSorter
+from formatters.cache import CitationCache
+from formatters.registry import get_formatter
+from formatters.styles.base import BaseStyleFormatter
+from incremental import Manifest, update_entries
+from logger import get_logger
+from pipelined import PipelinedExecutor
+from profiler import iterate, stage
+from readers.intermediate import read_intermediate, write_intermediate
+from readers.reader import SourcesReader
+from renderer import Renderer, StreamingRenderer
+from settings import FORMAT_WORKERS, PIPELINE_QUEUE_SIZE, READER_WORKERS
+
+logger = get_logger(__name__)
+
+
+class GenerateOptions(BaseModel):
+    """
+    Параметры генерации библиографического списка.
+    """
+
+    # стиль цитирования (наименование или значение `CitationEnum`)
+    citation: str = "GOST"
+    # потоковая обработка: чтение входного файла в режиме `read_only`, внешняя сортировка оформленных источников
+    # и запись выходного файла без построения дерева документа в памяти
+    streaming: bool = False
+    # количество процессов для параллельного чтения листов
+    workers: int = READER_WORKERS
+    # доверенный режим создания моделей
+    trusted: bool = False
+    # компактное хранение оформленных источников
+    compact: bool = False
+    # инкрементальная генерация: повторное форматирование только измененных источников
+    # с использованием манифеста предыдущего запуска
+    incremental: bool = False
+    # директория постоянного кэша оформленных источников (`None` – без кэша)
+    cache_dir: Optional[str] = None
+    # удаление повторяющихся источников перед форматированием
+    dedup: bool = False
+    # удаление также почти совпадающих источников (по сходству названий)
+    near_duplicates: bool = False
+    # путь для сохранения прочитанных источников в промежуточный колоночный файл
+    dump_intermediate: Optional[str] = None
+    # путь к промежуточному колоночному файлу, из которого источники читаются вместо входного файла
+    from_intermediate: Optional[str] = None
+    # конвейерная обработка: чтение, форматирование в пуле процессов и запись выходного файла
+    # выполняются одновременно с ограниченными очередями между этапами (без постоянного кэша)
+    pipelined: bool = False
+    # количество процессов форматирования при конвейерной обработке (0 – по количеству процессоров)
+    format_workers: int = FORMAT_WORKERS
+    # количество пакетов источников в очереди между чтением и форматированием при конвейерной обработке
+    queue_size: int = PIPELINE_QUEUE_SIZE
+
+    @root_validator(skip_on_failure=True)
+    def check_modes(cls, values: dict[str, Any]) -> dict[str, Any]:  # pylint: disable=no-self-argument
+        """
+        Проверка совместимости режимов генерации.
+
+        :param values: Значения параметров.
+        :return: Значения параметров.
+        """
+
+        # промежуточный файл записывается по столбцам после чтения всех источников
+        if values["dump_intermediate"] and (values["streaming"] or values["pipelined"]):
+            raise ValueError(
+                "Сохранение промежуточного файла (--dump-intermediate) требует хранения всех прочитанных источников "
+                "в памяти и не поддерживается при потоковой и конвейерной обработке (--streaming, --pipelined)."
+            )
+        # инкрементальная генерация сравнивает все источники с манифестом предыдущего запуска
+        if values["incremental"] and values["pipelined"]:
+            raise ValueError(
+                "Конвейерная обработка (--pipelined, --format-workers, --queue-size) "
+                "не поддерживается при инкрементальной генерации (--incremental)."
+            )
+
+        return values
+
+
+def generate(path_input: str, path_output: Path | str, options: Optional[GenerateOptions] = None) -> int:
+    """
+    Генерация файла Word с оформленным библиографическим списком.
+
+    :param path_input: Путь к входному файлу
+    :param path_output: Путь к выходному файлу
+    :param options: Параметры генерации (`None` – параметры по умолчанию)
+    :return: Количество источников в выходном файле
+    """
+
+    options = options or GenerateOptions()
+    models = read_models(path_input, options)
+    formatter = get_formatter(options.citation)
+    if options.pipelined:
+        return generate_pipelined(models, path_output, formatter, options)
+
+    cache = CitationCache(options.cache_dir) if options.cache_dir else None
+    try:
+        if options.incremental:
+            return generate_incremental(models, path_output, formatter, cache, options)
+        if options.streaming:
+            return generate_streaming(models, path_output, formatter, cache)
+
+        with stage("format") as stats:
+            formatted = formatter(models, compact=options.compact, cache=cache)
+            stats.rows += len(formatted.formatted_items)
+        with stage("sort") as stats:
+            formatted_models = tuple(str(item) for item in formatted.format())
+            stats.rows += len(formatted_models)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    return render(formatted_models, path_output)
+
+
+def read_models(path_input: str, options: GenerateOptions) -> Iterable[BaseModel]:
+    """
+    Чтение источников из входного или промежуточного файла с сохранением промежуточного файла
+    и удалением повторов (если заданы в параметрах).
+
+    :param path_input: Путь к входному файлу
+    :param options: Параметры генерации
+    :return: Модели источников (при потоковой и конвейерной обработке – генератор)
+    """
+
+    models: Iterable[BaseModel]
+    if options.from_intermediate:
+        models = iterate("read", read_intermediate(options.from_intermediate))
+    else:
+        reader = SourcesReader(
+            path_input,
+            streaming=options.streaming or options.pipelined,
+            workers=options.workers,
+            trusted=options.trusted,
+        )
+        if options.pipelined:
+            # чтение листов в пуле процессов приостанавливается, пока форматирование не догонит чтение
+            models = (
+                reader.iter_parallel(2 * options.workers)
+                if options.workers > 1 and not reader.text
+                else reader.iter_models()
+            )
+        elif options.streaming and options.workers == 1:
+            models = iterate("read", reader.iter_models())
+        else:
+            # параллельное чтение возвращает модели в исходном порядке после завершения всех процессов
+            with stage("read") as stats:
+                models = reader.read()
+                stats.rows += len(models)
+
+    if options.dump_intermediate:
+        with stage("dump_intermediate") as stats:
+            models = write_intermediate(models, options.dump_intermediate)
+            stats.rows += len(models)
+    if options.dedup or options.near_duplicates:
+        models = iterate("dedup", Deduplicator(near=options.near_duplicates).process(models))
+
+    return models
+
+
+def generate_pipelined(
+    models: Iterable[BaseModel],
+    path_output: Path | str,
+    formatter: Type[BaseStyleFormatter],
+    options: GenerateOptions,
+) -> int:
+    """
+    Конвейерная генерация: чтение выполняется в отдельном потоке, форматирование – в пуле процессов.
+
+    :param models: Модели источников
+    :param path_output: Путь к выходному файлу
+    :param formatter: Класс итогового форматирования стиля цитирования
+    :param options: Параметры генерации
+    :return: Количество источников в выходном файле
+    """
+
+    executor = PipelinedExecutor(formatter, format_workers=options.format_workers, queue_size=options.queue_size)
+    sorter = ExternalSorter()
+    formatted_entries = iterate("format", executor.iter_formatted(models))
+    logger.info("Генерация выходного файла ...")
+    with stage("render") as stats:
+        StreamingRenderer(iterate("sort", sorter.sort(formatted_entries))).render(path_output)
+        stats.rows += sorter.count
+
+    return sorter.count
+
+
+def generate_streaming(
+    models: Iterable[BaseModel],
+    path_output: Path | str,
+    formatter: Type[BaseStyleFormatter],
+    cache: Optional[CitationCache],
+) -> int:
+    """
+    Потоковая генерация: чтение, форматирование, внешняя сортировка и запись выполняются одним потоком данных.
+
+    :param models: Модели источников
+    :param path_output: Путь к выходному файлу
+    :param formatter: Класс итогового форматирования стиля цитирования
+    :param cache: Постоянный кэш оформленных источников
+    :return: Количество источников в выходном файле
+    """
+
+    sorter = ExternalSorter()
+    items = iterate("format", formatter.iter_items(models, compact=True, cache=cache))
+    logger.info("Генерация выходного файла ...")
+    with stage("render") as stats:
+        StreamingRenderer(iterate("sort", sorter.sort(items))).render(path_output)
+        stats.rows += sorter.count
+
+    return sorter.count
+
+
+def generate_incremental(
+    models: Iterable[BaseModel],
+    path_output: Path | str,
+    formatter: Type[BaseStyleFormatter],
+    cache: Optional[CitationCache],
+    options: GenerateOptions,
+) -> int:
+    """
+    Инкрементальная генерация: повторно форматируются только источники, измененные с предыдущего запуска,
+    выходной файл не создается заново, если источники не изменились и файл соответствует манифесту.
+
+    :param models: Модели источников
+    :param path_output: Путь к выходному файлу
+    :param formatter: Класс итогового форматирования стиля цитирования
+    :param cache: Постоянный кэш оформленных источников
+    :param options: Параметры генерации
+    :return: Количество источников в выходном файле
+    """
+
+    manifest = Manifest(path_output, options.citation)
+    with stage("format") as stats:
+        entries, changed = update_entries(models, manifest.load(), cache, formatter)
+        stats.rows += len(entries)
+    if not changed and manifest.is_output_current():
+        logger.info("Источники не изменились, выходной файл актуален.")
+        return len(entries)
+
+    count = render(tuple(formatted for _, formatted in entries), path_output, options.streaming)
+    # манифест сохраняется после успешной генерации выходного файла
+    manifest.save(entries)
+
+    return count
+
+
+def render(formatted_models: tuple[str, ...], path_output: Path | str, streaming: bool = False) -> int:
+    """
+    Генерация выходного файла по оформленным строкам в порядке сортировки.
+
+    :param formatted_models: Оформленные строки
+    :param path_output: Путь к выходному файлу
+    :param streaming: Запись выходного файла без построения дерева документа в памяти
+    :return: Количество источников в выходном файле
+    """
+
+    logger.info("Генерация выходного файла ...")
+    renderer = StreamingRenderer(formatted_models) if streaming else Renderer(formatted_models)
+    with stage("render") as stats:
+        renderer.render(path_output)
+        stats.rows += len(formatted_models)
+
+    return len(formatted_models)
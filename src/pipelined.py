@@ -0,0 +1,187 @@
+"""
+Конвейерная обработка: чтение, форматирование и генерация выходного файла выполняются одновременно.
+
+Источники читаются в отдельном потоке и передаются пакетами (кортежами значений полей моделей)
+через ограниченную очередь, пакеты форматируются в пуле процессов, а оформленные источники
+поступают во внешнюю сортировку и после слияния отсортированных фрагментов – в выходной файл.
+
+Объем памяти ограничен на каждом этапе: при заполнении очереди чтение приостанавливается,
+количество заданий форматирования ограничено (не более двух на процесс),
+а внешняя сортировка хранит в памяти не более одного фрагмента (`SORT_RUN_SIZE`).
+"""
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from operator import attrgetter
+from typing import Any, Callable, Generator, Iterable, Iterator, Type
+
+from pydantic import BaseModel
+
+from formatters.collation import SortKey
+from formatters.styles.base import BaseStyleFormatter, FormattedEntry, format_chunk
+from logger import get_logger
+from settings import FORMAT_WORKERS, PIPELINE_BATCH_SIZE, PIPELINE_QUEUE_SIZE
+
+logger = get_logger(__name__)
+
+# пакет источников: список частей в виде (наименование типа моделей, наименования полей, кортежи значений полей)
+Batch = list[tuple[str, tuple[str, ...], list[tuple]]]
+
+# признак завершения чтения в очереди пакетов
+_DONE = object()
+
+
+class PipelinedExecutor:
+    """
+    Конвейерное форматирование источников.
+    """
+
+    def __init__(
+        self,
+        formatter: Type[BaseStyleFormatter],
+        format_workers: int = FORMAT_WORKERS,
+        batch_size: int = PIPELINE_BATCH_SIZE,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param formatter: Класс итогового форматирования стиля цитирования.
+        :param format_workers: Количество процессов форматирования (0 – по количеству процессоров;
+            1 – форматирование в текущем процессе одновременно с чтением в отдельном потоке).
+        :param batch_size: Количество источников в одном пакете.
+        :param queue_size: Количество пакетов в очереди между чтением и форматированием.
+        """
+
+        self.formatter = formatter
+        self.format_workers = format_workers or os.cpu_count() or 1
+        self.batch_size = max(batch_size, 1)
+        self.batches: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+        self.stopped = threading.Event()
+        self.count = 0
+
+    def put(self, item: Any) -> bool:
+        """
+        Передача пакета в очередь с ожиданием свободного места.
+
+        :param item: Пакет, ошибка чтения или признак завершения чтения.
+        :return: Признак передачи (`False`, если конвейер остановлен).
+        """
+
+        while not self.stopped.is_set():
+            try:
+                self.batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def produce(self, models: Iterable[BaseModel]) -> None:
+        """
+        Чтение источников и передача пакетов в очередь (выполняется в отдельном потоке).
+
+        :param models: Модели источников.
+        """
+
+        getters: dict[type, tuple[tuple[str, ...], Callable[[BaseModel], tuple]]] = {}
+        parts: dict[type, list[tuple]] = {}
+        size = 0
+        try:
+            for model in models:
+                model_type = type(model)
+                if model_type not in getters:
+                    fields = tuple(model_type.__fields__)
+                    getters[model_type] = fields, attrgetter(*fields)
+                parts.setdefault(model_type, []).append(getters[model_type][1](model))
+                size += 1
+                if size >= self.batch_size:
+                    if not self.put(self.pack(parts, getters)):
+                        return
+                    parts, size = {}, 0
+
+            if parts and not self.put(self.pack(parts, getters)):
+                return
+        except Exception as ex:  # pylint: disable=broad-except
+            # ошибка чтения передается в поток форматирования
+            self.put(ex)
+            return
+
+        self.put(_DONE)
+
+    @staticmethod
+    def pack(
+        parts: dict[type, list[tuple]], getters: dict[type, tuple[tuple[str, ...], Callable[[BaseModel], tuple]]]
+    ) -> Batch:
+        """
+        Формирование пакета из накопленных кортежей значений полей.
+
+        :param parts: Кортежи значений полей по типам моделей.
+        :param getters: Наименования полей и функции получения значений по типам моделей.
+        :return: Пакет источников.
+        """
+
+        return [(model_type.__name__, getters[model_type][0], rows) for model_type, rows in parts.items()]
+
+    def iter_formatted(self, models: Iterable[BaseModel]) -> Generator[FormattedEntry, None, None]:
+        """
+        Конвейерное форматирование источников.
+
+        :param models: Модели источников (обычно генератор, читающий входной файл).
+        :return: Генератор оформленных источников (порядок не определен, сортировка выполняется отдельно);
+            при закрытии генератора чтение останавливается.
+        """
+
+        logger.info(
+            "Конвейерное форматирование: пакеты по %s источников, очередь %s пакетов, процессов форматирования: %s.",
+            self.batch_size,
+            self.batches.maxsize,
+            self.format_workers,
+        )
+
+        executor = ProcessPoolExecutor(max_workers=self.format_workers) if self.format_workers > 1 else None
+        with executor or nullcontext():
+            if executor is not None:
+                # процессы пула запускаются до потока чтения: создание процессов (fork) из процесса
+                # с работающим потоком чтения могло бы скопировать заблокированные этим потоком ресурсы
+                for future in [executor.submit(os.getpid) for _ in range(self.format_workers)]:
+                    future.result()
+
+            reader = threading.Thread(target=self.produce, args=(models,), name="pipeline-reader", daemon=True)
+            reader.start()
+            try:
+                pending: deque[Future] = deque()
+                while (batch := self.batches.get()) is not _DONE:
+                    if isinstance(batch, BaseException):
+                        raise batch
+
+                    for model_name, fields, rows in batch:
+                        if executor is None:
+                            yield from self.entries(format_chunk(self.formatter, model_name, fields, rows))
+                        else:
+                            pending.append(executor.submit(format_chunk, self.formatter, model_name, fields, rows))
+
+                    # не более двух заданий на процесс: пока форматирование не догонит чтение, очередь не разбирается
+                    while len(pending) > 2 * self.format_workers:
+                        yield from self.entries(pending.popleft().result())
+
+                while pending:
+                    yield from self.entries(pending.popleft().result())
+            finally:
+                self.stopped.set()
+                reader.join()
+
+    def entries(self, pairs: Iterable[tuple[SortKey, str]]) -> Iterator[FormattedEntry]:
+        """
+        Получение компактных записей по результатам форматирования пакета.
+
+        :param pairs: Ключи сортировки и оформленные строки.
+        :return: Генератор компактных записей.
+        """
+
+        for key, text in pairs:
+            self.count += 1
+            yield FormattedEntry(key, text)
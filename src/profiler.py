@@ -0,0 +1,403 @@
+"""
+Профилирование этапов генерации библиографического списка.
+
+Для каждого этапа (загрузка рабочей книги, чтение, валидация моделей, форматирование, сортировка,
+генерация выходного файла) собираются время выполнения, процессорное время, прирост пикового объема памяти
+процесса и количество обработанных записей. Показатели этапа учитываются без вложенных этапов: например,
+при потоковой обработке чтение источников выполняется внутри форматирования,
+но время чтения не входит во время форматирования.
+
+Профилирование включается контекстным менеджером `Profiler`, функции `stage()`, `iterate()` и `wrap()`
+без включенного профилирования не выполняют измерений:
+
+.. code-block::
+
+    with Profiler() as profiler:
+        with stage("read") as stats:
+            models = reader.read()
+            stats.rows += len(models)
+
+    print(profiler.format_table())
+"""
+import cProfile
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - модуль недоступен в Windows
+    resource = None  # type: ignore
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+Item = TypeVar("Item")
+
+
+def get_max_rss() -> Optional[int]:
+    """
+    Получение пикового объема резидентной памяти процесса.
+
+    :return: Объем памяти в байтах (`None`, если недоступно в операционной системе).
+    """
+
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # в macOS значение указывается в байтах, в Linux – в килобайтах
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class StageStats:
+    """
+    Показатели этапа обработки.
+    """
+
+    __slots__ = ("name", "wall", "cpu", "rows", "calls", "rss_growth", "peak_traced")
+
+    def __init__(self, name: str) -> None:
+        """
+        Конструктор.
+
+        :param name: Наименование этапа.
+        """
+
+        self.name = name
+        # время выполнения и процессорное время без вложенных этапов (в секундах)
+        self.wall = 0.0
+        self.cpu = 0.0
+        # количество обработанных записей
+        self.rows = 0
+        # количество выполнений этапа
+        self.calls = 0
+        # прирост пикового объема резидентной памяти процесса во время этапа (в байтах):
+        # пиковый объем памяти процесса не уменьшается, поэтому этап без прироста мог использовать
+        # память, освобожденную предыдущими этапами
+        self.rss_growth: Optional[int] = None
+        # пиковый объем памяти, выделенной интерпретатором во время этапа (только с `tracemalloc`)
+        self.peak_traced: Optional[int] = None
+
+    @property
+    def rate(self) -> Optional[float]:
+        """
+        Получение скорости обработки записей.
+
+        :return: Количество записей в секунду (`None`, если записи не учитывались).
+        """
+
+        return self.rows / self.wall if self.rows and self.wall else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Получение показателей в виде словаря (для сохранения в JSON).
+
+        :return: Показатели этапа.
+        """
+
+        return {
+            "name": self.name,
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "rows": self.rows,
+            "rate": self.rate,
+            "calls": self.calls,
+            "rss_growth": self.rss_growth,
+            "peak_traced": self.peak_traced,
+        }
+
+
+class Profiler:
+    """
+    Сбор показателей этапов обработки.
+
+    Процессорное время и память учитываются только для текущего процесса, поэтому работа дочерних процессов
+    (например, при параллельном чтении листов) отражается лишь во времени выполнения этапа.
+    """
+
+    # включенный профилировщик (не более одного на процесс)
+    active: Optional["Profiler"] = None
+
+    def __init__(self, cprofile_dir: Optional[Path | str] = None, trace_memory: bool = False) -> None:
+        """
+        Конструктор.
+
+        :param cprofile_dir: Директория для сохранения профилей `cProfile` по этапам (`None` – без `cProfile`).
+        :param trace_memory: Отслеживание пикового объема выделенной памяти по этапам (`tracemalloc`).
+        """
+
+        self.cprofile_dir = Path(cprofile_dir) if cprofile_dir else None
+        self.trace_memory = trace_memory
+        self.stages: dict[str, StageStats] = {}
+        self.profiles: dict[str, cProfile.Profile] = {}
+        # выполняемые этапы: (показатели, время начала, процессорное время начала, время вложенных этапов,
+        # процессорное время вложенных этапов, пиковый объем памяти в начале, прирост памяти во вложенных этапах)
+        self.stack: list[list[Any]] = []
+        self.started = 0.0
+        self.wall = 0.0
+        # поток, в котором включено профилирование
+        self.thread: Optional[int] = None
+
+    def __enter__(self) -> "Profiler":
+        if Profiler.active is not None:
+            raise RuntimeError("Профилирование уже включено.")
+
+        if self.trace_memory:
+            tracemalloc.start()
+        self.started = time.perf_counter()
+        self.thread = threading.get_ident()
+        Profiler.active = self
+
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[type], exc_value: Optional[BaseException], traceback: Optional[TracebackType]
+    ) -> None:
+        Profiler.active = None
+        self.wall = time.perf_counter() - self.started
+        if self.trace_memory:
+            tracemalloc.stop()
+        if self.cprofile_dir is not None:
+            self.dump_profiles(self.cprofile_dir)
+
+    def start(self, name: str) -> StageStats:
+        """
+        Начало выполнения этапа (вложенного в текущий этап, если он есть).
+
+        :param name: Наименование этапа.
+        :return: Показатели этапа.
+        """
+
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats(name)
+
+        if self.cprofile_dir is not None:
+            if self.stack:
+                # одновременно может работать только один профилировщик
+                self.profiles[self.stack[-1][0].name].disable()
+            self.profiles.setdefault(name, cProfile.Profile()).enable()
+
+        if self.trace_memory:
+            if self.stack:
+                self.update_traced(self.stack[-1][0])
+            tracemalloc.reset_peak()
+
+        self.stack.append([stats, time.perf_counter(), time.process_time(), 0.0, 0.0, get_max_rss(), 0])
+
+        return stats
+
+    def stop(self, rows: int = 0) -> None:
+        """
+        Завершение выполнения текущего этапа.
+
+        :param rows: Количество обработанных записей.
+        """
+
+        stats, wall_started, cpu_started, children_wall, children_cpu, rss_started, children_rss = self.stack.pop()
+        wall = time.perf_counter() - wall_started
+        cpu = time.process_time() - cpu_started
+        rss = get_max_rss()
+        rss_growth = None if rss is None or rss_started is None else rss - rss_started
+
+        stats.wall += wall - children_wall
+        stats.cpu += cpu - children_cpu
+        stats.rows += rows
+        stats.calls += 1
+        if rss_growth is not None:
+            stats.rss_growth = (stats.rss_growth or 0) + rss_growth - children_rss
+
+        if self.stack:
+            # показатели вложенного этапа исключаются из показателей внешнего этапа
+            self.stack[-1][3] += wall
+            self.stack[-1][4] += cpu
+            self.stack[-1][6] += rss_growth or 0
+
+        if self.cprofile_dir is not None:
+            self.profiles[stats.name].disable()
+            if self.stack:
+                self.profiles[self.stack[-1][0].name].enable()
+
+        if self.trace_memory:
+            self.update_traced(stats)
+            tracemalloc.reset_peak()
+
+    @staticmethod
+    def update_traced(stats: StageStats) -> None:
+        """
+        Учет пикового объема выделенной памяти с последнего сброса в показателях этапа.
+
+        :param stats: Показатели этапа.
+        """
+
+        _, peak = tracemalloc.get_traced_memory()
+        stats.peak_traced = max(stats.peak_traced or 0, peak)
+
+    def dump_profiles(self, directory: Path | str) -> None:
+        """
+        Сохранение профилей `cProfile` этапов (файлы `<этап>.prof` для `pstats` и `snakeviz`).
+
+        :param directory: Директория для сохранения профилей.
+        """
+
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        for name, profile in self.profiles.items():
+            profile.dump_stats(Path(directory) / f"{name}.prof")
+
+        logger.info('Профили этапов сохранены в директорию "%s".', directory)
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Получение показателей всех этапов в виде словаря (для сохранения в JSON).
+
+        :return: Показатели этапов и общее время выполнения.
+        """
+
+        return {
+            "wall": self.wall,
+            "peak_rss": get_max_rss(),
+            "stages": [stats.as_dict() for stats in self.stages.values()],
+        }
+
+    def dump(self, path: Path | str) -> None:
+        """
+        Сохранение показателей этапов в файл JSON.
+
+        :param path: Путь к файлу.
+        """
+
+        Path(path).write_text(json.dumps(self.as_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        logger.info('Показатели этапов сохранены в файл "%s".', path)
+
+    def format_table(self) -> str:
+        """
+        Получение таблицы показателей этапов.
+
+        :return: Таблица в текстовом виде.
+        """
+
+        def mib(value: Optional[int]) -> str:
+            return "–" if value is None else f"{value / 2 ** 20:.1f}"
+
+        lines = [
+            f"{'Этап':<16} {'Время, с':>10} {'ЦП, с':>10} {'Доля':>6} {'+RSS, МиБ':>10} "
+            f"{'Выдел., МиБ':>12} {'Записей':>10} {'Записей/с':>12}"
+        ]
+        for stats in self.stages.values():
+            share = stats.wall / self.wall if self.wall else 0.0
+            rate = "–" if stats.rate is None else f"{stats.rate:.0f}"
+            lines.append(
+                f"{stats.name:<16} {stats.wall:>10.3f} {stats.cpu:>10.3f} {share:>6.1%} {mib(stats.rss_growth):>10} "
+                f"{mib(stats.peak_traced):>12} {stats.rows or '–':>10} {rate:>12}"
+            )
+        lines.append(f"{'total':<16} {self.wall:>10.3f}")
+        lines.append(f"Пиковый объем резидентной памяти процесса (RSS): {mib(get_max_rss())} МиБ")
+
+        return "\n".join(lines)
+
+
+def get_profiler() -> Optional[Profiler]:
+    """
+    Получение включенного профилировщика.
+
+    Этапы измеряются только в потоке, в котором включено профилирование:
+    этапы, выполняемые в других потоках (например, чтение в конвейерном режиме), не учитываются.
+
+    :return: Профилировщик (`None`, если профилирование не включено или вызов выполняется в другом потоке).
+    """
+
+    profiler = Profiler.active
+    if profiler is None or profiler.thread != threading.get_ident():
+        return None
+
+    return profiler
+
+
+@contextmanager
+def stage(name: str) -> Iterator[StageStats]:
+    """
+    Измерение этапа обработки.
+
+    Количество обработанных записей указывается в полученных показателях (`stats.rows`).
+
+    :param name: Наименование этапа.
+    :return: Показатели этапа (без включенного профилирования – показатели, которые не сохраняются).
+    """
+
+    profiler = get_profiler()
+    if profiler is None:
+        yield StageStats(name)
+        return
+
+    stats = profiler.start(name)
+    try:
+        yield stats
+    finally:
+        profiler.stop()
+
+
+def iterate(name: str, items: Iterable[Item]) -> Iterator[Item]:
+    """
+    Измерение ленивого этапа обработки: учитывается время получения каждого элемента.
+
+    :param name: Наименование этапа.
+    :param items: Элементы, получаемые на этапе (например, генератор моделей).
+    :return: Генератор тех же элементов.
+    """
+
+    profiler = get_profiler()
+    if profiler is None:
+        yield from items
+        return
+
+    iterator = iter(items)
+    while True:
+        profiler.start(name)
+        try:
+            item = next(iterator)
+        except StopIteration:
+            profiler.stop()
+            return
+        except BaseException:
+            profiler.stop()
+            raise
+        profiler.stop(1)
+
+        yield item
+
+
+def wrap(name: str, function: Callable[..., Item]) -> Callable[..., Item]:
+    """
+    Измерение каждого вызова функции как выполнения этапа с одной записью.
+
+    :param name: Наименование этапа.
+    :param function: Измеряемая функция.
+    :return: Функция с измерением (без включенного профилирования – исходная функция).
+    """
+
+    active = get_profiler()
+    if active is None:
+        return function
+    profiler: Profiler = active
+
+    def measured(*args: Any, **kwargs: Any) -> Item:
+        profiler.start(name)
+        try:
+            result = function(*args, **kwargs)
+        except BaseException:
+            profiler.stop()
+            raise
+        profiler.stop(1)
+
+        return result
+
+    return measured
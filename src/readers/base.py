@@ -1,32 +1,105 @@
 """
 Функции чтения исходного файла.
 """
+from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Type
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Sequence, Type
 
-from openpyxl.workbook import Workbook
 from pydantic import BaseModel
 
-from logger import get_logger
+from logger import ProgressLogger, get_logger
+from profiler import wrap
+
+if TYPE_CHECKING:
+    from openpyxl.workbook import Workbook
 
 logger = get_logger(__name__)
 
+# функция декодирования строки листа в словарь атрибутов модели
+RowDecoder = Callable[[Sequence[Any]], dict]
+# функция декодирования записи (словаря значений по наименованиям атрибутов) в словарь атрибутов модели
+RecordDecoder = Callable[[dict], dict]
+# функция быстрой проверки словаря атрибутов модели
+RowValidator = Callable[[dict], bool]
+
+
+def to_int(value: Any) -> int:
+    """
+    Преобразование значения ячейки в целое число.
+
+    :param value: Значение ячейки.
+    :return: Целое число.
+    """
+
+    return int(str(value))
+
+
+def to_str(value: Any) -> str:
+    """
+    Преобразование значения ячейки в строку без пробелов по краям.
+
+    :param value: Значение ячейки.
+    :return: Строка.
+    """
+
+    return str(value).strip()
+
+
+def to_date(value: Any) -> Any:
+    """
+    Преобразование значения ячейки с датой в строку формата `ДД.ММ.ГГГГ`.
+
+    :param value: Значение ячейки.
+    :return: Отформатированная дата или исходное значение, если оно не является датой.
+    """
+
+    return value.strftime("%d.%m.%Y") if isinstance(value, date) else value
+
+
+def to_raw(value: Any) -> Any:
+    """
+    Значение ячейки без преобразования (для типов данных без конвертера).
+
+    :param value: Значение ячейки.
+    :return: Исходное значение.
+    """
+
+    return value
+
+
+# конвертеры значений ячеек по типам данных атрибутов
+CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    int: to_int,
+    str: to_str,
+    date: to_date,
+}
+
 
 class BaseReader(ABC):
     """
     Базовый класс читателя исходного файла.
     """
 
-    def __init__(self, workbook: Workbook) -> None:
+    # скомпилированные декодеры строк (по одному на класс читателя)
+    _decoders: dict[type, RowDecoder] = {}
+    # скомпилированные декодеры записей текстовых форматов (по одному на класс читателя)
+    _record_decoders: dict[type, RecordDecoder] = {}
+    # скомпилированные функции быстрой проверки строк (по одной на класс читателя)
+    _validators: dict[type, RowValidator] = {}
+
+    def __init__(self, workbook: Optional[Workbook] = None, trusted: bool = False) -> None:
         """
         Конструктор.
 
-        :param workbook: Рабочая книга Excel.
+        :param workbook: Рабочая книга Excel (`None` – для чтения строк и записей из других источников).
+        :param trusted: Доверенный режим: модели строк, прошедших быструю проверку типов и ограничений полей,
+            создаются без полной валидации pydantic.
         """
 
         self.workbook = workbook
+        self.trusted = trusted
 
     @property
     @abstractmethod
@@ -67,40 +140,195 @@ class BaseReader(ABC):
         :return: Атрибуты с информацией об индексе столбца и типе данных
         """
 
-    def read(self) -> list[BaseModel]:
+    def compile_fields(self) -> list[tuple[str, int, Callable[[Any], Any]]]:
         """
-        Чтение исходного файла.
+        Разбор карты атрибутов (`attributes()`).
 
-        :return: Список моделей строк в виде DTO (Data Transfer Objects).
+        :return: Список полей в виде (наименование атрибута, индекс столбца, конвертер типа данных).
         """
 
-        models = []
-        # чтение со второй строки таблицы (первая строка содержит заголовок)
-        for row in self.workbook[self.sheet].iter_rows(min_row=2):
-            # обработка строки идет только, если заполнены обязательные столбцы
-            if row[0].value:
-                attrs = {}
+        fields = []
+        for attr, params in self.attributes.items():
+            index, data_type = next(iter(params.items()))
+            fields.append((attr, index, CONVERTERS.get(data_type, to_raw)))
+
+        return fields
+
+    def compile_decoder(self) -> RowDecoder:
+        """
+        Компиляция карты атрибутов (`attributes()`) в функцию декодирования строки.
+
+        Наименования атрибутов, индексы столбцов и конвертеры типов данных вычисляются один раз,
+        после чего декодирование строки сводится к одному проходу по кортежу полей.
+        Пустые значения ячеек передаются в модель без преобразования.
+
+        :return: Функция декодирования строки листа в словарь атрибутов модели.
+        """
+
+        fields = self.compile_fields()
+
+        width = max((index for _, index, _ in fields), default=-1) + 1
+        padding = (None,) * width
+
+        def decode(row: Sequence[Any]) -> dict:
+            # в режиме `read_only` строка может быть короче заголовка
+            if len(row) < width:
+                row = (tuple(row) + padding)[:width]
+
+            return {attr: converter(value) if (value := row[index]) else value for attr, index, converter in fields}
+
+        return decode
+
+    @property
+    def decoder(self) -> RowDecoder:
+        """
+        Получение скомпилированной функции декодирования строки для класса читателя.
+
+        :return: Функция декодирования строки листа в словарь атрибутов модели.
+        """
+
+        decoder = self._decoders.get(type(self))
+        if decoder is None:
+            decoder = self._decoders[type(self)] = self.compile_decoder()
 
-                # обработка заданных в методе `attributes()` атрибутов
-                for attr, params in self.attributes.items():
-                    index, data_type = list(params.items())[0]
-                    attrs[attr] = row[index].value
+        return decoder
 
-                    if not attrs[attr]:
-                        continue
+    def compile_record_decoder(self) -> RecordDecoder:
+        """
+        Компиляция карты атрибутов (`attributes()`) в функцию декодирования записи,
+        в которой значения указаны по наименованиям атрибутов (например, строки JSON Lines).
+
+        Конвертеры типов данных те же, что и для строк листа; отсутствующие и пустые значения
+        передаются в модель без преобразования, лишние ключи записи игнорируются.
+
+        :return: Функция декодирования записи в словарь атрибутов модели.
+        """
+
+        fields = tuple((attr, converter) for attr, _, converter in self.compile_fields())
+
+        def decode(record: dict) -> dict:
+            return {attr: converter(value) if (value := record.get(attr)) else value for attr, converter in fields}
+
+        return decode
+
+    @property
+    def record_decoder(self) -> RecordDecoder:
+        """
+        Получение скомпилированной функции декодирования записи для класса читателя.
+
+        :return: Функция декодирования записи в словарь атрибутов модели.
+        """
+
+        decoder = self._record_decoders.get(type(self))
+        if decoder is None:
+            decoder = self._record_decoders[type(self)] = self.compile_record_decoder()
+
+        return decoder
+
+    def compile_validator(self) -> RowValidator:
+        """
+        Компиляция быстрой проверки атрибутов по описанию полей модели.
+
+        Проверяются обязательность поля, точное совпадение типа значения с типом поля
+        и ограничение `gt` (например, `year > 0`, `pages > 0`).
+        Значения к этому моменту уже приведены к нужным типам декодером строки.
+
+        :return: Функция проверки словаря атрибутов модели.
+        """
+
+        checks = tuple(
+            (
+                name,
+                # встроенный тип данных поля (для `Field(..., gt=0)` pydantic создает подкласс `int`)
+                next(base for base in field.type_.__mro__ if base.__module__ == "builtins"),
+                field.required or not field.allow_none,
+                field.field_info.gt,
+            )
+            for name, field in self.model.__fields__.items()
+        )
+
+        def validate(attrs: dict) -> bool:
+            for name, data_type, required, greater_than in checks:
+                value = attrs.get(name)
+                if value is None:
+                    if required:
+                        return False
+                elif type(value) is not data_type or (  # pylint: disable=unidiomatic-typecheck
+                    greater_than is not None and not value > greater_than
+                ):
+                    return False
+
+            return True
+
+        return validate
+
+    @property
+    def validator(self) -> RowValidator:
+        """
+        Получение скомпилированной функции быстрой проверки строки для класса читателя.
+
+        :return: Функция проверки словаря атрибутов модели.
+        """
 
-                    if data_type is int:
-                        attrs[attr] = int(str(attrs.get(attr)))
+        validator = self._validators.get(type(self))
+        if validator is None:
+            validator = self._validators[type(self)] = self.compile_validator()
 
-                    if data_type is str:
-                        attrs[attr] = str(attrs.get(attr)).strip()
+        return validator
 
-                    if data_type is date:
-                        value = attrs.get(attr)
-                        if isinstance(value, date):
-                            attrs[attr] = value.strftime("%d.%m.%Y")
+    def build(self, attrs: dict) -> BaseModel:
+        """
+        Создание модели строки из словаря атрибутов.
+
+        В доверенном режиме модель создается без валидации (`construct()`), если атрибуты прошли быструю проверку.
+        В остальных случаях выполняется полная валидация pydantic, которая сообщает об ошибках строки.
+
+        :param attrs: Словарь атрибутов модели.
+        :return: Модель строки в виде DTO (Data Transfer Object).
+        """
 
-                # добавление считанной и обработанной строки в список моделей
-                models.append(self.model(**attrs))
+        if self.trusted and self.validator(attrs):
+            return self.model.construct(**attrs)
+
+        return self.model(**attrs)
+
+    def iter_models(self) -> Iterator[BaseModel]:
+        """
+        Последовательное (ленивое) чтение исходного файла.
+
+        Строки листа читаются в виде кортежей значений (`values_only=True`),
+        поэтому метод подходит как для обычной рабочей книги,
+        так и для книги, открытой в режиме `read_only`.
+
+        :return: Генератор моделей строк в виде DTO (Data Transfer Objects).
+        """
+
+        if self.workbook is None:
+            raise ValueError("Рабочая книга для чтения листа не задана.")
+
+        # при профилировании создание (валидация) моделей измеряется отдельным этапом
+        decode, build = self.decoder, wrap("validate", self.build)
+        progress = ProgressLogger(logger, f'Чтение листа "{self.sheet}"')
+        rows = self.workbook[self.sheet].iter_rows(min_row=2, values_only=True)
+        for number, row in enumerate(rows, start=2):
+            # обработка строки идет только, если заполнены обязательные столбцы
+            if row and row[0]:
+                try:
+                    item = build(decode(row))
+                except ValueError as ex:
+                    logger.error('Ошибка в строке %s листа "%s": %s', number, self.sheet, ex)
+                    raise
+
+                yield item
+                progress.advance()
+
+        progress.finish()
+
+    def read(self) -> list[BaseModel]:
+        """
+        Чтение исходного файла.
+
+        :return: Список моделей строк в виде DTO (Data Transfer Objects).
+        """
 
-        return models
+        return list(self.iter_models())
@@ -0,0 +1,312 @@
+"""
+Промежуточный колоночный формат прочитанных источников.
+
+Прочитанные и провалидированные модели сохраняются в двоичный файл по листам и столбцам
+(один столбец на атрибут модели), схема берется из карты атрибутов читателя (`BaseReader.attributes`).
+Повторное форматирование того же входного файла (например, в другом стиле цитирования)
+читает столбцы из отображенного в память файла без разбора рабочей книги Excel.
+
+Структура файла:
+
+.. code-block::
+
+    MAGIC (8 байт) | длина заголовка (8 байт) | заголовок JSON | столбцы
+
+Каждый столбец выровнен по 8 байтам и состоит из маски пустых значений (по байту на строку)
+и данных: для целочисленных атрибутов – массив `int64`, для строковых – массив смещений `int64`
+(количество строк + 1) и строки в кодировке UTF-8.
+"""
+import json
+import mmap
+import sys
+from array import array
+from itertools import accumulate
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Iterable, Iterator, Optional, Type
+
+from pydantic import BaseModel
+
+from logger import get_logger
+from readers.base import BaseReader
+from readers.reader import SourcesReader
+
+logger = get_logger(__name__)
+
+# сигнатура и версия формата файла
+MAGIC = b"BIBCOL\x00\x01"
+VERSION = 1
+# выравнивание столбцов в файле
+ALIGNMENT = 8
+
+# типы данных столбцов
+INT_COLUMN = "int"
+STR_COLUMN = "str"
+
+
+def get_schema(reader: BaseReader) -> list[tuple[str, str]]:
+    """
+    Получение схемы столбцов листа из карты атрибутов читателя.
+
+    Даты декодируются читателем в строки, поэтому хранятся в строковых столбцах.
+
+    :param reader: Читатель листа.
+    :return: Список столбцов в виде (наименование атрибута, тип данных столбца).
+    """
+
+    return [
+        (attr, INT_COLUMN if next(iter(params.values())) is int else STR_COLUMN)
+        for attr, params in reader.attributes.items()
+    ]
+
+
+def pad(size: int) -> bytes:
+    """
+    Получение байтов выравнивания блока.
+
+    :param size: Размер блока.
+    :return: Байты выравнивания.
+    """
+
+    return b"\x00" * (-size % ALIGNMENT)
+
+
+def encode_column(values: list, kind: str) -> bytes:
+    """
+    Кодирование столбца.
+
+    :param values: Значения столбца.
+    :param kind: Тип данных столбца.
+    :return: Байты столбца (с выравниванием).
+    """
+
+    nulls = bytes(value is None for value in values)
+    if kind == INT_COLUMN:
+        data = array("q", (0 if value is None else value for value in values)).tobytes()
+    else:
+        encoded = [b"" if value is None else str(value).encode("utf-8") for value in values]
+        data = array("q", accumulate(map(len, encoded), initial=0)).tobytes() + b"".join(encoded)
+
+    return nulls + pad(len(nulls)) + data + pad(len(data))
+
+
+def encode_sheet(reader: BaseReader, models: list[BaseModel], offset: int) -> tuple[dict[str, Any], list[bytes]]:
+    """
+    Кодирование столбцов листа.
+
+    :param reader: Читатель листа.
+    :param models: Модели листа.
+    :param offset: Смещение первого столбца листа от начала данных.
+    :return: Описание листа для заголовка файла и байты столбцов.
+    """
+
+    columns, blocks = [], []
+    for attr, kind in get_schema(reader):
+        block = encode_column([getattr(model, attr) for model in models], kind)
+        columns.append({"name": attr, "kind": kind, "offset": offset, "size": len(block)})
+        blocks.append(block)
+        offset += len(block)
+
+    return {"sheet": reader.sheet, "model": reader.model.__name__, "rows": len(models), "columns": columns}, blocks
+
+
+def write_file(path: Path | str, sheets: list[dict[str, Any]], blocks: list[bytes]) -> None:
+    """
+    Запись промежуточного файла: сигнатура, заголовок с описанием листов и столбцы.
+
+    :param path: Путь к промежуточному файлу.
+    :param sheets: Описания листов для заголовка файла.
+    :param blocks: Байты столбцов в порядке смещений.
+    """
+
+    content = {"version": VERSION, "byteorder": sys.byteorder, "sheets": sheets}
+    header = json.dumps(content, ensure_ascii=False).encode("utf-8")
+    header += b" " * (-(len(MAGIC) + 8 + len(header)) % ALIGNMENT)
+
+    with Path(path).open("wb") as stream:
+        stream.write(MAGIC)
+        stream.write(len(header).to_bytes(8, "little"))
+        stream.write(header)
+        stream.writelines(blocks)
+
+
+def write_intermediate(
+    models: Iterable[BaseModel], path: Path | str, readers: Optional[list[Type[BaseReader]]] = None
+) -> list[BaseModel]:
+    """
+    Сохранение прочитанных моделей в промежуточный колоночный файл.
+
+    Модели группируются по листам в порядке читателей, внутри листа порядок сохраняется.
+
+    :param models: Прочитанные модели.
+    :param path: Путь к промежуточному файлу.
+    :param readers: Классы читателей (по умолчанию – `SourcesReader.readers`).
+    :return: Список сохраненных моделей.
+    """
+
+    instances = [reader() for reader in readers or SourcesReader.readers]
+    readers_by_model = {reader.model.__name__: reader for reader in instances}
+    models = list(models)
+    grouped: dict[str, list[BaseModel]] = {name: [] for name in readers_by_model}
+    for model in models:
+        grouped[type(model).__name__].append(model)
+
+    sheets, blocks, offset = [], [], 0
+    for name, reader in readers_by_model.items():
+        sheet, sheet_blocks = encode_sheet(reader, grouped[name], offset)
+        sheets.append(sheet)
+        blocks.extend(sheet_blocks)
+        offset += sum(map(len, sheet_blocks))
+
+    write_file(path, sheets, blocks)
+    logger.info('Промежуточный файл "%s" сохранен: %s источников.', path, len(models))
+
+    return models
+
+
+class IntermediateFile:
+    """
+    Чтение промежуточного колоночного файла, отображенного в память.
+
+    Используется как контекстный менеджер:
+
+    .. code-block::
+
+        with IntermediateFile("sources.bibcol") as source:
+            authors = source.column("Книга", "authors")
+    """
+
+    def __init__(self, path: Path | str, readers: Optional[list[Type[BaseReader]]] = None) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к промежуточному файлу.
+        :param readers: Классы читателей (по умолчанию – `SourcesReader.readers`).
+        """
+
+        self.path = Path(path)
+        self.readers = [reader() for reader in readers or SourcesReader.readers]
+        self.sheets: dict[str, dict] = {}
+        self.start = 0
+        self.buffer: Optional[mmap.mmap] = None
+
+    def __enter__(self) -> "IntermediateFile":
+        with self.path.open("rb") as stream:
+            self.buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if self.buffer[: len(MAGIC)] != MAGIC:
+                raise ValueError(f'Файл "{self.path}" не является промежуточным файлом источников.')
+
+            size = int.from_bytes(self.buffer[len(MAGIC) : len(MAGIC) + 8], "little")  # noqa: E203
+            self.start = len(MAGIC) + 8 + size
+            header = json.loads(self.buffer[len(MAGIC) + 8 : self.start])  # noqa: E203
+            if header.get("version") != VERSION or header.get("byteorder") != sys.byteorder:
+                raise ValueError(f'Неподдерживаемая версия промежуточного файла "{self.path}".')
+
+            for reader in self.readers:
+                sheet = next((item for item in header["sheets"] if item["sheet"] == reader.sheet), None)
+                # схема файла должна совпадать с текущей картой атрибутов читателя
+                if sheet is None or [(item["name"], item["kind"]) for item in sheet["columns"]] != get_schema(reader):
+                    raise ValueError(f'Схема листа "{reader.sheet}" промежуточного файла устарела.')
+                self.sheets[reader.sheet] = sheet
+        except Exception:
+            self.close()
+            raise
+
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[type], exc_value: Optional[BaseException], traceback: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрытие отображения файла.
+        """
+
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+
+    def rows(self, sheet: str) -> int:
+        """
+        Получение количества строк листа.
+
+        :param sheet: Наименование листа.
+        :return: Количество строк.
+        """
+
+        return self.sheets[sheet]["rows"]
+
+    def column(self, sheet: str, name: str) -> list[Any]:
+        """
+        Чтение столбца листа.
+
+        Читаются только страницы файла, содержащие запрошенный столбец.
+
+        :param sheet: Наименование листа.
+        :param name: Наименование атрибута.
+        :return: Значения столбца (`None` – для пустых значений).
+        """
+
+        if self.buffer is None:
+            raise ValueError("Промежуточный файл не открыт.")
+
+        rows = self.rows(sheet)
+        column = next(item for item in self.sheets[sheet]["columns"] if item["name"] == name)
+        start = self.start + column["offset"]
+        nulls = self.buffer[start : start + rows]  # noqa: E203
+        start += rows + len(pad(rows))
+
+        numbers = array("q")
+        if column["kind"] == INT_COLUMN:
+            numbers.frombytes(self.buffer[start : start + rows * numbers.itemsize])  # noqa: E203
+            return [None if null else value for null, value in zip(nulls, numbers)]
+
+        numbers.frombytes(self.buffer[start : start + (rows + 1) * numbers.itemsize])  # noqa: E203
+        start += (rows + 1) * numbers.itemsize
+        data = self.buffer[start : start + numbers[-1]]  # noqa: E203
+
+        return [
+            None if null else data[begin:end].decode("utf-8") for null, begin, end in zip(nulls, numbers, numbers[1:])
+        ]
+
+    def columns(self, sheet: str) -> dict[str, list[Any]]:
+        """
+        Чтение всех столбцов листа.
+
+        :param sheet: Наименование листа.
+        :return: Значения столбцов по наименованиям атрибутов.
+        """
+
+        return {item["name"]: self.column(sheet, item["name"]) for item in self.sheets[sheet]["columns"]}
+
+    def iter_models(self) -> Iterator[BaseModel]:
+        """
+        Восстановление моделей из столбцов (в порядке листов и строк).
+
+        Значения прошли валидацию при чтении исходного файла, поэтому модели создаются без валидации.
+
+        :return: Генератор моделей.
+        """
+
+        for reader in self.readers:
+            columns = self.columns(reader.sheet)
+            names = tuple(columns)
+            for values in zip(*columns.values()):
+                yield reader.model.construct(**dict(zip(names, values)))
+
+
+def read_intermediate(path: Path | str) -> Iterator[BaseModel]:
+    """
+    Чтение моделей из промежуточного колоночного файла.
+
+    :param path: Путь к промежуточному файлу.
+    :return: Генератор моделей.
+    """
+
+    logger.info('Чтение промежуточного файла "%s" ...', path)
+    with IntermediateFile(path) as source:
+        yield from source.iter_models()
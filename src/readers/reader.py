@@ -1,20 +1,50 @@
 """
 Чтение исходного файла.
 """
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import date
-from typing import Type
+from typing import TYPE_CHECKING, Iterator, Optional, Type
 
-import openpyxl
-from openpyxl.workbook import Workbook
+from pydantic import BaseModel
 
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
 from logger import get_logger
+from profiler import stage
 from readers.base import BaseReader
+from readers.text import TextSourcesReader, is_text_source
+from settings import READER_WORKERS
+
+if TYPE_CHECKING:
+    from openpyxl.workbook import Workbook
 
 
 logger = get_logger(__name__)
 
 
+def load_workbook(path: str, read_only: bool = False) -> Workbook:
+    """
+    Загрузка рабочей книги Excel.
+
+    Модуль openpyxl загружается при первом чтении файла, а не при импорте приложения.
+
+    :param path: Путь к файлу рабочей книги.
+    :param read_only: Режим только для чтения (с вычисленными значениями формул вместо самих формул).
+    :return: Рабочая книга Excel.
+    """
+
+    import openpyxl  # pylint: disable=import-outside-toplevel
+
+    with stage("load_workbook"):
+        if read_only:
+            return openpyxl.load_workbook(path, read_only=True, data_only=True)
+
+        return openpyxl.load_workbook(path)
+
+
 class BookReader(BaseReader):
     """
     Чтение модели книги.
@@ -102,15 +132,36 @@ class SourcesReader:
         ArticlesCollectionReader,
     ]
 
-    def __init__(self, path: str) -> None:
+    def __init__(
+        self,
+        path: str,
+        streaming: bool = False,
+        workers: int = READER_WORKERS,
+        trusted: bool = False,
+    ) -> None:
         """
         Конструктор.
 
-        :param path: Путь к исходному файлу для чтения.
+        :param path: Путь к исходному файлу для чтения: рабочая книга Excel, файл CSV или JSON Lines
+            (формат определяется по расширению) либо директория с файлами CSV и JSON Lines по типам источников.
+        :param streaming: Потоковый режим: рабочая книга не загружается в память целиком,
+            а читается построчно при вызове `iter_models()`.
+        :param workers: Количество процессов для параллельного чтения листов (1 – последовательное чтение);
+            текстовые форматы всегда читаются последовательно.
+        :param trusted: Доверенный режим: модели создаются без полной валидации pydantic,
+            если значения строки прошли быструю проверку типов и ограничений полей.
         """
 
-        logger.info("Загрузка рабочей книги ...")
-        self.workbook: Workbook = openpyxl.load_workbook(path)
+        self.path = path
+        self.trusted = trusted
+        self.workers = workers
+        self.workbook: Optional[Workbook] = None
+        self.text = is_text_source(path)
+
+        # при параллельном чтении каждый процесс открывает рабочую книгу самостоятельно
+        if not self.text and not streaming and workers <= 1:
+            logger.info("Загрузка рабочей книги ...")
+            self.workbook = load_workbook(path)
 
     def read(self) -> list:
         """
@@ -119,9 +170,134 @@ class SourcesReader:
         :return: Список прочитанных моделей (строк).
         """
 
+        if self.workers > 1 and not self.text:
+            return self.read_parallel()
+
+        if self.workbook is None:
+            return list(self.iter_models())
+
         items = []
         for reader in self.readers:
             logger.info("Чтение %s ...", reader)
-            items.extend(reader(self.workbook).read())  # type: ignore
+            items.extend(reader(self.workbook, self.trusted).read())  # type: ignore
 
         return items
+
+    def iter_models(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение исходного файла.
+
+        Рабочая книга открывается в режиме `read_only`, строки листов читаются лениво,
+        поэтому потребление памяти не зависит от размера листа.
+        Файл рабочей книги закрывается по завершении (или прерывании) обхода генератора.
+
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        if self.text:
+            yield from TextSourcesReader(self.path, self.readers, self.trusted).iter_models()
+            return
+
+        logger.info("Открытие рабочей книги в потоковом режиме ...")
+        workbook = load_workbook(self.path, read_only=True)
+        try:
+            for reader in self.readers:
+                logger.info("Чтение %s ...", reader)
+                yield from reader(workbook, self.trusted).iter_models()  # type: ignore
+        finally:
+            workbook.close()
+
+    def read_parallel(self) -> list:
+        """
+        Параллельное чтение листов в пуле процессов.
+
+        Каждый процесс открывает рабочую книгу в режиме `read_only`, разбирает и валидирует строки своего листа
+        и возвращает компактный результат – кортежи значений полей моделей.
+        Результаты объединяются в исходном порядке листов и строк.
+
+        :return: Список прочитанных моделей (строк).
+        """
+
+        return list(self.iter_parallel())
+
+    def iter_parallel(self, max_pending: Optional[int] = None) -> Iterator[BaseModel]:
+        """
+        Параллельное чтение листов в пуле процессов с получением моделей по мере готовности листов.
+
+        Большую часть времени чтения занимает разбор XML листа, поэтому каждый лист разбирается
+        ровно один раз одним процессом: при разбиении листа на диапазоны строк каждый процесс
+        разбирал бы и все строки перед своим диапазоном.
+
+        Модели возвращаются в исходном порядке листов и строк. Количество листов, которые читаются
+        или ожидают обработки результата, ограничено, поэтому при медленной обработке моделей
+        чтение приостанавливается.
+
+        Процессы пула запускаются при вызове метода, а не при получении первой модели: генератор можно
+        разбирать в другом потоке (например, при конвейерной обработке), не создавая процессы из этого потока.
+
+        :param max_pending: Максимальное количество запущенных листов (по умолчанию – все листы).
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        workers = min(self.workers, len(self.readers))
+        logger.info("Параллельное чтение %s листов в %s процессах ...", len(self.readers), workers)
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        for future in [executor.submit(os.getpid) for _ in range(workers)]:
+            future.result()
+
+        return self.iter_results(executor, max_pending)
+
+    def iter_results(self, executor: ProcessPoolExecutor, max_pending: Optional[int] = None) -> Iterator[BaseModel]:
+        """
+        Чтение листов в запущенном пуле процессов (пул завершается после чтения всех листов).
+
+        :param executor: Пул процессов.
+        :param max_pending: Максимальное количество запущенных листов (по умолчанию – все листы).
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        with executor:
+            pending: deque[tuple[int, Future]] = deque()
+            for index in range(len(self.readers)):
+                pending.append((index, executor.submit(read_sheet, index, self.path, self.trusted)))
+                if max_pending is not None and len(pending) >= max_pending:
+                    yield from self.iter_sheet(*pending.popleft())
+
+            while pending:
+                yield from self.iter_sheet(*pending.popleft())
+
+    def iter_sheet(self, reader_index: int, future: Future) -> Iterator[BaseModel]:
+        """
+        Создание моделей из результата чтения листа в дочернем процессе.
+
+        :param reader_index: Индекс читателя в списке `readers`.
+        :param future: Результат чтения листа (кортежи значений полей моделей).
+        :return: Генератор моделей.
+        """
+
+        model = self.readers[reader_index](None).model  # type: ignore
+        fields = tuple(model.__fields__)
+        # значения прошли валидацию в дочернем процессе
+        for values in future.result():
+            yield model.construct(**dict(zip(fields, values)))
+
+
+def read_sheet(reader_index: int, path: str, trusted: bool = False) -> list[tuple]:
+    """
+    Чтение листа в дочернем процессе.
+
+    :param reader_index: Индекс читателя в списке `SourcesReader.readers`.
+    :param path: Путь к исходному файлу для чтения.
+    :param trusted: Доверенный режим создания моделей.
+    :return: Список кортежей значений полей моделей.
+    """
+
+    workbook = load_workbook(path, read_only=True)
+    try:
+        reader = SourcesReader.readers[reader_index](workbook, trusted)  # type: ignore
+        fields = tuple(reader.model.__fields__)
+
+        return [tuple(getattr(model, field) for field in fields) for model in reader.iter_models()]
+    finally:
+        workbook.close()
@@ -0,0 +1,189 @@
+"""
+Чтение исходных данных из текстовых форматов: CSV и JSON Lines.
+
+Текстовые файлы читаются построчно, без распаковки архива и разбора XML рабочей книги.
+Тип источника каждой строки определяется одним из способов:
+
+* столбцом (ключом) `type` со значением, равным наименованию листа рабочей книги (например, `Книга`);
+  в CSV-файле столбец `type` должен быть первым, остальные столбцы следуют в порядке столбцов листа;
+* именем файла, совпадающим с наименованием листа (например, `Книга.csv`, `Интернет-ресурс.jsonl`);
+  такие файлы можно собрать в одну директорию и передать путь к ней.
+
+Первая строка CSV-файла содержит заголовок (как и первая строка листа). Строки JSON Lines содержат
+объекты со значениями по наименованиям атрибутов моделей (`authors`, `title`, ...).
+"""
+import csv
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Sequence, Type
+
+from pydantic import BaseModel
+
+from logger import ProgressLogger, get_logger
+from profiler import wrap
+from readers.base import BaseReader
+
+logger = get_logger(__name__)
+
+# расширения файлов текстовых форматов
+CSV_SUFFIX = ".csv"
+JSONL_SUFFIX = ".jsonl"
+TEXT_SUFFIXES = (CSV_SUFFIX, JSONL_SUFFIX)
+
+# наименование столбца (ключа) с типом источника
+TYPE_FIELD = "type"
+
+
+def is_text_source(path: Path | str) -> bool:
+    """
+    Проверка, что исходные данные представлены в текстовом формате (файл или директория с файлами).
+
+    :param path: Путь к исходным данным.
+    :return: Признак текстового формата.
+    """
+
+    path = Path(path)
+
+    return path.is_dir() or path.suffix.lower() in TEXT_SUFFIXES
+
+
+def iter_csv(path: Path) -> Iterator[tuple[int, Optional[str], Sequence[Any]]]:
+    """
+    Построчное чтение CSV-файла.
+
+    :param path: Путь к файлу.
+    :return: Генератор строк в виде (номер строки, тип источника или `None`, значения столбцов).
+    """
+
+    # кодировка `utf-8-sig` пропускает BOM, который добавляет Excel при экспорте в CSV
+    with path.open(encoding="utf-8-sig", newline="") as stream:
+        rows = csv.reader(stream)
+        header: list[str] = next(rows, [])
+        typed = bool(header) and header[0].strip().lower() == TYPE_FIELD
+        for number, row in enumerate(rows, start=2):
+            # пустые строки (например, в конце файла) пропускаются
+            if not row:
+                continue
+
+            # пустые значения CSV соответствуют пустым ячейкам листа
+            values = [value if value else None for value in row]
+            if typed:
+                yield number, row[0].strip(), values[1:]
+            else:
+                yield number, None, values
+
+
+def iter_jsonl(path: Path) -> Iterator[tuple[int, Optional[str], dict]]:
+    """
+    Построчное чтение файла JSON Lines.
+
+    :param path: Путь к файлу.
+    :return: Генератор записей в виде (номер строки, тип источника или `None`, запись).
+    """
+
+    with path.open(encoding="utf-8") as stream:
+        for number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError(f'Строка {number} файла "{path}" должна содержать объект JSON.')
+
+            source_type = record.get(TYPE_FIELD)
+            yield number, None if source_type is None else str(source_type).strip(), record
+
+
+class TextSourcesReader:
+    """
+    Чтение исходных данных из файлов CSV и JSON Lines.
+    """
+
+    def __init__(self, path: Path | str, readers: Sequence[Type[BaseReader]], trusted: bool = False) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу или директории с файлами по типам источников.
+        :param readers: Классы читателей (тип источника определяется наименованием листа читателя).
+        :param trusted: Доверенный режим создания моделей.
+        """
+
+        self.path = Path(path)
+        self.readers = [reader(None, trusted) for reader in readers]
+        self.types = {reader.sheet: reader for reader in self.readers}
+
+    def iter_models(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение исходных данных.
+
+        Файлы директории читаются в порядке зарегистрированных читателей.
+
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        if not self.path.is_dir():
+            yield from self.iter_file(self.path, self.types.get(self.path.stem))
+            return
+
+        for reader in self.readers:
+            for suffix in TEXT_SUFFIXES:
+                path = self.path / f"{reader.sheet}{suffix}"
+                if path.is_file():
+                    yield from self.iter_file(path, reader)
+
+    def iter_file(self, path: Path, default: Optional[BaseReader] = None) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение файла.
+
+        :param path: Путь к файлу.
+        :param default: Читатель для строк без указания типа источника.
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        logger.info('Чтение файла "%s" ...', path)
+        records: Iterator[tuple[int, Optional[str], Any]] = (
+            iter_csv(path) if path.suffix.lower() == CSV_SUFFIX else iter_jsonl(path)
+        )
+
+        yield from self.iter_records(records, f'файла "{path.name}"', default)
+
+    def iter_records(
+        self,
+        records: Iterable[tuple[int, Optional[str], Any]],
+        source: str,
+        default: Optional[BaseReader] = None,
+    ) -> Iterator[BaseModel]:
+        """
+        Создание моделей из строк CSV (списков значений) или записей (словарей значений по атрибутам).
+
+        :param records: Строки или записи в виде (номер строки, тип источника или `None`, значения).
+        :param source: Описание источника данных для сообщений (например, `файла "sources.csv"`).
+        :param default: Читатель для строк без указания типа источника.
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        build = wrap("validate", BaseReader.build)
+        progress = ProgressLogger(logger, f"Чтение {source}")
+        for number, source_type, values in records:
+            reader = default if source_type is None else self.types.get(source_type)
+            try:
+                if reader is None:
+                    raise ValueError(f'неизвестный тип источника "{source_type or ""}"')
+
+                if isinstance(values, dict):
+                    attrs = reader.record_decoder(values)
+                # обработка строки CSV идет только, если заполнены обязательные столбцы
+                elif values and values[0]:
+                    attrs = reader.decoder(values)
+                else:
+                    continue
+
+                item = build(reader, attrs)
+            except ValueError as ex:
+                logger.error("Ошибка в строке %s %s: %s", number, source, ex)
+                raise
+
+            yield item
+            progress.advance()
+
+        progress.finish()
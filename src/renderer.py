@@ -3,28 +3,64 @@
 """
 from __future__ import annotations
 
+import io
+import re
+import zipfile
+from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+from uuid import uuid4
+from xml.sax.saxutils import escape
 
-from docx import Document
-from docx.enum.text import WD_ALIGN_PARAGRAPH  # pylint: disable=E0611
-from docx.shared import Pt
+from logger import get_logger
 
+if TYPE_CHECKING:
+    from docx.document import Document as DocumentType
 
-class Renderer:
+logger = get_logger(__name__)
+
+# наименование части пакета Word с текстом документа
+DOCUMENT_PART = "word/document.xml"
+# символы, недопустимые в XML 1.0
+INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f￾￿]")
+# символы, заменяемые на отдельные элементы текста (табуляция и перевод строки)
+SPECIAL_CHARS = re.compile("([\t\r\n])")
+
+
+class BaseRenderer(ABC):
     """
-    Создание выходного файла – Word.
+    Базовый класс создания выходного файла – Word.
+
+    Символы, недопустимые в XML 1.0 (например, управляющие символы из ячеек рабочей книги),
+    удаляются из текста источников одинаково при любом способе генерации (см. `clean()`).
     """
 
-    def __init__(self, rows: tuple[str, ...]):
+    def __init__(self, rows: Iterable[str]) -> None:
+        """
+        Конструктор.
+
+        :param rows: Оформленные строки в порядке сортировки.
+        """
+
         self.rows = rows
+        # количество источников, из текста которых удалены недопустимые символы
+        self.cleaned = 0
 
-    def render(self, path: Path | str) -> None:
+    @staticmethod
+    def create_document() -> DocumentType:
         """
-        Метод генерации Word-файла со списком использованных источников.
+        Создание документа Word с заголовком и стилями текста (без списка источников).
 
-        :param Path | str path: Путь для сохранения выходного файла.
+        :return: Документ Word.
         """
 
+        # python-docx загружается только при генерации выходного файла
+        # pylint: disable=import-outside-toplevel
+        from docx import Document
+        from docx.enum.text import WD_ALIGN_PARAGRAPH  # pylint: disable=E0611
+        from docx.shared import Pt
+
         document = Document()
 
         # стилизация заголовка
@@ -40,9 +76,171 @@ class Renderer:
         style_normal.paragraph_format.line_spacing = 1.5
         style_normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
 
+        return document
+
+    def clean(self, row: str) -> str:
+        """
+        Удаление из текста источника символов, недопустимых в XML 1.0.
+
+        :param row: Оформленная строка.
+        :return: Строка без недопустимых символов.
+        """
+
+        cleaned = INVALID_XML_CHARS.sub("", row)
+        if len(cleaned) != len(row):
+            self.cleaned += 1
+
+        return cleaned
+
+    def log_cleaned(self) -> None:
+        """
+        Вывод предупреждения об источниках, из текста которых удалены недопустимые символы.
+        """
+
+        if self.cleaned:
+            logger.warning("Из текста %s источников удалены символы, недопустимые в XML.", self.cleaned)
+
+    @abstractmethod
+    def render(self, path: Path | str) -> None:
+        """
+        Метод генерации Word-файла со списком использованных источников.
+
+        :param Path | str path: Путь для сохранения выходного файла.
+        """
+
+
+class Renderer(BaseRenderer):
+    """
+    Создание выходного файла – Word.
+    """
+
+    def render(self, path: Path | str) -> None:
+        """
+        Метод генерации Word-файла со списком использованных источников.
+
+        :param Path | str path: Путь для сохранения выходного файла.
+        """
+
+        document = self.create_document()
+
         for row in self.rows:
             # добавление источника
-            document.add_paragraph(row, style="List Number")
+            document.add_paragraph(self.clean(row), style="List Number")
 
         # сохранение файла Word
         document.save(path)
+        self.log_cleaned()
+
+
+@lru_cache(maxsize=1)
+def build_template() -> tuple[bytes, str, str, str, str]:
+    """
+    Подготовка шаблона пакета Word для потоковой записи (один раз на процесс).
+
+    Документ создается так же, как в `Renderer`, но с одним абзацем-меткой,
+    по которому текст документа разделяется на начало, шаблон абзаца источника и окончание.
+
+    :return: Пакет Word (zip), начало текста документа, начало и окончание абзаца источника
+        (без фрагмента текста `<w:r>`), окончание текста документа.
+    """
+
+    marker = uuid4().hex
+    document = BaseRenderer.create_document()
+    document.add_paragraph(marker, style="List Number")
+
+    package = io.BytesIO()
+    document.save(package)
+    with zipfile.ZipFile(package) as archive:
+        xml = archive.read(DOCUMENT_PART).decode("utf-8")
+
+    # абзац-метка: <w:p><w:pPr>...</w:pPr><w:r><w:t>marker</w:t></w:r></w:p>
+    position = xml.index(marker)
+    paragraph_start = xml.rindex("<w:p>", 0, position)
+    run_start = xml.rindex("<w:r>", 0, position)
+    run_end = xml.index("</w:r>", position) + len("</w:r>")
+    paragraph_end = xml.index("</w:p>", position) + len("</w:p>")
+
+    return (
+        package.getvalue(),
+        xml[:paragraph_start],
+        xml[paragraph_start:run_start],
+        xml[run_end:paragraph_end],
+        xml[paragraph_end:],
+    )
+
+
+def run_xml(text: str) -> str:
+    """
+    Формирование фрагмента текста абзаца (`<w:r>`) так же, как это делает python-docx.
+
+    Табуляция заменяется на `<w:tab/>`, переводы строк – на `<w:br/>`,
+    для текста с пробелами по краям указывается `xml:space="preserve"`.
+    Для пустого текста фрагмент не создается.
+
+    :param text: Текст абзаца (без недопустимых в XML символов, см. `BaseRenderer.clean()`).
+    :return: XML фрагмента текста.
+    """
+
+    if not text:
+        return ""
+
+    parts = ["<w:r>"]
+    for chunk in SPECIAL_CHARS.split(text):
+        if chunk == "\t":
+            parts.append("<w:tab/>")
+        elif chunk in ("\r", "\n"):
+            parts.append("<w:br/>")
+        elif chunk:
+            space = ' xml:space="preserve"' if len(chunk.strip()) < len(chunk) else ""
+            parts.append(f"<w:t{space}>{escape(chunk)}</w:t>")
+    parts.append("</w:r>")
+
+    return "".join(parts)
+
+
+class StreamingRenderer(BaseRenderer):
+    """
+    Потоковое создание выходного файла – Word.
+
+    Текст документа (`word/document.xml`) записывается в архив по абзацам,
+    без построения дерева документа в памяти; остальные части пакета (стили, нумерация)
+    копируются из заранее подготовленного шаблона. Содержимое документа совпадает с `Renderer`.
+    """
+
+    # количество абзацев, записываемых в архив за одну операцию
+    batch_size = 1000
+
+    def render(self, path: Path | str) -> None:
+        """
+        Метод потоковой генерации Word-файла со списком использованных источников.
+
+        :param Path | str path: Путь для сохранения выходного файла.
+        """
+
+        package, document_start, paragraph_start, paragraph_end, document_end = build_template()
+
+        with zipfile.ZipFile(io.BytesIO(package)) as source, zipfile.ZipFile(
+            path, "w", compression=zipfile.ZIP_DEFLATED
+        ) as target:
+            for info in source.infolist():
+                if info.filename != DOCUMENT_PART:
+                    target.writestr(info, source.read(info))
+                    continue
+
+                document_info = zipfile.ZipInfo(DOCUMENT_PART, info.date_time)
+                document_info.compress_type = zipfile.ZIP_DEFLATED
+                with target.open(document_info, "w") as stream:
+                    stream.write(document_start.encode("utf-8"))
+
+                    batch = []
+                    for row in self.rows:
+                        # добавление источника
+                        batch.append(f"{paragraph_start}{run_xml(self.clean(row))}{paragraph_end}")
+                        if len(batch) >= self.batch_size:
+                            stream.write("".join(batch).encode("utf-8"))
+                            batch.clear()
+
+                    batch.append(document_end)
+                    stream.write("".join(batch).encode("utf-8"))
+
+        self.log_cleaned()
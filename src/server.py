@@ -0,0 +1,411 @@
+"""
+HTTP-сервис форматирования библиографических списков.
+
+Сервис работает постоянно, поэтому модули чтения, форматирования и генерации файлов загружаются
+один раз в заранее запущенных процессах пула, а не при каждом вызове приложения.
+Запросы принимаются асинхронно (`asyncio`), обработка выполняется в пуле процессов.
+Количество одновременно принятых запросов ограничено: при заполнении очереди
+сервис отвечает `503 Service Unavailable` с заголовком `Retry-After`.
+
+Методы:
+
+* `GET /health` – состояние сервиса;
+* `POST /format?citation=gost` – оформленные строки списка источников в формате JSON;
+* `POST /render?citation=gost` – файл Word с оформленным списком источников.
+
+Тело запроса `POST` – рабочая книга Excel (тип содержимого `XLSX_TYPE`, по умолчанию)
+или JSON (`Content-Type: application/json`): массив записей с типом источника в ключе `type`
+и значениями по наименованиям атрибутов моделей (как в строках файла JSON Lines)
+либо объект с таким массивом в ключе `sources`.
+"""
+import asyncio
+import json
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import click
+
+from logger import get_logger
+from settings import SERVER_HEAD_TIMEOUT, SERVER_HOST, SERVER_MAX_BODY, SERVER_PORT, SERVER_QUEUE_SIZE, SERVER_WORKERS
+
+logger = get_logger(__name__)
+
+# типы содержимого запросов и ответов
+JSON_TYPE = "application/json"
+XLSX_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# ответ сервиса: (код состояния, тип содержимого, тело ответа)
+Response = tuple[HTTPStatus, str, bytes]
+
+
+def warm_up() -> None:
+    """
+    Загрузка модулей чтения, форматирования и генерации файлов в процессе пула.
+    """
+
+    # pylint: disable=import-outside-toplevel,unused-import
+    import docx  # noqa: F401
+    import openpyxl  # noqa: F401
+
+    from formatters.registry import FORMATTERS, get_formatter
+
+    for citation in FORMATTERS:
+        get_formatter(citation)
+
+
+def read_payload(content_type: str, body: bytes) -> list:
+    """
+    Чтение моделей из тела запроса.
+
+    :param content_type: Тип содержимого запроса.
+    :param body: Тело запроса.
+    :return: Список прочитанных моделей.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from readers.reader import SourcesReader
+    from readers.text import TYPE_FIELD, TextSourcesReader
+
+    if content_type == JSON_TYPE:
+        data = json.loads(body)
+        records = data.get("sources") if isinstance(data, dict) else data
+        if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+            raise ValueError("Тело запроса должно содержать массив объектов JSON.")
+
+        reader = TextSourcesReader("", SourcesReader.readers)
+        rows = ((number, record.get(TYPE_FIELD), record) for number, record in enumerate(records, start=1))
+
+        return list(reader.iter_records(rows, "запроса"))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "input.xlsx"
+        path.write_bytes(body)
+
+        try:
+            return SourcesReader(str(path)).read()
+        except (zipfile.BadZipFile, KeyError) as ex:
+            raise ValueError("Тело запроса не является рабочей книгой Excel с листами шаблона.") from ex
+
+
+def format_payload(content_type: str, body: bytes, citation: str) -> list[str]:
+    """
+    Форматирование списка источников из тела запроса (выполняется в процессе пула).
+
+    :param content_type: Тип содержимого запроса.
+    :param body: Тело запроса.
+    :param citation: Стиль цитирования.
+    :return: Оформленные строки в порядке сортировки.
+    """
+
+    from formatters.registry import get_formatter  # pylint: disable=import-outside-toplevel
+
+    formatter = get_formatter(citation)
+    models = read_payload(content_type, body)
+
+    return [str(item) for item in formatter(models, compact=True).format()]
+
+
+def render_payload(content_type: str, body: bytes, citation: str) -> bytes:
+    """
+    Генерация файла Word по телу запроса (выполняется в процессе пула).
+
+    :param content_type: Тип содержимого запроса.
+    :param body: Тело запроса.
+    :param citation: Стиль цитирования.
+    :return: Содержимое файла Word.
+    """
+
+    from renderer import StreamingRenderer  # pylint: disable=import-outside-toplevel
+
+    rows = format_payload(content_type, body, citation)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "output.docx"
+        StreamingRenderer(rows).render(path)
+
+        return path.read_bytes()
+
+
+class FormattingService:
+    """
+    HTTP-сервис форматирования библиографических списков.
+    """
+
+    # максимальный размер тела запроса в байтах
+    max_body = SERVER_MAX_BODY
+    # время ожидания строки запроса и заголовков в секундах
+    head_timeout = SERVER_HEAD_TIMEOUT
+
+    def __init__(
+        self,
+        host: str = SERVER_HOST,
+        port: int = SERVER_PORT,
+        workers: int = SERVER_WORKERS,
+        queue_size: int = SERVER_QUEUE_SIZE,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param host: Адрес для входящих соединений.
+        :param port: Порт для входящих соединений (0 – любой свободный порт).
+        :param workers: Количество процессов обработки запросов.
+        :param queue_size: Количество запросов, ожидающих свободный процесс; при заполнении очереди
+            новые запросы отклоняются с кодом 503.
+        """
+
+        self.host = host
+        self.port = port
+        self.workers = workers
+        # количество принятых запросов, которые обрабатываются или ожидают свободный процесс
+        self.capacity = workers + queue_size
+        self.pending = 0
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """
+        Запуск пула процессов и прием входящих соединений.
+        """
+
+        loop = asyncio.get_running_loop()
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        # процессы пула запускаются и загружают модули до приема первого запроса
+        await asyncio.gather(*(loop.run_in_executor(self.executor, warm_up) for _ in range(self.workers)))
+
+        self.server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        logger.info("Сервис запущен: http://%s:%s (процессов: %s).", self.host, self.port, self.workers)
+
+    async def stop(self) -> None:
+        """
+        Остановка приема соединений и пула процессов.
+        """
+
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+        logger.info("Сервис остановлен.")
+
+    async def serve_forever(self) -> None:
+        """
+        Запуск сервиса до прерывания.
+        """
+
+        await self.start()
+        try:
+            if self.server is None:
+                raise RuntimeError("Сервис не запущен.")
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Обработка соединения: чтение запроса, вызов обработчика и отправка ответа.
+
+        После ответа соединение закрывается.
+
+        :param reader: Поток чтения соединения.
+        :param writer: Поток записи соединения.
+        """
+
+        try:
+            try:
+                status, content_type, body = await self.respond(reader)
+            except (asyncio.IncompleteReadError, ValueError) as ex:
+                status, content_type, body = self.error(HTTPStatus.BAD_REQUEST, str(ex))
+            except asyncio.TimeoutError:
+                status, content_type, body = self.error(
+                    HTTPStatus.REQUEST_TIMEOUT, "Превышено время ожидания строки запроса и заголовков."
+                )
+
+            headers = [
+                f"HTTP/1.1 {status.value} {status.phrase}",
+                f"Content-Type: {content_type}",
+                f"Content-Length: {len(body)}",
+                "Connection: close",
+            ]
+            if status == HTTPStatus.SERVICE_UNAVAILABLE:
+                headers.append("Retry-After: 1")
+
+            writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+            await writer.drain()
+        except ConnectionError:
+            logger.warning("Соединение закрыто клиентом до отправки ответа.")
+        finally:
+            writer.close()
+
+    async def respond(self, reader: asyncio.StreamReader) -> Response:
+        """
+        Чтение запроса и получение ответа.
+
+        :param reader: Поток чтения соединения.
+        :return: Ответ сервиса.
+        """
+
+        # клиент, не отправивший заголовки полностью, не занимает соединение дольше `head_timeout`
+        method, target, headers = await asyncio.wait_for(self.read_head(reader), self.head_timeout)
+        url = urlsplit(target)
+        response = self.precheck(method, url.path, headers)
+        if response is not None:
+            return response
+
+        self.pending += 1
+        try:
+            body = await reader.readexactly(int(headers.get("content-length", "0")))
+            content_type = headers.get("content-type", XLSX_TYPE).split(";")[0].strip()
+            citation = parse_qs(url.query).get("citation", ["GOST"])[0]
+
+            return await self.process(url.path, content_type, body, citation)
+        finally:
+            self.pending -= 1
+
+    @staticmethod
+    async def read_head(reader: asyncio.StreamReader) -> tuple[str, str, dict[str, str]]:
+        """
+        Чтение строки запроса и заголовков.
+
+        :param reader: Поток чтения соединения.
+        :return: Метод, адрес запроса и заголовки (наименования в нижнем регистре).
+        """
+
+        method, target, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+        headers = {}
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        return method, target, headers
+
+    def precheck(self, method: str, path: str, headers: dict[str, str]) -> Optional[Response]:
+        """
+        Получение ответа, для которого не требуется тело запроса: состояние сервиса или ошибка запроса.
+
+        Запрос отклоняется до чтения тела, если метод не найден, тело слишком велико или очередь заполнена.
+
+        :param method: Метод запроса.
+        :param path: Путь запроса.
+        :param headers: Заголовки запроса.
+        :return: Ответ сервиса (`None`, если запрос нужно обработать в пуле процессов).
+        """
+
+        if path == "/health":
+            return self.json(HTTPStatus.OK, {"status": "ok", "pending": self.pending, "capacity": self.capacity})
+
+        if path not in ("/format", "/render"):
+            return self.error(HTTPStatus.NOT_FOUND, f"Метод {path} не найден.")
+        if method != "POST":
+            return self.error(HTTPStatus.METHOD_NOT_ALLOWED, "Поддерживается только метод POST.")
+        if int(headers.get("content-length", "0")) > self.max_body:
+            return self.error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Превышен размер тела запроса.")
+        if self.pending >= self.capacity:
+            return self.error(HTTPStatus.SERVICE_UNAVAILABLE, "Сервис перегружен, повторите запрос позже.")
+
+        return None
+
+    async def process(self, path: str, content_type: str, body: bytes, citation: str) -> Response:
+        """
+        Обработка тела запроса в пуле процессов.
+
+        :param path: Путь запроса (`/format` или `/render`).
+        :param content_type: Тип содержимого запроса.
+        :param body: Тело запроса.
+        :param citation: Стиль цитирования.
+        :return: Ответ сервиса.
+        """
+
+        function = format_payload if path == "/format" else render_payload
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(self.executor, function, content_type, body, citation)
+        except ValueError as ex:
+            return self.error(HTTPStatus.BAD_REQUEST, str(ex))
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.error("При обработке запроса возникла ошибка: %s", ex)
+            return self.error(HTTPStatus.INTERNAL_SERVER_ERROR, "Внутренняя ошибка сервиса.")
+
+        if isinstance(result, bytes):
+            return HTTPStatus.OK, DOCX_TYPE, result
+
+        return self.json(HTTPStatus.OK, {"citation": citation, "entries": result})
+
+    @staticmethod
+    def json(status: HTTPStatus, data: Any) -> Response:
+        """
+        Получение ответа в формате JSON.
+
+        :param status: Код состояния.
+        :param data: Данные ответа.
+        :return: Ответ сервиса.
+        """
+
+        return status, f"{JSON_TYPE}; charset=utf-8", json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    @classmethod
+    def error(cls, status: HTTPStatus, message: str) -> Response:
+        """
+        Получение ответа с описанием ошибки.
+
+        :param status: Код состояния.
+        :param message: Описание ошибки.
+        :return: Ответ сервиса.
+        """
+
+        return cls.json(status, {"error": message})
+
+
+@click.command()
+@click.option("--host", "host", type=str, default=SERVER_HOST, show_default=True, help="Адрес сервиса")
+@click.option("--port", "-p", "port", type=int, default=SERVER_PORT, show_default=True, help="Порт сервиса")
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=1),
+    default=SERVER_WORKERS,
+    show_default=True,
+    help="Количество процессов обработки запросов",
+)
+@click.option(
+    "--queue-size",
+    "queue_size",
+    type=click.IntRange(min=0),
+    default=SERVER_QUEUE_SIZE,
+    show_default=True,
+    help="Количество запросов, ожидающих свободный процесс (при заполнении очереди – ответ 503)",
+)
+def serve(
+    host: str = SERVER_HOST,
+    port: int = SERVER_PORT,
+    workers: int = SERVER_WORKERS,
+    queue_size: int = SERVER_QUEUE_SIZE,
+) -> None:
+    """
+    Запуск HTTP-сервиса форматирования библиографических списков.
+
+    :param str host: Адрес сервиса
+    :param int port: Порт сервиса
+    :param int workers: Количество процессов обработки запросов
+    :param int queue_size: Количество запросов, ожидающих свободный процесс
+    """
+
+    service = FormattingService(host, port, workers, queue_size)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    serve()  # pylint: disable=no-value-for-parameter
@@ -14,9 +14,62 @@ OUTPUT_FILE_PATH: str = os.getenv("OUTPUT_FILE_PATH", "../media/output.docx")
 
 # путь к директории для логирования
 LOGGING_PATH: str = os.getenv("LOGGING_PATH", "../logs")
+# наименование файла логов (общий для всех модулей)
+LOGGING_FILE: str = os.getenv("LOGGING_FILE", "app.log")
 # формат для записей логов
 LOGGING_FORMAT: str = os.getenv(
     "LOGGING_FORMAT", "%(name)s %(asctime)s %(levelname)s %(message)s"
 )
 # уровень логирования
 LOGGING_LEVEL: str = os.getenv("LOGGING_LEVEL", "INFO")
+# уровни логирования отдельных модулей (пакетов) в формате `модуль=УРОВЕНЬ` через запятую
+LOGGING_LEVELS: str = os.getenv("LOGGING_LEVELS", "")
+# неблокирующая запись логов через очередь и фоновый поток
+LOGGING_QUEUE: bool = os.getenv("LOGGING_QUEUE", "true").lower() in ("1", "true", "yes")
+# количество обработанных записей между сообщениями о прогрессе
+LOGGING_PROGRESS_STEP: int = int(os.getenv("LOGGING_PROGRESS_STEP", "10000"))
+
+# количество процессов для параллельного чтения листов входного файла
+READER_WORKERS: int = int(os.getenv("READER_WORKERS", "1"))
+
+# директория постоянного кэша оформленных источников (пустое значение – форматирование без кэша);
+# кэш ускоряет только стили, оформление в которых дороже получения строки из кэша
+CACHE_DIR: str = os.getenv("CACHE_DIR", "")
+# максимальное количество записей в кэше оформленных источников
+CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "1000000"))
+# количество накопленных изменений кэша, при котором они записываются в файл
+CACHE_FLUSH_SIZE: int = int(os.getenv("CACHE_FLUSH_SIZE", "10000"))
+
+# количество источников в одном отсортированном фрагменте внешней сортировки (потоковый режим)
+SORT_RUN_SIZE: int = int(os.getenv("SORT_RUN_SIZE", "100000"))
+# директория временных файлов внешней сортировки (пустое значение – системная временная директория)
+SORT_TEMP_DIR: str = os.getenv("SORT_TEMP_DIR", "")
+
+# минимальное сходство названий почти совпадающих источников при удалении повторов (от 0 до 1)
+DEDUP_THRESHOLD: float = float(os.getenv("DEDUP_THRESHOLD", "0.8"))
+
+# количество источников, начиная с которого форматирование выполняется по столбцам (0 – всегда по объектам)
+FORMAT_COLUMNS_THRESHOLD: int = int(os.getenv("FORMAT_COLUMNS_THRESHOLD", "10000"))
+# количество источников, начиная с которого форматирование выполняется в пуле процессов (0 – без пула)
+FORMAT_PARALLEL_THRESHOLD: int = int(os.getenv("FORMAT_PARALLEL_THRESHOLD", "200000"))
+# количество процессов для параллельного форматирования (0 – по количеству процессоров)
+FORMAT_WORKERS: int = int(os.getenv("FORMAT_WORKERS", "0"))
+# количество источников, форматируемых одним процессом за одно задание
+FORMAT_CHUNK_SIZE: int = int(os.getenv("FORMAT_CHUNK_SIZE", "50000"))
+
+# количество источников в одном пакете конвейерной обработки
+PIPELINE_BATCH_SIZE: int = int(os.getenv("PIPELINE_BATCH_SIZE", "10000"))
+# количество пакетов в очереди между чтением и форматированием при конвейерной обработке
+PIPELINE_QUEUE_SIZE: int = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))
+
+# адрес и порт HTTP-сервиса форматирования
+SERVER_HOST: str = os.getenv("SERVER_HOST", "127.0.0.1")
+SERVER_PORT: int = int(os.getenv("SERVER_PORT", "8080"))
+# количество процессов обработки запросов HTTP-сервиса
+SERVER_WORKERS: int = int(os.getenv("SERVER_WORKERS", "2"))
+# количество запросов, ожидающих свободный процесс (при заполнении очереди – ответ 503)
+SERVER_QUEUE_SIZE: int = int(os.getenv("SERVER_QUEUE_SIZE", "16"))
+# максимальный размер тела запроса в байтах
+SERVER_MAX_BODY: int = int(os.getenv("SERVER_MAX_BODY", str(50 * 1024 * 1024)))
+# время ожидания строки запроса и заголовков в секундах (после него – ответ 408)
+SERVER_HEAD_TIMEOUT: float = float(os.getenv("SERVER_HEAD_TIMEOUT", "30"))
@@ -0,0 +1,93 @@
+"""
+Тестирование функций оформления списка источников по стилю APA (American Psychological Association).
+"""
+
+from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
+from formatters.styles.base import FormatOptions
+from formatters.styles.apa import APABook, APAInternetResource, APACollectionArticle, APACitationFormatter
+
+
+class TestAPA:
+    """
+    Тестирование оформления списка источников по стилю APA.
+    """
+
+    def test_book(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование форматирования книги.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :return:
+        """
+
+        model = APABook(book_model_fixture)
+
+        assert model.formatted == "Иванов И.М., Петров С.Н. (2020). Наука как искусство (3-е ed.). Просвещение."
+
+        # издание не указывается, если оно не задано
+        assert "ed." not in APABook(book_model_fixture.copy(update={"edition": None})).formatted
+
+    def test_internet_resource(self, internet_resource_model_fixture: InternetResourceModel) -> None:
+        """
+        Тестирование форматирования интернет-ресурса.
+
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :return:
+        """
+
+        model = APAInternetResource(internet_resource_model_fixture)
+
+        assert (
+            model.formatted
+            == "Наука как искусство. (n.d.). Ведомости. Retrieved 01.01.2021, from https://www.vedomosti.ru"
+        )
+
+    def test_articles_collection(self, articles_collection_model_fixture: ArticlesCollectionModel) -> None:
+        """
+        Тестирование форматирования сборника статей.
+
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        :return:
+        """
+
+        model = APACollectionArticle(articles_collection_model_fixture)
+
+        assert (
+            model.formatted
+            == "Иванов И.М., Петров С.Н. (2020). Наука как искусство. In Сборник научных трудов (pp. 25-30). АСТ."
+        )
+
+    def test_citation_formatter(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование функции итогового форматирования списка источников.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        :return:
+        """
+
+        models = [
+            book_model_fixture,
+            internet_resource_model_fixture,
+            book_model_fixture.copy(update={"edition": None}),
+            articles_collection_model_fixture,
+        ]
+        result = [
+            str(item) for item in APACitationFormatter(models, options=FormatOptions(columns_threshold=0)).format()
+        ]
+
+        # форматирование по столбцам совпадает с форматированием по объектам
+        assert [
+            str(item) for item in APACitationFormatter(models, options=FormatOptions(columns_threshold=1)).format()
+        ] == result
+
+        # тестирование сортировки списка источников: книги и статья тех же авторов упорядочены по тексту после года,
+        # интернет-ресурс без авторов – последний
+        formatted = [str(item) for item in APACitationFormatter(models).formatted_items]
+        assert result == [formatted[index] for index in [0, 3, 2, 1]]
@@ -0,0 +1,63 @@
+"""
+Тестирование базовых функций оформления списка источников.
+"""
+from string import Template
+
+import pytest
+
+from formatters.styles.base import CompiledTemplate
+
+
+class TestCompiledTemplate:
+    """
+    Тестирование скомпилированного шаблона.
+    """
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "$authors $title. – $edition$city: $publishing_house, $year. – $pages с.",
+            "${article}{} // $$website {$link}",
+            "без подстановок",
+        ],
+    )
+    def test_substitute(self, template: str) -> None:
+        """
+        Тестирование совпадения результата подстановки со `string.Template`.
+
+        :param str template: Строка шаблона
+        """
+
+        values = {
+            "authors": "Иванов И.М.",
+            "title": "Наука как искусство",
+            "edition": "",
+            "city": "СПб.",
+            "publishing_house": "АСТ",
+            "year": 2020,
+            "pages": 999,
+            "article": "Наука",
+            "link": "https://www.vedomosti.ru",
+        }
+
+        compiled = CompiledTemplate(template)
+        assert isinstance(compiled, Template)
+        assert compiled.substitute(values) == Template(template).substitute(values)
+        assert compiled.substitute(**values) == Template(template).substitute(**values)
+        assert compiled.substitute(values, year=2021) == Template(template).substitute(values, year=2021)
+
+        # форматирование по столбцам совпадает с подстановкой значений в каждой строке
+        columns = {name: [value, f"{{{value}}}", None] for name, value in values.items()}
+        rows = [dict(zip(columns, row)) for row in zip(*columns.values())]
+        assert compiled.substitute_columns(columns) == [Template(template).substitute(row) for row in rows]
+
+    def test_errors(self) -> None:
+        """
+        Тестирование ошибок подстановки.
+        """
+
+        with pytest.raises(KeyError):
+            CompiledTemplate("$authors").substitute()
+
+        with pytest.raises(ValueError):
+            CompiledTemplate("$ authors")
@@ -0,0 +1,158 @@
+"""
+Тестирование постоянного кэша оформленных источников.
+"""
+import os
+from pathlib import Path
+
+import pytest
+
+from formatters.cache import CitationCache
+from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
+from formatters.styles.base import CompiledTemplate, FormatOptions
+from formatters.styles.gost import GOSTBook, GOSTCitationFormatter
+
+
+class TestCitationCache:
+    """
+    Тестирование постоянного кэша оформленных источников.
+    """
+
+    def test_formatter(
+        self,
+        tmp_path: Path,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование форматирования с использованием кэша в нескольких запусках.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        """
+
+        models = [book_model_fixture, internet_resource_model_fixture, articles_collection_model_fixture]
+        expected = [str(item) for item in GOSTCitationFormatter(models).format()]
+
+        cache = CitationCache(tmp_path)
+        assert [str(item) for item in GOSTCitationFormatter(models, cache=cache).format()] == expected
+        cache.close()
+        assert (cache.hits, cache.misses) == (0, 3)
+
+        # повторный запуск использует сохраненные строки
+        cache = CitationCache(tmp_path)
+        assert [str(item) for item in GOSTCitationFormatter(models, compact=True, cache=cache).format()] == expected
+        cache.close()
+        assert (cache.hits, cache.misses) == (3, 0)
+
+    def test_formatter_columns(
+        self,
+        tmp_path: Path,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование форматирования по столбцам (в том числе в пуле процессов)
+        только отсутствующих в кэше источников.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        """
+
+        models = [book_model_fixture, internet_resource_model_fixture, articles_collection_model_fixture]
+        expected = [str(item) for item in GOSTCitationFormatter(models).formatted_items]
+        # пул процессов используется и на машине с одним процессором
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(os, "cpu_count", lambda: 2)
+            for name, options in (
+                ("columns", FormatOptions(columns_threshold=1, parallel_threshold=0)),
+                ("parallel", FormatOptions(parallel_threshold=1, workers=2)),
+            ):
+                cache = CitationCache(tmp_path / name)
+                GOSTCitationFormatter(models[:1], cache=cache, options=options)
+                cache.close()
+
+                cache = CitationCache(tmp_path / name)
+                for compact in (False, True):
+                    formatter = GOSTCitationFormatter(models, compact=compact, cache=cache, options=options)
+                    assert [str(item) for item in formatter.formatted_items] == expected
+                cache.close()
+                # отсутствующие источники отформатированы в первом проходе и добавлены в кэш
+                assert (cache.hits, cache.misses) == (4, 2)
+
+    def test_template(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование повторного форматирования после изменения шаблона стиля.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param MonkeyPatch monkeypatch: Фикстура для временной замены атрибутов
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        cache = CitationCache(tmp_path)
+        GOSTCitationFormatter([book_model_fixture], cache=cache)
+        cache.close()
+
+        monkeypatch.setattr(GOSTBook, "template", CompiledTemplate("NEW $authors $title"))
+        cache = CitationCache(tmp_path)
+        formatter = GOSTCitationFormatter([book_model_fixture], cache=cache)
+        cache.close()
+
+        # строка, оформленная по прежнему шаблону, не используется
+        assert [str(item) for item in formatter.formatted_items] == ["NEW Иванов И.М., Петров С.Н. Наука как искусство"]
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    def test_eviction(self, tmp_path: Path, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование вытеснения давно не использованных записей.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        keys = [CitationCache.key(GOSTBook, book_model_fixture.copy(update={"pages": pages})) for pages in (1, 2, 3)]
+        assert len(set(keys)) == 3
+
+        cache = CitationCache(tmp_path, max_entries=2)
+        # время использования обновляется при каждом обращении
+        cache.access_resolution = 0.0
+        cache.set(keys[0], "первая")
+        cache.set(keys[1], "вторая")
+        cache.flush()
+
+        # использование первой записи делает вторую наиболее давно использованной
+        assert cache.get(keys[0]) == "первая"
+        cache.set(keys[2], "третья")
+        cache.close()
+
+        cache = CitationCache(tmp_path, max_entries=2)
+        assert cache.get(keys[0]) == "первая"
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) == "третья"
+        cache.close()
+
+    def test_batches(self, tmp_path: Path, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование пакетного получения записей и записи изменений при накоплении `flush_size`.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        keys = [CitationCache.key(GOSTBook, book_model_fixture.copy(update={"pages": pages})) for pages in range(5)]
+
+        cache = CitationCache(tmp_path, flush_size=2)
+        cache.batch_size = 2
+        for key in keys[:3]:
+            cache.set(key, key)
+        # изменения записаны в файл без вызова `flush()`
+        assert len(cache.pending) == 1
+
+        assert cache.get_many(keys) == {key: key for key in keys[:3]}
+        assert (cache.hits, cache.misses) == (3, 2)
+        cache.close()
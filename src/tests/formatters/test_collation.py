@@ -0,0 +1,58 @@
+"""
+Тестирование сортировки оформленных источников.
+"""
+import pytest
+
+from formatters.collation import CYRILLIC, LATIN, OTHER, collation_key, get_script
+
+
+class TestCollation:
+    """
+    Тестирование ключа сортировки оформленных источников.
+    """
+
+    @pytest.mark.parametrize(
+        "text, script",
+        [
+            ("Иванов И.М. Наука как искусство.", CYRILLIC),
+            ("«Ёжик в тумане» // Мультфильмы", CYRILLIC),
+            ("Smith J. The art of science.", LATIN),
+            ("2020 – Élan vital", LATIN),
+            ("Σοφία", OTHER),
+            ("2020", OTHER),
+        ],
+    )
+    def test_script(self, text: str, script: int) -> None:
+        """
+        Тестирование определения группы письменности по первой букве.
+
+        :param str text: Текст
+        :param int script: Ожидаемая группа письменности
+        """
+
+        assert get_script(text) == script
+
+    def test_sort(self) -> None:
+        """
+        Тестирование порядка сортировки.
+        """
+
+        items = [
+            "Smith J. Science.",
+            "ежов А.А. Поэзия.",
+            "Ёлкин В.В. Лес.",
+            "Абрамов Б.Б. Степь.",
+            "adams D. Towels.",
+            "Ежов А.А. Поэзия.",
+            '"Борисов" // Сайт',
+        ]
+
+        assert sorted(items, key=collation_key) == [
+            "Абрамов Б.Б. Степь.",
+            '"Борисов" // Сайт',
+            "Ежов А.А. Поэзия.",
+            "ежов А.А. Поэзия.",
+            "Ёлкин В.В. Лес.",
+            "adams D. Towels.",
+            "Smith J. Science.",
+        ]
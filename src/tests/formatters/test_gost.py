@@ -2,9 +2,16 @@
 Тестирование функций оформления списка источников по ГОСТ Р 7.0.5-2008.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from pydantic import BaseModel
+
 from formatters.base import BaseCitationFormatter
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
-from formatters.styles.gost import GOSTBook, GOSTInternetResource, GOSTCollectionArticle
+from formatters.styles.base import FormatOptions, FormattedEntry
+from formatters.styles.gost import GOSTBook, GOSTInternetResource, GOSTCollectionArticle, GOSTCitationFormatter
 
 
 class TestGOST:
@@ -87,3 +94,135 @@ class TestGOST:
         assert result[0] == models[2]
         assert result[1] == models[0]
         assert result[2] == models[1]
+
+    def test_citation_formatter_compact(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование итогового форматирования с компактным хранением записей.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        :return:
+        """
+
+        models = [book_model_fixture, internet_resource_model_fixture, articles_collection_model_fixture]
+        result = GOSTCitationFormatter(models, compact=True).format()
+
+        # компактные записи не хранят исходные модели
+        assert all(isinstance(item, FormattedEntry) and not hasattr(item, "data") for item in result)
+        assert [str(item) for item in result] == [str(item) for item in GOSTCitationFormatter(models).format()]
+
+    def test_citation_formatter_columns(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование форматирования по столбцам.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        :return:
+        """
+
+        models = [
+            book_model_fixture,
+            internet_resource_model_fixture,
+            book_model_fixture.copy(update={"edition": None}),
+            articles_collection_model_fixture,
+        ]
+        expected = [
+            str(item)
+            for item in GOSTCitationFormatter(models, options=FormatOptions(columns_threshold=0)).formatted_items
+        ]
+
+        # результат совпадает с форматированием по объектам с сохранением порядка моделей
+        assert GOSTCitationFormatter.format_models(models) == expected
+        for compact in (False, True):
+            formatter = GOSTCitationFormatter(models, compact=compact, options=FormatOptions(columns_threshold=1))
+            assert [str(item) for item in formatter.formatted_items] == expected
+
+    def test_citation_formatter_batches(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование форматирования генератора моделей по столбцам частями.
+
+        :param MonkeyPatch monkeypatch: Фикстура для временной замены атрибутов
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        """
+
+        models = [
+            book_model_fixture.copy(update={"title": f"Наука {index}"}) for index in range(5)
+        ] + [internet_resource_model_fixture, articles_collection_model_fixture]
+        expected = [str(item) for item in GOSTCitationFormatter(models).formatted_items]
+
+        batches: list[int] = []
+        format_models = GOSTCitationFormatter.format_models
+
+        def count_batch(batch: list[BaseModel]) -> list[str]:
+            batches.append(len(batch))
+            return format_models(batch)
+
+        monkeypatch.setattr(GOSTCitationFormatter, "batch_size", 3)
+        monkeypatch.setattr(GOSTCitationFormatter, "format_models", count_batch)
+        formatter = GOSTCitationFormatter(iter(models), compact=True, options=FormatOptions(columns_threshold=3))
+
+        # по столбцам форматируются части не больше `batch_size`, начиная с `columns_threshold` прочитанных моделей
+        assert [str(item) for item in formatter.formatted_items] == expected
+        assert batches == [3, 3, 1]
+
+    def test_citation_formatter_parallel(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование форматирования по столбцам в пуле процессов.
+
+        :param MonkeyPatch monkeypatch: Фикстура для временной замены атрибутов
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        :return:
+        """
+
+        models = [
+            book_model_fixture.copy(update={"title": f"Наука {index}", "edition": None if index % 2 else "2-е"})
+            for index in range(5)
+        ] + [internet_resource_model_fixture, articles_collection_model_fixture]
+        formatter = GOSTCitationFormatter(models, options=FormatOptions(columns_threshold=0, parallel_threshold=0))
+        expected = [(item.sort_key, str(item)) for item in formatter.formatted_items]
+
+        # результат и порядок совпадают с форматированием в текущем процессе
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            assert GOSTCitationFormatter.format_parallel(models, executor, chunk_size=2) == expected
+
+        # количество процессов не превышает количество процессоров
+        monkeypatch.setattr(os, "cpu_count", lambda: 1)
+        formatter = GOSTCitationFormatter(models, options=FormatOptions(parallel_threshold=1, workers=2))
+        assert [(item.sort_key, str(item)) for item in formatter.formatted_items] == expected
+
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(GOSTCitationFormatter, "batch_size", 2)
+        for compact in (False, True):
+            formatter = GOSTCitationFormatter(
+                models, compact=compact, options=FormatOptions(parallel_threshold=1, workers=2)
+            )
+            assert [(item.sort_key, str(item)) for item in formatter.formatted_items] == expected
+            assert [str(item) for item in formatter.format()] == [text for _, text in sorted(expected)]
@@ -0,0 +1,90 @@
+"""
+Тестирование функций оформления списка источников по стилю MLA (Modern Language Association).
+"""
+
+from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
+from formatters.styles.base import FormatOptions
+from formatters.styles.mla import MLABook, MLAInternetResource, MLACollectionArticle, MLACitationFormatter
+
+
+class TestMLA:
+    """
+    Тестирование оформления списка источников по стилю MLA.
+    """
+
+    def test_book(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование форматирования книги.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :return:
+        """
+
+        model = MLABook(book_model_fixture)
+
+        assert model.formatted == "Иванов И.М., Петров С.Н. Наука как искусство. 3-е ed., Просвещение, 2020."
+
+        # издание не указывается, если оно не задано
+        assert "ed." not in MLABook(book_model_fixture.copy(update={"edition": None})).formatted
+
+    def test_internet_resource(self, internet_resource_model_fixture: InternetResourceModel) -> None:
+        """
+        Тестирование форматирования интернет-ресурса.
+
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :return:
+        """
+
+        model = MLAInternetResource(internet_resource_model_fixture)
+
+        assert model.formatted == '"Наука как искусство." Ведомости, https://www.vedomosti.ru. Accessed 01.01.2021.'
+
+    def test_articles_collection(self, articles_collection_model_fixture: ArticlesCollectionModel) -> None:
+        """
+        Тестирование форматирования сборника статей.
+
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        :return:
+        """
+
+        model = MLACollectionArticle(articles_collection_model_fixture)
+
+        assert (
+            model.formatted
+            == 'Иванов И.М., Петров С.Н. "Наука как искусство." Сборник научных трудов, АСТ, 2020, pp. 25-30.'
+        )
+
+    def test_citation_formatter(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование функции итогового форматирования списка источников.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        :return:
+        """
+
+        models = [
+            book_model_fixture,
+            internet_resource_model_fixture,
+            book_model_fixture.copy(update={"edition": None}),
+            articles_collection_model_fixture,
+        ]
+        result = [
+            str(item) for item in MLACitationFormatter(models, options=FormatOptions(columns_threshold=0)).format()
+        ]
+
+        # форматирование по столбцам совпадает с форматированием по объектам
+        assert [
+            str(item) for item in MLACitationFormatter(models, options=FormatOptions(columns_threshold=1)).format()
+        ] == result
+
+        # тестирование сортировки списка источников: статья в сборнике (название в кавычках)
+        # предшествует книгам тех же авторов, интернет-ресурс без авторов – последний
+        formatted = [str(item) for item in MLACitationFormatter(models).formatted_items]
+        assert result == [formatted[index] for index in [3, 0, 2, 1]]
@@ -0,0 +1,42 @@
+"""
+Тестирование реестра стилей цитирования.
+"""
+import pytest
+
+from formatters.enums import CitationEnum
+from formatters.registry import get_formatter
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.gost import GOSTCitationFormatter
+from formatters.styles.mla import MLACitationFormatter
+
+
+class TestRegistry:
+    """
+    Тестирование реестра стилей цитирования.
+    """
+
+    @pytest.mark.parametrize(
+        "citation, formatter",
+        [
+            (CitationEnum.GOST, GOSTCitationFormatter),
+            ("MLA", MLACitationFormatter),
+            ("apa", APACitationFormatter),
+        ],
+    )
+    def test_get_formatter(self, citation: CitationEnum | str, formatter: type) -> None:
+        """
+        Тестирование получения класса форматирования по стилю цитирования.
+
+        :param citation: Стиль цитирования
+        :param formatter: Ожидаемый класс итогового форматирования
+        """
+
+        assert get_formatter(citation) is formatter
+
+    def test_unknown(self) -> None:
+        """
+        Тестирование ошибки для неизвестного стиля цитирования.
+        """
+
+        with pytest.raises(ValueError):
+            get_formatter("Chicago")
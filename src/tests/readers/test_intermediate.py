@@ -0,0 +1,92 @@
+"""
+Тестирование промежуточного колоночного формата прочитанных источников.
+"""
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from docx import Document
+from pydantic import ValidationError
+
+from formatters.models import BookModel
+from main import process_input
+from pipeline import GenerateOptions, generate
+from readers.intermediate import IntermediateFile, read_intermediate, write_intermediate
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestIntermediate:
+    """
+    Тестирование промежуточного колоночного формата прочитанных источников.
+    """
+
+    def test_roundtrip(self, tmp_path: Path, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование сохранения и чтения моделей, в том числе с пустыми значениями.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        path = tmp_path / "sources.bibcol"
+        models = SourcesReader(TEMPLATE_FILE_PATH).read()
+        # книги расположены на первом листе, поэтому порядок моделей при восстановлении не меняется
+        models.insert(0, book_model_fixture.copy(update={"edition": None, "title": "Ёлка 🎄"}))
+
+        assert write_intermediate(models, path) == models
+        assert list(read_intermediate(path)) == models
+
+        with IntermediateFile(path) as source:
+            assert source.rows("Книга") == 5
+            assert source.column("Книга", "edition")[0] is None
+            assert source.column("Книга", "title")[0] == "Ёлка 🎄"
+            assert source.column("Книга", "year")[0] == 2020
+
+    def test_invalid(self, tmp_path: Path) -> None:
+        """
+        Тестирование ошибки при чтении файла другого формата.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "sources.bibcol"
+        path.write_bytes(b"not an intermediate file")
+
+        with pytest.raises(ValueError):
+            list(read_intermediate(path))
+
+    def test_generate(self, tmp_path: Path) -> None:
+        """
+        Тестирование генерации из промежуточного файла без чтения входного файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path, intermediate = tmp_path / "output.docx", tmp_path / "sources.bibcol"
+        count = generate(TEMPLATE_FILE_PATH, path, GenerateOptions(dump_intermediate=str(intermediate)))
+
+        from_path = tmp_path / "from.docx"
+        assert generate("missing.xlsx", from_path, GenerateOptions(from_intermediate=str(intermediate))) == count
+        assert [item.text for item in Document(str(from_path)).paragraphs] == [
+            item.text for item in Document(str(path)).paragraphs
+        ]
+
+    @pytest.mark.parametrize("mode", ["streaming", "pipelined"])
+    def test_streaming_modes(self, tmp_path: Path, mode: str) -> None:
+        """
+        Тестирование отказа от сохранения промежуточного файла при потоковой и конвейерной обработке.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param str mode: Режим обработки
+        """
+
+        with pytest.raises(ValidationError, match="--dump-intermediate"):
+            GenerateOptions(dump_intermediate=str(tmp_path / "sources.bibcol"), **{mode: True})
+
+        result = CliRunner().invoke(
+            process_input, [f"--{mode}", "--dump-intermediate", str(tmp_path / "sources.bibcol")]
+        )
+        assert result.exit_code == 2
+        assert "--dump-intermediate" in result.output
+        assert not (tmp_path / "sources.bibcol").exists()
@@ -1,9 +1,12 @@
 """
 Тестирование функций чтения данных из источника.
 """
+import multiprocessing
+from datetime import date
 from typing import Any
 
 import pytest
+from pydantic import ValidationError
 
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
 from readers.reader import (
@@ -120,3 +123,84 @@ class TestReaders:
             InternetResourceModel.__name__,
             ArticlesCollectionModel.__name__,
         }
+
+    def test_sources_reader_streaming(self) -> None:
+        """
+        Тестирование потокового чтения всех моделей из источника.
+        """
+
+        reader = SourcesReader(TEMPLATE_FILE_PATH, streaming=True)
+        # в потоковом режиме рабочая книга не загружается в конструкторе
+        assert reader.workbook is None
+
+        models = reader.iter_models()
+        assert not isinstance(models, list)
+
+        # результат потокового чтения совпадает с обычным чтением
+        assert list(models) == SourcesReader(TEMPLATE_FILE_PATH).read()
+        assert reader.read() == SourcesReader(TEMPLATE_FILE_PATH).read()
+
+    def test_decoder(self) -> None:
+        """
+        Тестирование скомпилированного декодера строк.
+        """
+
+        reader = InternetResourceReader(None)
+        # декодер компилируется один раз для класса читателя
+        assert reader.decoder is InternetResourceReader(None).decoder
+
+        attrs = reader.decoder((" Наука как искусство ", "Ведомости", "https://www.vedomosti.ru", date(2021, 1, 1)))
+        assert attrs == {
+            "article": "Наука как искусство",
+            "website": "Ведомости",
+            "link": "https://www.vedomosti.ru",
+            "access_date": "01.01.2021",
+        }
+
+        # недостающие и пустые значения ячеек передаются без преобразования
+        assert reader.decoder(("Наука как искусство", "")) == {
+            "article": "Наука как искусство",
+            "website": "",
+            "link": None,
+            "access_date": None,
+        }
+
+    def test_sources_reader_parallel(self) -> None:
+        """
+        Тестирование параллельного чтения всех моделей из источника.
+        """
+
+        models = SourcesReader(TEMPLATE_FILE_PATH, workers=2).read()
+        # результат параллельного чтения совпадает с последовательным с сохранением порядка
+        assert models == SourcesReader(TEMPLATE_FILE_PATH).read()
+        assert [type(model) for model in models] == [type(model) for model in SourcesReader(TEMPLATE_FILE_PATH).read()]
+
+    def test_iter_parallel(self) -> None:
+        """
+        Тестирование запуска процессов чтения при вызове (до получения первой модели).
+        """
+
+        models = SourcesReader(TEMPLATE_FILE_PATH, workers=2).iter_parallel()
+        assert len(multiprocessing.active_children()) >= 2
+        assert list(models) == SourcesReader(TEMPLATE_FILE_PATH).read()
+
+    def test_trusted(self, workbook: Any) -> None:
+        """
+        Тестирование доверенного режима создания моделей.
+
+        :param workbook: Объект тестовой рабочей книги.
+        """
+
+        assert SourcesReader(TEMPLATE_FILE_PATH, trusted=True).read() == SourcesReader(TEMPLATE_FILE_PATH).read()
+
+        # корректные строки проходят быструю проверку
+        reader = BookReader(workbook, trusted=True)
+        rows = [row for row in workbook["Книга"].iter_rows(min_row=2, values_only=True) if row[0]]
+        assert all(reader.validator(reader.decoder(row)) for row in rows)
+
+        # строка с нарушением ограничений полей проходит полную валидацию с сообщением об ошибке
+        sheet = workbook["Книга"]
+        sheet.append(("Иванов И.М.", "Наука как искусство", None, "СПб.", "Просвещение", 0, 999))
+        assert not reader.validator(reader.decoder(next(sheet.iter_rows(min_row=sheet.max_row, values_only=True))))
+        with pytest.raises(ValidationError):
+            reader.read()
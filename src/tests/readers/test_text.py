@@ -0,0 +1,105 @@
+"""
+Тестирование чтения исходных данных из файлов CSV и JSON Lines.
+"""
+import csv
+import json
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from readers.reader import SourcesReader
+from readers.text import TYPE_FIELD
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestTextReaders:
+    """
+    Тестирование чтения исходных данных из файлов CSV и JSON Lines.
+    """
+
+    @pytest.fixture
+    def rows(self) -> dict[str, list[list]]:
+        """
+        Получение строк листов тестовой рабочей книги с датами в текстовом виде.
+
+        :return: Строки листов по наименованиям листов.
+        """
+
+        workbook: Any = SourcesReader(TEMPLATE_FILE_PATH).workbook
+        rows = {}
+        for reader in SourcesReader.readers:
+            sheet = reader(workbook).sheet  # type: ignore
+            rows[sheet] = [
+                [value.strftime("%d.%m.%Y") if isinstance(value, date) else value for value in row]
+                for row in workbook[sheet].iter_rows(min_row=2, values_only=True)
+                if row[0]
+            ]
+
+        return rows
+
+    @pytest.fixture
+    def expected(self) -> list[BaseModel]:
+        """
+        Получение моделей, прочитанных из тестовой рабочей книги.
+
+        :return: Список моделей.
+        """
+
+        return SourcesReader(TEMPLATE_FILE_PATH).read()
+
+    def test_csv_typed(self, tmp_path: Path, rows: dict[str, list[list]], expected: list[BaseModel]) -> None:
+        """
+        Тестирование чтения CSV-файла со столбцом типа источника.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param rows: Строки листов тестовой рабочей книги
+        :param expected: Модели, прочитанные из тестовой рабочей книги
+        """
+
+        path = tmp_path / "sources.csv"
+        with path.open("w", encoding="utf-8", newline="") as stream:
+            writer = csv.writer(stream)
+            writer.writerow([TYPE_FIELD, "Данные"])
+            for sheet, sheet_rows in rows.items():
+                writer.writerows([sheet, *row] for row in sheet_rows)
+                # пустые строки между источниками пропускаются
+                writer.writerow([])
+
+        reader = SourcesReader(str(path))
+        # рабочая книга для текстовых форматов не загружается
+        assert reader.workbook is None
+        assert reader.read() == expected
+
+    def test_jsonl_directory(self, tmp_path: Path, rows: dict[str, list[list]], expected: list[BaseModel]) -> None:
+        """
+        Тестирование чтения директории с файлами JSON Lines по типам источников.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param rows: Строки листов тестовой рабочей книги
+        :param expected: Модели, прочитанные из тестовой рабочей книги
+        """
+
+        for reader in SourcesReader.readers:
+            instance = reader()  # type: ignore
+            fields = [attr for attr, _ in sorted(instance.attributes.items(), key=lambda item: next(iter(item[1])))]
+            lines = [json.dumps(dict(zip(fields, row)), ensure_ascii=False) for row in rows[instance.sheet]]
+            (tmp_path / f"{instance.sheet}.jsonl").write_text("\n".join(lines) + "\n\n", encoding="utf-8")
+
+        assert list(SourcesReader(str(tmp_path), streaming=True).iter_models()) == expected
+        assert SourcesReader(str(tmp_path), workers=2).read() == expected
+
+    def test_unknown_type(self, tmp_path: Path) -> None:
+        """
+        Тестирование ошибки для строки с неизвестным типом источника.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "sources.jsonl"
+        path.write_text(json.dumps({TYPE_FIELD: "Диссертация", "title": "Наука"}, ensure_ascii=False), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Диссертация"):
+            SourcesReader(str(path)).read()
@@ -0,0 +1,80 @@
+"""
+Тестирование пакетной генерации библиографических списков.
+"""
+import shutil
+from pathlib import Path
+
+import pytest
+
+from batch import collect_tasks, run_batch
+from pipeline import GenerateOptions
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestBatch:
+    """
+    Тестирование пакетной генерации библиографических списков.
+    """
+
+    def test_collect_tasks(self, tmp_path: Path) -> None:
+        """
+        Тестирование получения списка файлов из директории и манифеста.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        (tmp_path / "b.xlsx").touch()
+        (tmp_path / "a.xlsx").touch()
+        (tmp_path / "~$a.xlsx").touch()
+        (tmp_path / "notes.txt").write_text("# комментарий\n\na.xlsx\nb.xlsx; result/b.docx\n", encoding="utf-8")
+
+        assert collect_tasks(tmp_path, "/output") == [
+            (str(tmp_path / "a.xlsx"), "/output/a.docx"),
+            (str(tmp_path / "b.xlsx"), "/output/b.docx"),
+        ]
+        assert collect_tasks(tmp_path / "notes.txt", "/output") == [
+            (str(tmp_path / "a.xlsx"), "/output/a.docx"),
+            (str(tmp_path / "b.xlsx"), str(tmp_path / "result" / "b.docx")),
+        ]
+
+    def test_collect_tasks_collisions(self, tmp_path: Path) -> None:
+        """
+        Тестирование выходных файлов для входных файлов с одинаковыми именами и разными расширениями.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        (tmp_path / "a.xlsx").touch()
+        (tmp_path / "a.csv").touch()
+        (tmp_path / "b.jsonl").touch()
+
+        assert collect_tasks(tmp_path, "/output") == [
+            (str(tmp_path / "a.csv"), "/output/a.csv.docx"),
+            (str(tmp_path / "a.xlsx"), "/output/a.xlsx.docx"),
+            (str(tmp_path / "b.jsonl"), "/output/b.docx"),
+        ]
+
+        # явно указанный в манифесте выходной файл совпадает с выходным файлом другого входного файла
+        (tmp_path / "notes.txt").write_text("a.xlsx\nb.jsonl; /output/a.docx\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="/output/a.docx"):
+            collect_tasks(tmp_path / "notes.txt", "/output")
+
+    def test_run_batch(self, tmp_path: Path) -> None:
+        """
+        Тестирование пакетной обработки с ошибкой в одном из файлов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        shutil.copy(TEMPLATE_FILE_PATH, tmp_path / "input.xlsx")
+        (tmp_path / "broken.xlsx").write_text("broken", encoding="utf-8")
+
+        results = run_batch(collect_tasks(tmp_path, tmp_path / "output"), options=GenerateOptions(trusted=True))
+
+        assert [(Path(result.path_input).name, result.success) for result in results] == [
+            ("broken.xlsx", False),
+            ("input.xlsx", True),
+        ]
+        assert results[0].error
+        assert results[1].entries == 8
+        assert (tmp_path / "output" / "input.docx").exists()
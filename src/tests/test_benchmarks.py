@@ -0,0 +1,44 @@
+"""
+Тестирование генерации синтетических рабочих книг для бенчмарков.
+"""
+from pathlib import Path
+
+from benchmarks.workbook import generate_workbook, parse_rows
+from formatters.models import ArticlesCollectionModel, BookModel
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestWorkbook:
+    """
+    Тестирование генерации синтетических рабочих книг.
+    """
+
+    def test_generate_workbook(self, tmp_path: Path) -> None:
+        """
+        Тестирование чтения синтетической рабочей книги.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "synthetic.xlsx"
+        written = generate_workbook(path, {"Книга": 25, "Интернет-ресурс": 3})
+
+        assert written == {"Книга": 25, "Интернет-ресурс": 3}
+        models = SourcesReader(str(path)).read()
+        books = [model for model in models if isinstance(model, BookModel)]
+        assert len(books) == 25
+        assert len({book.title for book in books}) == 25
+        # лист без указанного количества строк копируется из шаблона
+        collections = [
+            model for model in SourcesReader(TEMPLATE_FILE_PATH).read() if isinstance(model, ArticlesCollectionModel)
+        ]
+        assert len(models) - len(books) == 3 + len(collections)
+
+    def test_parse_rows(self) -> None:
+        """
+        Тестирование разбора количества строк.
+        """
+
+        assert parse_rows("1000") == 1000
+        assert parse_rows("Книга=10, Интернет-ресурс=2") == {"Книга": 10, "Интернет-ресурс": 2}
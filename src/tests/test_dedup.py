@@ -0,0 +1,84 @@
+"""
+Тестирование удаления повторяющихся источников.
+"""
+import logging
+
+import pytest
+
+from dedup import Deduplicator, Duplicate
+from formatters.models import BookModel, InternetResourceModel
+
+
+class TestDeduplicator:
+    """
+    Тестирование удаления повторяющихся источников.
+    """
+
+    def test_exact(self, book_model_fixture: BookModel, internet_resource_model_fixture: InternetResourceModel) -> None:
+        """
+        Тестирование удаления точных повторов с незначительными различиями в написании.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        """
+
+        variant = book_model_fixture.copy(update={"authors": "  ИВАНОВ И.М.,   Петров С.Н. "})
+        edited = book_model_fixture.copy(update={"year": 2021})
+        models = [book_model_fixture, internet_resource_model_fixture, variant, edited, book_model_fixture]
+
+        deduplicator = Deduplicator()
+
+        assert list(deduplicator.process(models)) == [book_model_fixture, internet_resource_model_fixture, edited]
+        assert deduplicator.duplicates == [Duplicate(kept=0, dropped=2), Duplicate(kept=0, dropped=4)]
+
+    def test_yo(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование сравнения без различия букв «ё» и «е».
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        first = book_model_fixture.copy(update={"authors": "Ёлкин В.В."})
+        second = book_model_fixture.copy(update={"authors": "Елкин В.В."})
+
+        assert list(Deduplicator().process([first, second])) == [first]
+
+    def test_near(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование удаления почти совпадающих источников по названиям.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        title = "Наука как искусство: очерки по методологии научного познания"
+        first = book_model_fixture.copy(update={"title": title})
+        typo = book_model_fixture.copy(update={"title": title.replace("методологии", "методолгии")})
+        other = book_model_fixture.copy(update={"title": "Искусство программирования"})
+        other_year = book_model_fixture.copy(update={"title": typo.title, "year": 2000})
+        models = [first, typo, other, other_year]
+
+        # без режима поиска почти совпадающих источников опечатка не считается повтором
+        assert list(Deduplicator().process(models)) == models
+
+        deduplicator = Deduplicator(near=True)
+        assert list(deduplicator.process(models)) == [first, other, other_year]
+        assert deduplicator.duplicates == [Duplicate(kept=0, dropped=1, near=True)]
+
+    def test_logging(self, book_model_fixture: BookModel, caplog: pytest.LogCaptureFixture) -> None:
+        """
+        Тестирование журнала: удаленные повторы выводятся с уровнем DEBUG, итог – одним сообщением INFO.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param LogCaptureFixture caplog: Фикстура записей журнала
+        """
+
+        caplog.set_level(logging.DEBUG, logger="dedup")
+        logging.disable(logging.NOTSET)
+        try:
+            list(Deduplicator().process([book_model_fixture] * 3))
+        finally:
+            logging.disable()
+
+        levels = [record.levelno for record in caplog.records if record.name == "dedup"]
+        assert levels == [logging.DEBUG, logging.DEBUG, logging.INFO]
+        assert "удалено повторов – 2" in caplog.records[-1].getMessage()
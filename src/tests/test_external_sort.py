@@ -0,0 +1,61 @@
+"""
+Тестирование внешней сортировки оформленных источников.
+"""
+from pathlib import Path
+
+from docx import Document
+
+from external_sort import ExternalSorter
+from formatters.collation import collation_key
+from formatters.styles.base import FormattedEntry
+from pipeline import GenerateOptions, generate
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestExternalSorter:
+    """
+    Тестирование внешней сортировки оформленных источников.
+    """
+
+    def test_sort(self, tmp_path: Path) -> None:
+        """
+        Тестирование слияния отсортированных фрагментов из временных файлов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        rows = ["Петров", "Smith", "ёлкин", "Абрамов\nстрока", "Ежов", "adams", "Ёлкин"]
+        sorter = ExternalSorter(run_size=2, directory=str(tmp_path))
+
+        assert list(sorter.sort(FormattedEntry.from_formatted(row) for row in rows)) == sorted(rows, key=collation_key)
+        assert sorter.count == len(rows)
+        # временные файлы удаляются после слияния
+        assert not list(tmp_path.iterdir())
+
+    def test_sort_in_memory(self, tmp_path: Path) -> None:
+        """
+        Тестирование сортировки без временных файлов, если источники помещаются в один фрагмент.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        rows = ["Петров", "Smith", "Абрамов"]
+        sorter = ExternalSorter(run_size=len(rows) + 1, directory=str(tmp_path))
+
+        assert list(sorter.sort(FormattedEntry.from_formatted(row) for row in rows)) == ["Абрамов", "Петров", "Smith"]
+        assert sorter.count == len(rows)
+
+    def test_streaming_generate(self, tmp_path: Path) -> None:
+        """
+        Тестирование совпадения результатов потоковой и обычной генерации.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path, streaming_path = tmp_path / "output.docx", tmp_path / "streaming.docx"
+
+        count = generate(TEMPLATE_FILE_PATH, path)
+        assert generate(TEMPLATE_FILE_PATH, streaming_path, GenerateOptions(streaming=True)) == count
+
+        expected = [paragraph.text for paragraph in Document(str(path)).paragraphs]
+        assert [paragraph.text for paragraph in Document(str(streaming_path)).paragraphs] == expected
@@ -0,0 +1,125 @@
+"""
+Тестирование инкрементальной генерации.
+"""
+import shutil
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from docx import Document
+from pydantic import ValidationError
+
+from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
+from formatters.styles.base import CompiledTemplate
+from formatters.styles.gost import GOSTBook, GOSTCitationFormatter
+from incremental import Manifest, update_entries
+from main import process_input
+from pipeline import GenerateOptions, generate
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestIncremental:
+    """
+    Тестирование инкрементальной генерации.
+    """
+
+    def test_update_entries(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование обновления оформленных источников предыдущего запуска.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        """
+
+        models = [book_model_fixture, internet_resource_model_fixture, articles_collection_model_fixture]
+        expected = [str(item) for item in GOSTCitationFormatter(models).format()]
+
+        entries, changed = update_entries(models, [])
+        assert changed
+        assert [formatted for _, formatted in entries] == expected
+
+        # без изменений источников результат не меняется
+        assert update_entries(reversed(models), entries) == (entries, False)
+
+        # измененный источник заменяет предыдущую версию с сохранением сортировки
+        edited = book_model_fixture.copy(update={"title": "Аналитика"})
+        models = [edited, internet_resource_model_fixture, articles_collection_model_fixture]
+        updated, changed = update_entries(models, entries)
+        assert changed
+        assert [formatted for _, formatted in updated] == [str(item) for item in GOSTCitationFormatter(models).format()]
+
+        # удаление источника также считается изменением
+        removed, changed = update_entries(models[1:], updated)
+        assert changed
+        assert len(removed) == 2
+
+    def test_generate(self, tmp_path: Path) -> None:
+        """
+        Тестирование повторной инкрементальной генерации выходного файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path_input, path_output = tmp_path / "input.xlsx", tmp_path / "output.docx"
+        shutil.copy(TEMPLATE_FILE_PATH, path_input)
+
+        assert generate(str(path_input), path_output, GenerateOptions(incremental=True)) == 8
+        manifest = Manifest(path_output, "GOST")
+        assert len(manifest.load()) == 8
+        modified = path_output.stat().st_mtime_ns
+
+        # повторный запуск без изменений не перезаписывает выходной файл
+        assert generate(str(path_input), path_output, GenerateOptions(incremental=True)) == 8
+        assert path_output.stat().st_mtime_ns == modified
+
+        # выходной файл, перезаписанный обычной генерацией, создается заново
+        generate(str(path_input), path_output, GenerateOptions(citation="APA"))
+        overwritten = path_output.read_bytes()
+        assert generate(str(path_input), path_output, GenerateOptions(incremental=True)) == 8
+        assert path_output.read_bytes() != overwritten
+        assert manifest.load() and manifest.is_output_current()
+
+        # манифест другого стиля цитирования не используется
+        assert not Manifest(path_output, "APA").load()
+
+    def test_template(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование повторного форматирования всех источников после изменения шаблона стиля.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param MonkeyPatch monkeypatch: Фикстура для временной замены атрибутов
+        """
+
+        path_input, path_output = tmp_path / "input.xlsx", tmp_path / "output.docx"
+        shutil.copy(TEMPLATE_FILE_PATH, path_input)
+        assert generate(str(path_input), path_output, GenerateOptions(incremental=True)) == 8
+
+        monkeypatch.setattr(GOSTBook, "template", CompiledTemplate("NEW $authors $title"))
+        # манифест с прежними шаблонами не используется
+        assert not Manifest(path_output, "GOST").load()
+
+        assert generate(str(path_input), path_output, GenerateOptions(incremental=True)) == 8
+        paragraphs = [paragraph.text for paragraph in Document(str(path_output)).paragraphs]
+        assert any(text.startswith("NEW ") for text in paragraphs)
+
+    def test_pipelined(self, tmp_path: Path) -> None:
+        """
+        Тестирование отказа от конвейерной обработки при инкрементальной генерации.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        with pytest.raises(ValidationError, match="--incremental"):
+            GenerateOptions(incremental=True, pipelined=True)
+
+        path_output = tmp_path / "output.docx"
+        result = CliRunner().invoke(process_input, ["--incremental", "--pipelined", "--path_output", str(path_output)])
+        assert result.exit_code == 2
+        assert "--pipelined" in result.output
+        assert not path_output.exists()
@@ -0,0 +1,122 @@
+"""
+Тестирование функций логирования.
+"""
+import logging
+import multiprocessing
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock
+
+from logger import ProgressLogger, get_level, get_logger
+from settings import LOGGING_FILE, LOGGING_PATH
+
+
+def log_in_child(marker: str) -> None:
+    """
+    Запись в лог в дочернем процессе.
+
+    :param str marker: Метка записей теста
+    """
+
+    logger = get_logger("tests.fork")
+    for number in range(100):
+        logger.info("%s child %s", marker, number)
+
+
+class TestLogger:
+    """
+    Тестирование настройки логгеров.
+    """
+
+    def test_get_logger(self) -> None:
+        """
+        Тестирование повторной настройки логгера модуля.
+        """
+
+        logger = get_logger("tests.logger")
+        handlers = list(logger.handlers)
+
+        # повторный вызов не добавляет обработчики
+        assert get_logger("tests.logger") is logger
+        assert logger.handlers == handlers
+        # обработчики общие для всех логгеров
+        assert get_logger("tests.other").handlers == handlers
+
+        # уровень логирования можно изменить при повторном вызове
+        assert get_logger("tests.logger", "ERROR").level == logging.ERROR
+
+    def test_get_level(self) -> None:
+        """
+        Тестирование определения уровня логирования модуля.
+        """
+
+        levels = "readers=DEBUG, readers.reader=error,formatters.styles=WARNING, invalid"
+
+        assert get_level("readers.base", levels, "INFO") == "DEBUG"
+        assert get_level("readers.reader", levels, "INFO") == "ERROR"
+        assert get_level("formatters.styles.gost", levels, "INFO") == "WARNING"
+        assert get_level("formatters.base", levels, "INFO") == "INFO"
+        assert get_level("main", "", "INFO") == "INFO"
+
+    def test_fork(self) -> None:
+        """
+        Тестирование записи логов процессами, созданными через `fork`:
+        записи родительского процесса не повторяются, последние записи дочерних процессов не теряются.
+        """
+
+        marker = uuid.uuid4().hex
+        logger = get_logger("tests.fork")
+        # логирование при тестировании отключено (см. `tests/__init__.py`)
+        logging.disable(logging.NOTSET)
+        try:
+            for number in range(1000):
+                logger.info("%s parent %s", marker, number)
+
+            context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=3, mp_context=context) as executor:
+                list(executor.map(log_in_child, [marker] * 6))
+        finally:
+            logging.disable()
+
+        path = Path(LOGGING_PATH) / LOGGING_FILE
+        deadline = time.monotonic() + 5
+        while True:
+            lines = [line for line in path.read_text(encoding="utf-8").splitlines() if marker in line]
+            if len(lines) >= 1600 or time.monotonic() > deadline:
+                break
+            time.sleep(0.05)
+
+        assert sorted(line.split(marker)[1] for line in lines if "parent" in line) == sorted(
+            f" parent {number}" for number in range(1000)
+        )
+        assert sum(1 for line in lines if "child" in line) == 600
+
+
+class TestProgressLogger:
+    """
+    Тестирование пакетного вывода прогресса обработки.
+    """
+
+    def test_progress(self) -> None:
+        """
+        Тестирование количества записей о прогрессе.
+        """
+
+        logger = Mock()
+        progress = ProgressLogger(logger, "Обработка", step=10)
+
+        for _ in range(25):
+            progress.advance()
+        # одна запись на каждые 10 элементов
+        assert logger.info.call_count == 2
+
+        progress.advance(20)
+        # при пакетном учете выводится одна запись
+        assert logger.info.call_count == 3
+        assert progress.count == 45
+
+        progress.finish()
+        assert logger.info.call_count == 4
+        assert logger.info.call_args.args[2:4] == ("завершено,", 45)
@@ -0,0 +1,74 @@
+"""
+Тестирование запуска приложения.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from main import process_input
+
+# модули, которые не должны загружаться при импорте приложения
+HEAVY_MODULES = ("openpyxl", "docx", "lxml", "pydantic")
+
+
+class TestStartup:
+    """
+    Тестирование времени запуска приложения.
+    """
+
+    @staticmethod
+    def import_modules(module: str) -> dict[str, int]:
+        """
+        Получение загружаемых при импорте модулей с накопленным временем импорта (`-X importtime`).
+
+        :param str module: Наименование импортируемого модуля
+        :return: Время импорта в микросекундах по наименованиям модулей
+        """
+
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        modules = {}
+        for line in result.stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, cumulative, name = line.split("|")
+                if cumulative.strip().isdigit():
+                    modules[name.strip()] = int(cumulative)
+
+        return modules
+
+    @pytest.mark.parametrize("module", ["main", "readers.reader", "renderer"])
+    def test_import_time(self, module: str) -> None:
+        """
+        Тестирование отложенной загрузки тяжелых зависимостей.
+
+        :param str module: Наименование импортируемого модуля
+        """
+
+        modules = self.import_modules(module)
+        assert module in modules
+
+        loaded = {name.split(".")[0] for name in modules}
+        if module == "main":
+            assert not loaded.intersection(HEAVY_MODULES)
+        else:
+            assert not loaded.intersection(("openpyxl", "docx", "lxml"))
+
+    def test_help(self) -> None:
+        """
+        Тестирование вывода справки консольной команды.
+        """
+
+        result = CliRunner().invoke(process_input, ["--help"])
+
+        assert result.exit_code == 0
+        assert "--path_input" in result.output
+        assert "--no-cache" in result.output
@@ -0,0 +1,126 @@
+"""
+Тестирование конвейерной обработки.
+"""
+import multiprocessing
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from docx import Document
+from pydantic import BaseModel
+
+from formatters.models import BookModel
+from formatters.styles.gost import GOSTCitationFormatter
+from pipeline import GenerateOptions, generate
+from pipelined import PipelinedExecutor
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestPipelinedExecutor:
+    """
+    Тестирование конвейерного форматирования.
+    """
+
+    @staticmethod
+    def iter_books(book: BookModel, count: int, produced: list[int]) -> Iterator[BaseModel]:
+        """
+        Генерация моделей книг с учетом количества прочитанных моделей.
+
+        :param BookModel book: Модель книги
+        :param int count: Количество моделей
+        :param list produced: Счетчик прочитанных моделей
+        :return: Генератор моделей
+        """
+
+        for index in range(count):
+            produced[0] += 1
+            yield book.copy(update={"title": f"Наука {index}"})
+
+    def test_iter_formatted(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование совпадения результатов с обычным форматированием.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        models = list(self.iter_books(book_model_fixture, 25, [0]))
+        expected = sorted((item.sort_key, str(item)) for item in GOSTCitationFormatter(models).formatted_items)
+
+        for format_workers in (1, 2):
+            executor = PipelinedExecutor(GOSTCitationFormatter, format_workers=format_workers, batch_size=4)
+            entries = list(executor.iter_formatted(iter(models)))
+
+            assert sorted((item.sort_key, str(item)) for item in entries) == expected
+            assert executor.count == len(models)
+
+    def test_backpressure(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование приостановки чтения при заполнении очереди.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        produced = [0]
+        executor = PipelinedExecutor(GOSTCitationFormatter, format_workers=1, batch_size=2, queue_size=1)
+        entries = executor.iter_formatted(self.iter_books(book_model_fixture, 1000, produced))
+
+        next(entries)
+        time.sleep(0.3)
+        # прочитаны только пакет в обработке, пакет в очереди и пакет, ожидающий места в очереди
+        assert produced[0] <= 3 * 2 + 1
+
+        entries.close()
+        assert executor.stopped.is_set()
+        assert produced[0] < 1000
+
+    def test_read_error(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование передачи ошибки чтения.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        def iter_models() -> Iterator[BaseModel]:
+            yield book_model_fixture
+            raise ValueError("Ошибка в строке 3")
+
+        executor = PipelinedExecutor(GOSTCitationFormatter, format_workers=1, batch_size=1)
+        with pytest.raises(ValueError, match="строке 3"):
+            list(executor.iter_formatted(iter_models()))
+
+    def test_workers_started(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование запуска процессов форматирования до начала чтения в отдельном потоке.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        children: list[int] = []
+
+        def iter_models() -> Iterator[BaseModel]:
+            children.append(len(multiprocessing.active_children()))
+            yield book_model_fixture
+
+        executor = PipelinedExecutor(GOSTCitationFormatter, format_workers=2, batch_size=1)
+        assert len(list(executor.iter_formatted(iter_models()))) == 1
+        assert children[0] >= 2
+
+    @pytest.mark.parametrize("workers, format_workers", [(1, 1), (2, 2)])
+    def test_generate(self, tmp_path: Path, workers: int, format_workers: int) -> None:
+        """
+        Тестирование совпадения результатов конвейерной и обычной генерации.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param int workers: Количество процессов чтения
+        :param int format_workers: Количество процессов форматирования
+        """
+
+        path, pipelined_path = tmp_path / "output.docx", tmp_path / "pipelined.docx"
+
+        count = generate(TEMPLATE_FILE_PATH, path)
+        options = GenerateOptions(workers=workers, pipelined=True, format_workers=format_workers)
+        assert generate(TEMPLATE_FILE_PATH, pipelined_path, options) == count
+
+        expected = [paragraph.text for paragraph in Document(str(path)).paragraphs]
+        assert [paragraph.text for paragraph in Document(str(pipelined_path)).paragraphs] == expected
@@ -0,0 +1,125 @@
+"""
+Тестирование профилирования этапов обработки.
+"""
+import json
+import pstats
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from click.testing import CliRunner
+
+from main import process_input
+from pipeline import GenerateOptions, generate
+from profiler import Profiler, get_profiler, iterate, stage, wrap
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestProfiler:
+    """
+    Тестирование профилирования этапов обработки.
+    """
+
+    def test_nested_stages(self) -> None:
+        """
+        Тестирование исключения времени вложенных этапов из времени внешнего этапа.
+        """
+
+        def produce() -> Iterator[int]:
+            for number in range(3):
+                time.sleep(0.01)
+                yield number
+
+        with Profiler() as profiler:
+            assert get_profiler() is profiler
+            with stage("outer") as stats:
+                time.sleep(0.01)
+                stats.rows += sum(1 for _ in iterate("inner", produce()))
+
+        assert get_profiler() is None
+        outer, inner = profiler.stages["outer"], profiler.stages["inner"]
+        assert outer.rows == inner.rows == 3
+        assert inner.wall >= 0.03
+        assert 0.01 <= outer.wall < inner.wall
+        assert outer.rss_growth is not None and inner.rss_growth is not None
+        assert profiler.wall >= outer.wall + inner.wall
+
+    def test_disabled(self) -> None:
+        """
+        Тестирование отсутствия измерений без включенного профилирования.
+        """
+
+        function = len
+        assert wrap("stage", function) is function
+        assert list(iterate("stage", [1, 2])) == [1, 2]
+        with stage("stage") as stats:
+            stats.rows += 1
+
+    def test_nested_profilers(self) -> None:
+        """
+        Тестирование запрета одновременного включения нескольких профилировщиков.
+        """
+
+        with Profiler():
+            with pytest.raises(RuntimeError):
+                with Profiler():
+                    pass
+
+        assert get_profiler() is None
+
+    def test_generate(self, tmp_path: Path) -> None:
+        """
+        Тестирование показателей этапов генерации, профилей cProfile и отслеживания памяти.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        with Profiler(cprofile_dir=tmp_path / "profiles", trace_memory=True) as profiler:
+            count = generate(TEMPLATE_FILE_PATH, tmp_path / "output.docx")
+
+        stages = profiler.stages
+        assert list(stages) == ["load_workbook", "read", "validate", "format", "sort", "render"]
+        assert stages["validate"].rows == stages["read"].rows == stages["render"].rows == count
+        assert stages["format"].peak_traced
+
+        stats = pstats.Stats(str(tmp_path / "profiles" / "render.prof"))
+        assert stats.total_calls  # type: ignore
+
+        table = profiler.format_table()
+        assert all(name in table for name in stages)
+        # прирост памяти по этапам, пиковый объем памяти – только для процесса в целом
+        assert "+RSS" in table and "Пиковый объем резидентной памяти процесса" in table
+
+    def test_streaming_generate(self, tmp_path: Path) -> None:
+        """
+        Тестирование показателей этапов потоковой генерации.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        with Profiler() as profiler:
+            count = generate(TEMPLATE_FILE_PATH, tmp_path / "output.docx", GenerateOptions(streaming=True))
+
+        stages = profiler.stages
+        assert {"load_workbook", "read", "validate", "format", "sort", "render"} <= set(stages)
+        assert stages["read"].rows == stages["format"].rows == stages["sort"].rows == count
+
+    def test_command(self, tmp_path: Path) -> None:
+        """
+        Тестирование вывода таблицы и сохранения показателей этапов при запуске команды.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "profile.json"
+        result = CliRunner().invoke(
+            process_input,
+            ["-pi", TEMPLATE_FILE_PATH, "-po", str(tmp_path / "output.docx"), "--profile-output", str(path)],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "render" in result.output
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert [item["name"] for item in data["stages"]][-1] == "render"
+        assert data["wall"] > 0
@@ -1,11 +1,13 @@
 """
 Тестирование функций генерации выходного файла.
 """
+import zipfile
 from pathlib import Path
 
 import pytest
+from docx import Document
 
-from renderer import Renderer
+from renderer import Renderer, StreamingRenderer
 
 
 class TestRenderer:
@@ -41,3 +43,29 @@ class TestRenderer:
         assert len(list(tmp_path.iterdir())) == 1
         # проверка размера файла в байтах на диске
         assert path.stat().st_size == 36773
+
+    def test_streaming_render(self, tmp_path: Path, formatted_models: tuple[str, ...]) -> None:
+        """
+        Тестирование потоковой генерации выходного файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param tuple[str, ...] formatted_models: Список строк для сохранения в файле
+        """
+
+        rows = formatted_models + ("  Строка\tс табуляцией\nи переносом <&> ", "", "Строка\x0bс\x00символами")
+        path, streaming_path = tmp_path / "output.docx", tmp_path / "streaming.docx"
+        renderer, streaming_renderer = Renderer(rows), StreamingRenderer(iter(rows))
+        renderer.render(path)
+        streaming_renderer.render(streaming_path)
+        # недопустимые в XML символы удаляются одинаково
+        assert renderer.cleaned == streaming_renderer.cleaned == 1
+
+        # содержимое всех частей пакета Word совпадает с обычной генерацией
+        with zipfile.ZipFile(path) as expected, zipfile.ZipFile(streaming_path) as actual:
+            assert actual.namelist() == expected.namelist()
+            for name in expected.namelist():
+                assert actual.read(name) == expected.read(name)
+
+        assert [paragraph.text for paragraph in Document(str(streaming_path)).paragraphs][1:] == list(rows[:-1]) + [
+            "Строкассимволами"
+        ]
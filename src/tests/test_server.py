@@ -0,0 +1,116 @@
+"""
+Тестирование HTTP-сервиса форматирования библиографических списков.
+"""
+import asyncio
+import json
+import zipfile
+from io import BytesIO
+from pathlib import Path
+from typing import Optional
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from formatters.styles.mla import MLACitationFormatter
+from readers.reader import SourcesReader
+from server import DOCX_TYPE, JSON_TYPE, FormattingService
+from settings import TEMPLATE_FILE_PATH
+
+
+async def request(url: str, body: Optional[bytes] = None, content_type: str = JSON_TYPE) -> tuple[int, str, bytes]:
+    """
+    Отправка запроса к сервису без блокировки цикла событий.
+
+    :param url: Адрес запроса.
+    :param body: Тело запроса (`None` – запрос `GET`).
+    :param content_type: Тип содержимого запроса.
+    :return: Код состояния, тип содержимого и тело ответа.
+    """
+
+    def send() -> tuple[int, str, bytes]:
+        try:
+            with urlopen(Request(url, data=body, headers={"Content-Type": content_type}), timeout=30) as response:
+                return response.status, response.headers["Content-Type"], response.read()
+        except HTTPError as ex:
+            return ex.code, ex.headers["Content-Type"], ex.read()
+
+    return await asyncio.to_thread(send)
+
+
+class TestFormattingService:
+    """
+    Тестирование HTTP-сервиса форматирования библиографических списков.
+    """
+
+    def test_service(self) -> None:
+        """
+        Тестирование методов сервиса на локальном адресе.
+        """
+
+        workbook = Path(TEMPLATE_FILE_PATH).read_bytes()
+        expected = [str(item) for item in MLACitationFormatter(SourcesReader(TEMPLATE_FILE_PATH).read()).format()]
+        sources = [
+            {
+                "type": "Интернет-ресурс",
+                "article": "Наука как искусство",
+                "website": "Ведомости",
+                "link": "https://www.vedomosti.ru",
+                "access_date": "01.01.2021",
+            }
+        ]
+
+        async def scenario() -> None:
+            service = FormattingService(port=0, workers=1, queue_size=1)
+            await service.start()
+            base = f"http://{service.host}:{service.port}"
+            try:
+                status, _, body = await request(f"{base}/health")
+                assert status == 200 and json.loads(body)["status"] == "ok"
+
+                # рабочая книга Excel в стиле MLA
+                status, _, body = await request(f"{base}/format?citation=mla", workbook, "application/octet-stream")
+                assert status == 200
+                assert json.loads(body)["entries"] == expected
+
+                # записи JSON в стиле ГОСТ, несколько запросов одновременно
+                responses = await asyncio.gather(
+                    *(request(f"{base}/format", json.dumps({"sources": sources}).encode()) for _ in range(2))
+                )
+                assert [json.loads(body)["entries"] for _, _, body in responses] == [
+                    ["Наука как искусство // Ведомости URL: https://www.vedomosti.ru (дата обращения: 01.01.2021)."]
+                ] * 2
+
+                # файл Word
+                status, content_type, body = await request(f"{base}/render", json.dumps(sources).encode())
+                assert status == 200 and content_type == DOCX_TYPE
+                with zipfile.ZipFile(BytesIO(body)) as archive:
+                    assert "word/document.xml" in archive.namelist()
+
+                # ошибки запроса
+                status, _, body = await request(f"{base}/format", json.dumps([{"type": "Диссертация"}]).encode())
+                assert status == 400 and "Диссертация" in json.loads(body)["error"]
+                assert (await request(f"{base}/format", b"not a workbook", "application/octet-stream"))[0] == 400
+                assert (await request(f"{base}/unknown"))[0] == 404
+                assert (await request(f"{base}/format"))[0] == 405
+
+                # тело запроса больше допустимого размера не читается
+                service.max_body = 1
+                assert (await request(f"{base}/format", json.dumps(sources).encode()))[0] == 413
+                service.max_body = FormattingService.max_body
+
+                # при заполненной очереди запросы отклоняются
+                service.pending = service.capacity
+                assert (await request(f"{base}/format", json.dumps(sources).encode()))[0] == 503
+                service.pending = 0
+
+                # незавершенные строка запроса и заголовки не удерживают соединение
+                service.head_timeout = 0.2
+                reader, writer = await asyncio.open_connection(service.host, service.port)
+                writer.write(b"POST /format HTTP/1.1\r\n")
+                await writer.drain()
+                assert (await asyncio.wait_for(reader.read(), 5)).startswith(b"HTTP/1.1 408")
+                writer.close()
+                service.head_timeout = FormattingService.head_timeout
+            finally:
+                await service.stop()
+
+        asyncio.run(scenario())